@@ -0,0 +1,678 @@
+import asyncio
+import logging
+from collections import deque
+from itertools import islice
+
+import aiohttp
+
+from .async_core import AsyncCore, AsyncResponse
+from .client import APIException, _handle_response_status
+from .codec import get_codec
+from .core import CoreException
+
+# Share the py_jama_rest_client logger with the synchronous client.
+py_jama_rest_client_logger = logging.getLogger('py_jama_rest_client')
+
+
+class AsyncJamaClient:
+    """An asyncio version of JamaClient.  Every JamaClient method is available here as a coroutine with the same
+    arguments and return values, and the iter_ methods return async generators.  Errors are reported with the same
+    exceptions as JamaClient.
+
+    Use the client as an async context manager, or await close() when finished with it:
+
+        async with AsyncJamaClient(host_domain, credentials) as client:
+            items = await client.get_items(project_id)
+    """
+
+    __allowed_results_per_page = 20  # Default is 20, Max is 50. if set to greater than 50, only 50 will items return.
+
+    def __init__(self, host_domain,
+                 credentials=('username|clientID', 'password|clientSecret'),
+                 api_version='/rest/v1/',
+                 oauth=False,
+                 verify=True,
+                 allowed_results_per_page=20,
+                 max_concurrency=1,
+                 connection_limit=100,
+                 codec='auto'):
+        """Async Jama Client initializer
+        :rtype: AsyncJamaClient
+        :param host_domain: String The domain associated with the Jama Connect host
+        :param credentials: the user name and password as a tuple or client id and client secret if using Oauth.
+        :param api_version: valid args are '/rest/[v1|latest|labs]/'
+        :param verify: Defaults to True, Setting this to False will skip SSL Certificate verification
+        :param max_concurrency: Defaults to 1, the maximum number of pages fetched in parallel once the total number
+        of results for a paged resource is known.
+        :param connection_limit: Defaults to 100, the maximum number of simultaneous connections to the host.
+        :param codec: JSON codec for request and response bodies, see JamaClient."""
+        if max_concurrency < 1:
+            raise ValueError("Max concurrency must be at least 1")
+
+        self.__credentials = credentials
+        self.__allowed_results_per_page = allowed_results_per_page
+        self.__max_concurrency = max_concurrency
+        self.__codec = get_codec(codec)
+        self.__core = AsyncCore(host_domain, credentials, api_version=api_version, oauth=oauth, verify=verify,
+                                connection_limit=connection_limit)
+
+        # Log client creation
+        py_jama_rest_client_logger.info('Created a new AsyncJamaClient instance. Domain: {} '
+                                        'Connecting via Oauth: {}'.format(host_domain, oauth))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """Closes the connections held by this client."""
+        await self.__core.close()
+
+    async def get_available_endpoints(self):
+        """Returns a list of all the available endpoints."""
+        return await self.__get_data('')
+
+    async def get_baselines(self, project_id, allowed_results_per_page=__allowed_results_per_page):
+        """Returns a list of Baseline objects for the specified project."""
+        params = {'project': project_id}
+        return await self.__get_all('baselines', params=params, allowed_results_per_page=allowed_results_per_page)
+
+    async def get_baseline(self, baseline_id):
+        """Returns a dictionary object representing the baseline."""
+        return await self.__get_data('baselines/' + str(baseline_id))
+
+    async def get_baselines_versioneditems(self, baseline_id, allowed_results_per_page=__allowed_results_per_page):
+        """Returns a list of versioned items belonging to the baseline."""
+        resource_path = 'baselines/' + str(baseline_id) + '/versioneditems'
+        return await self.__get_all(resource_path, allowed_results_per_page=allowed_results_per_page)
+
+    def iter_baselines_versioneditems(self, baseline_id, allowed_results_per_page=__allowed_results_per_page):
+        """Async generator of the versioned items belonging to the baseline."""
+        resource_path = 'baselines/' + str(baseline_id) + '/versioneditems'
+        return self.__iter_all(resource_path, allowed_results_per_page=allowed_results_per_page)
+
+    async def get_projects(self, allowed_results_per_page=__allowed_results_per_page):
+        """Returns a list of all projects."""
+        return await self.__get_all('projects', allowed_results_per_page=allowed_results_per_page)
+
+    def iter_projects(self, allowed_results_per_page=__allowed_results_per_page):
+        """Async generator of all projects."""
+        return self.__iter_all('projects', allowed_results_per_page=allowed_results_per_page)
+
+    async def get_filter_results(self, filter_id, project_id=None, allowed_results_per_page=__allowed_results_per_page):
+        """Returns a list of items that match the filter."""
+        resource_path = 'filters/' + str(filter_id) + '/results'
+        params = None if project_id is None else {'project': str(project_id)}
+        return await self.__get_all(resource_path, params=params, allowed_results_per_page=allowed_results_per_page)
+
+    def iter_filter_results(self, filter_id, project_id=None, allowed_results_per_page=__allowed_results_per_page):
+        """Async generator of the items that match the filter."""
+        resource_path = 'filters/' + str(filter_id) + '/results'
+        params = None if project_id is None else {'project': str(project_id)}
+        return self.__iter_all(resource_path, params=params, allowed_results_per_page=allowed_results_per_page)
+
+    async def get_items(self, project_id, allowed_results_per_page=__allowed_results_per_page):
+        """Returns a list of all items in the specified project."""
+        params = {'project': project_id}
+        return await self.__get_all('items', params=params, allowed_results_per_page=allowed_results_per_page)
+
+    def iter_items(self, project_id, allowed_results_per_page=__allowed_results_per_page):
+        """Async generator of all items in the specified project."""
+        params = {'project': project_id}
+        return self.__iter_all('items', params=params, allowed_results_per_page=allowed_results_per_page)
+
+    async def get_item(self, item_id):
+        """Returns a dictionary object representing the item."""
+        return await self.__get_data('items/' + str(item_id))
+
+    async def get_item_lock(self, item_id):
+        """Returns the lock information for the item with the specified ID."""
+        return await self.__get_data('items/' + str(item_id) + '/lock')
+
+    async def put_item_lock(self, item_id, locked):
+        """Updates the locked state of the item with the specified ID, returns the response status."""
+        body = {"locked": locked}
+        response = await self.__send_json('put', 'items/' + str(item_id) + '/lock', body)
+        return response.status_code
+
+    async def get_item_tags(self, item_id, allowed_results_per_page=__allowed_results_per_page):
+        """Returns all tags for the item with the specified ID."""
+        resource_path = 'items/' + str(item_id) + '/tags'
+        return await self.__get_all(resource_path, allowed_results_per_page=allowed_results_per_page)
+
+    async def get_attachment(self, attachment_id):
+        """Returns a dictionary object representing the attachment."""
+        return await self.__get_data('attachments/' + str(attachment_id))
+
+    async def get_abstract_items_from_doc_key(self, doc_key_list, allowed_results_per_page=__allowed_results_per_page):
+        """ DEPRECATED INSTEAD USE get_abstract_items.
+        Returns the abstract items associated with the document keys."""
+        params = {'documentKey': doc_key_list}
+        return await self.__get_all('abstractitems', params=params, allowed_results_per_page=allowed_results_per_page)
+
+    async def get_relationship_rule_sets(self):
+        """Returns all relationship rule sets across all projects."""
+        return await self.__get_all('relationshiprulesets/')
+
+    async def get_relationship_rule_set(self, id):
+        """Returns the relationship rule set with the specified ID."""
+        return await self.__get_data('relationshiprulesets/' + str(id))
+
+    async def get_relationship_rule_set_projects(self, id):
+        """Returns the projects that have the specified relationship rule set defined."""
+        return await self.__get_all('relationshiprulesets/' + str(id) + '/projects')
+
+    async def get_relationship_types(self, allowed_results_per_page=__allowed_results_per_page):
+        """Returns all relationship types."""
+        return await self.__get_all('relationshiptypes/', allowed_results_per_page=allowed_results_per_page)
+
+    async def get_relationship_type(self, relationship_type_id):
+        """Returns the relationship type with the specified ID."""
+        return await self.__get_data('relationshiptypes/' + str(relationship_type_id))
+
+    async def get_item_types(self, allowed_results_per_page=__allowed_results_per_page):
+        """Returns all item types."""
+        return await self.__get_all('itemtypes/', allowed_results_per_page=allowed_results_per_page)
+
+    async def get_item_type(self, item_type_id):
+        """Returns the item type with the specified ID."""
+        return await self.__get_data('itemtypes/' + str(item_type_id))
+
+    async def get_items_synceditems(self, item_id, allowed_results_per_page=__allowed_results_per_page):
+        """Returns all items in the same synchronization group as the specified item."""
+        resource_path = 'items/' + str(item_id) + '/synceditems'
+        return await self.__get_all(resource_path, allowed_results_per_page=allowed_results_per_page)
+
+    async def get_items_synceditems_status(self, item_id, synced_item_id):
+        """Returns the sync status for the synced item with the specified ID."""
+        resource_path = 'items/' + str(item_id) + '/synceditems/' + str(synced_item_id) + '/syncstatus'
+        return await self.__get_data(resource_path)
+
+    async def get_item_versions(self, item_id, allowed_results_per_page=__allowed_results_per_page):
+        """Returns all versions for the item with the specified ID."""
+        resource_path = 'items/' + str(item_id) + '/versions'
+        return await self.__get_all(resource_path, allowed_results_per_page=allowed_results_per_page)
+
+    async def get_item_version(self, item_id, version_num):
+        """Returns the numbered version for the item with the specified ID."""
+        return await self.__get_data('items/' + str(item_id) + '/versions/' + str(version_num))
+
+    async def get_versioned_item(self, item_id, version_num):
+        """Returns the snapshot of the item at the specified version."""
+        resource_path = 'items/' + str(item_id) + '/versions/' + str(version_num) + '/versioneditem'
+        return await self.__get_data(resource_path)
+
+    async def get_pick_lists(self, allowed_results_per_page=__allowed_results_per_page):
+        """Returns all pick lists."""
+        return await self.__get_all('picklists/', allowed_results_per_page=allowed_results_per_page)
+
+    async def get_pick_list(self, pick_list_id):
+        """Returns the pick list with the specified ID."""
+        return await self.__get_data('picklists/' + str(pick_list_id))
+
+    async def get_pick_list_options(self, pick_list_id, allowed_results_per_page=__allowed_results_per_page):
+        """Returns all options of the pick list with the specified ID."""
+        resource_path = 'picklists/' + str(pick_list_id) + '/options'
+        return await self.__get_all(resource_path, allowed_results_per_page=allowed_results_per_page)
+
+    async def get_pick_list_option(self, pick_list_option_id):
+        """Returns the pick list option with the specified ID."""
+        return await self.__get_data('picklistoptions/' + str(pick_list_option_id))
+
+    async def get_relationships(self, project_id, allowed_results_per_page=__allowed_results_per_page):
+        """Returns a list of all relationships of the specified project."""
+        params = {'project': project_id}
+        return await self.__get_all('relationships', params=params, allowed_results_per_page=allowed_results_per_page)
+
+    def iter_relationships(self, project_id, allowed_results_per_page=__allowed_results_per_page):
+        """Async generator of all relationships of the specified project."""
+        params = {'project': project_id}
+        return self.__iter_all('relationships', params=params, allowed_results_per_page=allowed_results_per_page)
+
+    async def get_relationship(self, relationship_id):
+        """Returns the relationship with the specified ID."""
+        return await self.__get_data('relationships/' + str(relationship_id))
+
+    async def get_abstract_items(self, project=None, item_type=None, document_key=None, release=None,
+                                 created_date=None, modified_date=None, last_activity_date=None, contains=None,
+                                 sort_by=None):
+        """Returns all items that match the query parameters entered, see JamaClient.get_abstract_items."""
+        params = AsyncJamaClient.__abstract_items_params(project, item_type, document_key, release, created_date,
+                                                         modified_date, last_activity_date, contains, sort_by)
+        return await self.__get_all('abstractitems', params=params)
+
+    def iter_abstract_items(self, project=None, item_type=None, document_key=None, release=None, created_date=None,
+                            modified_date=None, last_activity_date=None, contains=None, sort_by=None):
+        """Async generator of all items that match the query parameters entered."""
+        params = AsyncJamaClient.__abstract_items_params(project, item_type, document_key, release, created_date,
+                                                         modified_date, last_activity_date, contains, sort_by)
+        return self.__iter_all('abstractitems', params=params)
+
+    async def get_abstract_item(self, item_id):
+        """Returns the item, test plan, test cycle, test run, or attachment with the specified ID."""
+        return await self.__get_data('abstractitems/' + str(item_id))
+
+    async def get_abstract_item_versions(self, item_id):
+        """Returns all versions for the abstract item with the specified ID."""
+        return await self.__get_all('abstractitems/' + str(item_id) + '/versions')
+
+    async def get_abtract_item_version(self, item_id, version_num):
+        """Returns the numbered version for the abstract item with the specified ID."""
+        return await self.__get_data('abstractitems/' + str(item_id) + '/versions/' + str(version_num))
+
+    async def get_abstract_versioned_item(self, item_id, version_num):
+        """Returns the snapshot of the abstract item at the specified version."""
+        resource_path = 'abstractitems/' + str(item_id) + '/versions/' + str(version_num) + '/versioneditem'
+        return await self.__get_data(resource_path)
+
+    async def get_item_children(self, item_id, allowed_results_per_page=__allowed_results_per_page):
+        """Returns a list of the child items of the specified item."""
+        resource_path = 'items/' + str(item_id) + '/children'
+        return await self.__get_all(resource_path, allowed_results_per_page=allowed_results_per_page)
+
+    def iter_item_children(self, item_id, allowed_results_per_page=__allowed_results_per_page):
+        """Async generator of the child items of the specified item."""
+        resource_path = 'items/' + str(item_id) + '/children'
+        return self.__iter_all(resource_path, allowed_results_per_page=allowed_results_per_page)
+
+    async def get_testruns(self, test_cycle_id, allowed_results_per_page=__allowed_results_per_page):
+        """Returns all test runs associated with the specified test cycle."""
+        resource_path = 'testcycles/' + str(test_cycle_id) + '/testruns'
+        return await self.__get_all(resource_path, allowed_results_per_page=allowed_results_per_page)
+
+    def iter_testruns(self, test_cycle_id, allowed_results_per_page=__allowed_results_per_page):
+        """Async generator of the test runs associated with the specified test cycle."""
+        resource_path = 'testcycles/' + str(test_cycle_id) + '/testruns'
+        return self.__iter_all(resource_path, allowed_results_per_page=allowed_results_per_page)
+
+    async def get_items_upstream_relationships(self, item_id, allowed_results_per_page=__allowed_results_per_page):
+        """Returns all the upstream relationships for the item with the specified ID."""
+        resource_path = 'items/' + str(item_id) + '/upstreamrelationships'
+        return await self.__get_all(resource_path, allowed_results_per_page=allowed_results_per_page)
+
+    async def get_items_downstream_related(self, item_id, allowed_results_per_page=__allowed_results_per_page):
+        """Returns all the downstream related items for the item with the specified ID."""
+        resource_path = 'items/' + str(item_id) + '/downstreamrelated'
+        return await self.__get_all(resource_path, allowed_results_per_page=allowed_results_per_page)
+
+    async def get_items_downstream_relationships(self, item_id, allowed_results_per_page=__allowed_results_per_page):
+        """Returns all the downstream relationships for the item with the specified ID."""
+        resource_path = 'items/' + str(item_id) + '/downstreamrelationships'
+        return await self.__get_all(resource_path, allowed_results_per_page=allowed_results_per_page)
+
+    async def get_items_upstream_related(self, item_id):
+        """Returns all the upstream related items for the item with the specified ID."""
+        return await self.__get_all('items/' + str(item_id) + '/upstreamrelated')
+
+    async def get_item_workflow_transitions(self, item_id):
+        """Returns all valid workflow transitions that can be made on the item with the specified ID."""
+        return await self.__get_all('items/' + str(item_id) + '/workflowtransitionoptions')
+
+    async def get_tags(self, project, allowed_results_per_page=__allowed_results_per_page):
+        """Returns all tags for the project with the specified ID."""
+        params = {'project': project}
+        return await self.__get_all('tags', params=params, allowed_results_per_page=allowed_results_per_page)
+
+    async def get_tagged_items(self, tag_id, allowed_results_per_page=__allowed_results_per_page):
+        """Returns all items tagged with the specified tag ID."""
+        resource_path = 'tags/' + str(tag_id) + '/items'
+        return await self.__get_all(resource_path, allowed_results_per_page=allowed_results_per_page)
+
+    def iter_tagged_items(self, tag_id, allowed_results_per_page=__allowed_results_per_page):
+        """Async generator of the items tagged with the specified tag ID."""
+        resource_path = 'tags/' + str(tag_id) + '/items'
+        return self.__iter_all(resource_path, allowed_results_per_page=allowed_results_per_page)
+
+    async def get_users(self, allowed_results_per_page=__allowed_results_per_page):
+        """Returns all active users visible to the current user."""
+        return await self.__get_all('users/', allowed_results_per_page=allowed_results_per_page)
+
+    async def get_user(self, user_id):
+        """Returns the user with the specified ID."""
+        return await self.__get_data('users/' + str(user_id))
+
+    async def get_current_user(self):
+        """Returns the current user."""
+        return await self.__get_data('users/current')
+
+    async def get_test_cycle(self, test_cycle_id):
+        """Returns the test cycle with the specified ID."""
+        return await self.__get_data('testcycles/' + str(test_cycle_id))
+
+    async def delete_item(self, item_id):
+        """Deletes the item with the specified ID, returns the success status code."""
+        response = await self.__request('delete', 'items/' + str(item_id))
+        return response.status_code
+
+    async def delete_relationships(self, relationship_id):
+        """Deletes the relationship with the specified ID, returns the success status code."""
+        response = await self.__request('delete', 'relationships/' + str(relationship_id))
+        return response.status_code
+
+    async def patch_item(self, item_id, patches):
+        """Applies the list of JSON patch operations to the item, returns the response status."""
+        headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+        response = await self.__send_json('patch', 'items/' + str(item_id), patches, headers=headers)
+        return self.__codec.decode(response)['meta']['status']
+
+    async def post_user(self, username, password, first_name, last_name, email, license_type, phone=None, title=None,
+                        location=None):
+        """Creates a new user, returns the ID of the newly created user."""
+        body = {
+            'username': username,
+            'password': password,
+            'firstName': first_name,
+            'lastName': last_name,
+            'email': email,
+            'phone': phone,
+            'title': title,
+            'location': location,
+            'licenseType': license_type
+        }
+        response = await self.__send_json('post', 'users/', body)
+        return self.__codec.decode(response)['meta']['id']
+
+    async def post_tag(self, name: str, project: int):
+        """Creates a new tag in the specified project, returns the ID of the newly created tag."""
+        body = {
+            'name': name,
+            'project': project
+        }
+        response = await self.__send_json('post', 'tags', body)
+        return self.__codec.decode(response)['meta']['id']
+
+    async def post_testplans_testcycles(self, testplan_id, testcycle_name, start_date, end_date,
+                                        testgroups_to_include=None, testrun_status_to_include=None):
+        """Creates a new test cycle from the test plan, returns the ID of the newly created test cycle."""
+        test_run_gen_config = {}
+        if testgroups_to_include is not None:
+            test_run_gen_config['testGroupsToInclude'] = testgroups_to_include
+        if testrun_status_to_include is not None:
+            test_run_gen_config['testRunStatusesToInclude'] = testrun_status_to_include
+        body = {
+            'fields': {
+                'name': testcycle_name,
+                'startDate': start_date,
+                'endDate': end_date
+            },
+            'testRunGenerationConfig': test_run_gen_config
+        }
+        response = await self.__send_json('post', 'testplans/' + str(testplan_id) + '/testcycles', body)
+        return self.__codec.decode(response)['meta']['id']
+
+    async def post_item(self, project, item_type_id, child_item_type_id, location, fields, global_id=None):
+        """Creates a new item, returns the ID of the newly created item."""
+        body = {
+            "project": project,
+            "itemType": item_type_id,
+            "childItemType": child_item_type_id,
+            "location": {
+                "parent": location
+            },
+            "fields": fields
+        }
+        params = {}
+
+        # we setting a global ID?
+        if global_id is not None:
+            body['globalId'] = global_id
+            params['setGlobalIdManually'] = True
+
+        response = await self.__send_json('post', 'items/', body, params=params)
+        return self.__codec.decode(response)['meta']['id']
+
+    async def post_item_tag(self, item_id, tag_id):
+        """Adds an existing tag to the item with the specified ID, returns the response status."""
+        body = {"tag": tag_id}
+        response = await self.__send_json('post', 'items/' + str(item_id) + '/tags', body)
+        return response.status_code
+
+    async def post_item_sync(self, source_item: int, pool_item: int):
+        """Adds the source item to the global ID pool of the pool item, returns the ID of the source item."""
+        body = {'item': source_item}
+        response = await self.__send_json('post', 'items/' + str(pool_item) + '/synceditems', body)
+        return self.__codec.decode(response)['meta']['id']
+
+    async def post_relationship(self, from_item: int, to_item: int, relationship_type=None):
+        """Creates a new relationship, returns the ID of the newly created relationship."""
+        body = {
+            "fromItem": from_item,
+            "toItem": to_item,
+        }
+        if relationship_type is not None:
+            body['relationshipType'] = relationship_type
+        response = await self.__send_json('post', 'relationships/', body)
+        return self.__codec.decode(response)['meta']['id']
+
+    async def put_relationship(self, relationship_id: int, from_item: int, to_item: int, relationship_type: int = None):
+        """Updates the relationship with the specified ID."""
+        body = {
+            "fromItem": from_item,
+            "toItem": to_item
+        }
+        if relationship_type is not None:
+            body['relationshipType'] = relationship_type
+        await self.__send_json('put', 'relationships/{}'.format(relationship_id), body)
+
+    async def post_item_attachment(self, item_id, attachment_id):
+        """Adds an existing attachment to the item with the specified ID, returns the response status."""
+        body = {"attachment": attachment_id}
+        response = await self.__send_json('post', 'items/' + str(item_id) + '/attachments', body)
+        return response.status_code
+
+    async def post_project_attachment(self, project_id, name, description):
+        """Creates a new attachment object in the specified project, returns the ID of the new attachment."""
+        body = {
+            "fields": {
+                "name": name,
+                "description": description
+            }
+        }
+        response = await self.__send_json('post', 'projects/' + str(project_id) + '/attachments', body)
+        return self.__codec.decode(response)['meta']['id']
+
+    async def put_item(self, project, item_id, item_type_id, child_item_type_id, location, fields):
+        """Updates the item with the specified ID, returns the response status."""
+        body = {
+            "project": project,
+            "itemType": item_type_id,
+            "childItemType": child_item_type_id,
+            "location": {
+                "parent": location
+            },
+            "fields": fields
+        }
+        response = await self.__send_json('put', 'items/' + str(item_id), body)
+        return response.status_code
+
+    async def put_attachments_file(self, attachment_id, file_path):
+        """Uploads a file to the attachment with the specified ID, returns the response status."""
+        resource_path = 'attachments/' + str(attachment_id) + '/file'
+        with open(file_path, 'rb') as f:
+            form = aiohttp.FormData()
+            form.add_field('file', f)
+            response = await self.__request('put', resource_path, data=form)
+        return response.status_code
+
+    async def put_user(self, user_id, username, password, first_name, last_name, email, phone=None, title=None,
+                       location=None):
+        """Updates the user with the specified ID, returns the response status."""
+        body = {
+            'username': username,
+            'password': password,
+            'firstName': first_name,
+            'lastName': last_name,
+            'email': email,
+            'phone': phone,
+            'title': title,
+            'location': location
+        }
+        response = await self.__send_json('put', 'users/' + str(user_id), body)
+        return response.status_code
+
+    async def put_user_active(self, user_id, is_active):
+        """Updates the active status of the user with the specified ID, returns the response status."""
+        body = {'active': is_active}
+        response = await self.__send_json('put', 'users/' + str(user_id) + '/active', body)
+        return response.status_code
+
+    async def put_test_run(self, test_run_id, data=None):
+        """Updates the test run with the specified ID, data is the JSON encoded body.  Returns the response status."""
+        headers = {'content-type': 'application/json'}
+        response = await self.__request('put', 'testruns/' + str(test_run_id), data=data, headers=headers)
+        return response.status_code
+
+    async def __request(self, method, resource, **kwargs):
+        """Performs the request with the named AsyncCore method and checks the response status.  aiohttp errors are
+        raised as the APIException JamaClient raises for the same status, or as an APIException when there was no
+        response."""
+        try:
+            response = await getattr(self.__core, method)(resource, **kwargs)
+        except CoreException as err:
+            py_jama_rest_client_logger.error(err)
+            raise APIException(str(err))
+        except aiohttp.ClientResponseError as err:
+            # Raised by aiohttp for malformed responses and failed redirects, map the status like any other response.
+            _handle_response_status(AsyncResponse(err.status, err.message, err.headers or {}, b''))
+            raise APIException(str(err), status_code=err.status, reason=err.message) from err
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            message = '{} {} failed: {}'.format(method.upper(), resource, str(err) or type(err).__name__)
+            py_jama_rest_client_logger.error(message)
+            raise APIException(message) from err
+        _handle_response_status(response, self.__codec.decode)
+        return response
+
+    async def __get_data(self, resource, params=None):
+        """Fetches a single resource and returns the data portion of the response."""
+        response = await self.__request('get', resource, params=params)
+        return self.__codec.decode(response)['data']
+
+    async def __send_json(self, method, resource, body, params=None, headers=None):
+        """Sends body as JSON with the named AsyncCore method."""
+        if headers is None:
+            headers = {'content-type': 'application/json'}
+        return await self.__request(method, resource, data=self.__codec.dumps(body), headers=headers, params=params)
+
+    async def __get_all(self, resource, params=None, allowed_results_per_page=__allowed_results_per_page):
+        """Coroutine version of JamaClient.__get_all, returns a single list with all of the retrieved items."""
+        return [item async for item in self.__iter_all(resource, params=params,
+                                                      allowed_results_per_page=allowed_results_per_page)]
+
+    async def __iter_all(self, resource, params=None, allowed_results_per_page=__allowed_results_per_page):
+        """Async generator version of JamaClient.__iter_all.  After the first page has reported the total number of
+        results, the remaining pages are requested by startAt offset, stepping by allowed_results_per_page, up to
+        max_concurrency at once, and items are yielded in page order.  When the server returns fewer results than
+        requested the rest of the page is requested before moving on, so no result is skipped or yielded twice."""
+
+        if allowed_results_per_page < 1 or allowed_results_per_page > 50:
+            raise ValueError("Allowed results per page must be between 1 and 50")
+
+        def get_page(start_at):
+            return self.__get_page_data(resource, start_at, params, allowed_results_per_page)
+
+        async def read_page(page, start_at, limit):
+            """Returns the items of the page up to the index limit, followed by those of further pages until limit is
+            reached."""
+            items = AsyncJamaClient.__page_items(page, start_at, limit) if page is not None else []
+            while start_at + len(items) < limit:
+                end = start_at + len(items)
+                next_items = AsyncJamaClient.__page_items(await get_page(end), end, limit)
+                if not next_items:
+                    # Results were removed while paging, there is nothing more to read here.
+                    break
+                items.extend(next_items)
+            return items
+
+        first_page = await get_page(0)
+        items = AsyncJamaClient.__page_items(first_page, 0, None)
+        for item in items:
+            yield item
+        end = len(items)
+        total_results = first_page[0].get('totalResults')
+        if end == 0 or end >= total_results:
+            return
+        if end < allowed_results_per_page:
+            for item in await read_page(None, end, min(allowed_results_per_page, total_results)):
+                yield item
+
+        def limit_of(start_at):
+            return min(start_at + allowed_results_per_page, total_results)
+
+        def schedule(start_at):
+            return start_at, asyncio.ensure_future(get_page(start_at))
+
+        start_indexes = iter(range(allowed_results_per_page, total_results, allowed_results_per_page))
+        pending = deque(schedule(start_index) for start_index in islice(start_indexes, self.__max_concurrency))
+        try:
+            while pending:
+                start_index, task = pending.popleft()
+                page = await task
+                # Keep the window full before handing this page to the caller.
+                for next_start_index in islice(start_indexes, 1):
+                    pending.append(schedule(next_start_index))
+                for item in await read_page(page, start_index, limit_of(start_index)):
+                    yield item
+        finally:
+            # Don't keep fetching pages that nobody will read, and wait for the cancelled requests to finish so their
+            # connections are released and no task is left with an exception nobody retrieves.
+            for _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+    @staticmethod
+    def __page_items(page, start_at, limit):
+        """Returns a list of the items of a page requested from start_at, up to the index limit if there is one.
+        Raises APIException if the server returned the page from another offset."""
+        page_info, page_data = page
+        start_index = page_info.get('startIndex', start_at)
+        if start_index != start_at:
+            raise APIException('Requested results from {} but the server returned them from {}'.format(
+                start_at, start_index))
+        return list((page_data or [])[:limit - start_at if limit is not None else None])
+
+    async def __get_page_data(self, resource, start_at, params, allowed_results_per_page):
+        """Fetches one page of results and returns a tuple of the page info and the page data."""
+        parameters = {
+            'startAt': start_at,
+            'maxResults': allowed_results_per_page
+        }
+
+        if params is not None:
+            parameters.update(params)
+
+        response = await self.__request('get', resource, params=parameters)
+        page_json = self.__codec.decode(response)
+        return page_json['meta']['pageInfo'], page_json.get('data')
+
+    @staticmethod
+    def __abstract_items_params(project, item_type, document_key, release, created_date, modified_date,
+                                last_activity_date, contains, sort_by):
+        """Builds the query parameters for the abstractitems endpoint, skipping any that were not supplied."""
+        params = {
+            'project': project,
+            'itemType': item_type,
+            'documentKey': document_key,
+            'release': release,
+            'createdDate': created_date,
+            'modifiedDate': modified_date,
+            'lastActivityDate': last_activity_date,
+            'contains': contains,
+            'sortBy': sort_by,
+        }
+        return {k: v for k, v in params.items() if v is not None}
+
+    def set_allowed_results_per_page(self, allowed_results_per_page):
+        self.__allowed_results_per_page = allowed_results_per_page
+
+    def get_allowed_results_per_page(self):
+        return self.__allowed_results_per_page
+
+    def set_max_concurrency(self, max_concurrency):
+        if max_concurrency < 1:
+            raise ValueError("Max concurrency must be at least 1")
+        self.__max_concurrency = max_concurrency
+
+    def get_max_concurrency(self):
+        return self.__max_concurrency
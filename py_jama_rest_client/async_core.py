@@ -0,0 +1,161 @@
+import asyncio
+import json
+import logging
+import math
+import time
+
+import aiohttp
+
+from .core import UnauthorizedTokenException
+
+py_jama_rest_client_logger = logging.getLogger('py_jama_rest_client-core')
+
+
+class AsyncResponse:
+    """A fully read HTTP response.  This exposes the parts of the Requests Response interface that the clients use, so
+    the same status handling works for both the synchronous and the asyncio clients."""
+
+    def __init__(self, status_code, reason, headers, content, encoding='utf-8'):
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors='replace')
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class AsyncCore:
+    """ The asyncio counterpart to Core.  Every method is a coroutine that interacts directly with the Jama API and
+    returns an AsyncResponse.  Requests are made with aiohttp, for more information visit:
+    https://docs.aiohttp.org/en/stable/
+
+    The aiohttp session is created on first use so that it belongs to the running event loop, call close() when you are
+    done with the instance."""
+
+    def __init__(self, host_name, user_credentials, api_version='/rest/v1/', oauth=False, verify=True,
+                 connection_limit=100):
+        # Instance variables
+        self.__api_version = api_version
+        self.__host_name = host_name + self.__api_version
+        self.__credentials = user_credentials
+        self.__oauth = oauth
+        self.__verify = verify
+        self.__connection_limit = connection_limit
+        self.__session = None
+
+        # OAuth tokens are fetched lazily, there is no event loop to fetch one with here.
+        if self.__oauth:
+            self.__token_host = host_name + '/rest/oauth/token'
+            self.__token = None
+            self.__token_lock = None
+
+    async def close(self):
+        """Closes the underlying aiohttp session."""
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+    async def delete(self, resource, **kwargs):
+        """ This method will perform a delete operation on the specified resource"""
+        return await self.__request('DELETE', resource, **kwargs)
+
+    async def get(self, resource, params=None, **kwargs):
+        """ This method will perform a get operation on the specified resource"""
+        return await self.__request('GET', resource, params=params, **kwargs)
+
+    async def patch(self, resource, params=None, data=None, json=None, **kwargs):
+        """ This method will perform a patch operation to the specified resource"""
+        return await self.__request('PATCH', resource, params=params, data=data, json=json, **kwargs)
+
+    async def post(self, resource, params=None, data=None, json=None, **kwargs):
+        """ This method will perform a post operation to the specified resource."""
+        return await self.__request('POST', resource, params=params, data=data, json=json, **kwargs)
+
+    async def put(self, resource, params=None, data=None, json=None, **kwargs):
+        """ This method will perform a put operation to the specified resource"""
+        return await self.__request('PUT', resource, params=params, data=data, json=json, **kwargs)
+
+    async def __request(self, method, resource, params=None, **kwargs):
+        url = self.__host_name + resource
+        session = self.__get_session()
+
+        if self.__oauth:
+            await self.__check_oauth_token()
+            kwargs['headers'] = self.__add_auth_header(**kwargs)
+        else:
+            kwargs['auth'] = aiohttp.BasicAuth(*self.__credentials)
+
+        async with session.request(method, url, params=AsyncCore.__query(params), **kwargs) as response:
+            content = await response.read()
+            return AsyncResponse(response.status, response.reason, response.headers, content,
+                                 encoding=response.charset or 'utf-8')
+
+    def __get_session(self):
+        if self.__session is None or self.__session.closed:
+            connector = aiohttp.TCPConnector(limit=self.__connection_limit, ssl=None if self.__verify else False)
+            self.__session = aiohttp.ClientSession(connector=connector)
+        return self.__session
+
+    @staticmethod
+    def __query(params):
+        """aiohttp only accepts string query values, expand lists into repeated keys the way Requests does."""
+        if params is None:
+            return None
+
+        query = []
+        for key, value in params.items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            for v in values:
+                if v is not None:
+                    query.append((key, str(v)))
+        return query
+
+    async def __check_oauth_token(self):
+        if self.__token is not None and self.__token_time_remaining() >= 60:
+            return
+
+        # Only one coroutine fetches a token, the others wait for it and then reuse it.
+        if self.__token_lock is None:
+            self.__token_lock = asyncio.Lock()
+        async with self.__token_lock:
+            if self.__token is None or self.__token_time_remaining() < 60:
+                await self.__get_fresh_token()
+
+    def __token_time_remaining(self):
+        time_elapsed = time.time() - self.__token_acquired_at
+        return self.__token_expires_in - time_elapsed
+
+    async def __get_fresh_token(self):
+        """This method will fetch a new oauth bearer token from the oauth token server."""
+        data = {
+            'grant_type': 'client_credentials'
+        }
+
+        # By getting the system time before we get the token we avoid a potential bug where the token may be expired.
+        time_before_request = time.time()
+
+        # Post to the token server, check if authorized
+        session = self.__get_session()
+        async with session.post(self.__token_host, auth=aiohttp.BasicAuth(*self.__credentials), data=data) as response:
+            if response.status >= 400:
+                message = "Unable to fetch token: "
+                raise UnauthorizedTokenException(message + '{} {}'.format(response.status, response.reason),
+                                                 response.status)
+            response_json = await response.json(content_type=None)
+
+        self.__token = response_json['access_token']
+        self.__token_expires_in = response_json['expires_in']
+        self.__token_acquired_at = math.floor(time_before_request)
+
+    def __add_auth_header(self, **kwargs):
+        headers = kwargs.get('headers')
+        if headers is None:
+            headers = {}
+        headers['Authorization'] = 'Bearer ' + self.__token
+        return headers
@@ -1,7 +1,20 @@
+import contextvars
+import inspect
 import json
 import logging
+import time
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from itertools import islice
+from urllib.parse import quote
 
-from .core import Core, CoreException
+import requests
+
+from .codec import StreamedPage, get_codec
+from .core import Core, CoreException, DeadlineExceededException as CoreDeadlineExceededException
+from .patch_writer import PatchWriter
+from .profiler import Profiler, ProfilingCodec, instrument
 
 # This is the py_jama_rest_client logger.
 py_jama_rest_client_logger = logging.getLogger('py_jama_rest_client')
@@ -46,6 +59,96 @@ class APIServerException(APIException):
     pass
 
 
+def _handle_response_status(response, decode=None):
+    """ Utility method for checking http status codes, shared by JamaClient and AsyncJamaClient.
+    If the response code is not in the 200 range, An exception will be thrown.
+    decode is an optional function that returns the decoded response body, e.g. JsonCodec.decode."""
+
+    status = response.status_code
+
+    if status in range(200, 300):
+        return status
+
+    if status in range(400, 500):
+        """These are client errors. It is likely that something is wrong with the request."""
+
+        response_message = 'No Response'
+
+        try:
+            response_json = decode(response) if decode is not None else json.loads(response.text)
+            response_message = response_json.get('meta').get('message')
+
+        except ValueError:
+            # Not JSON, e.g. an HTML error page from a proxy, which need not even be UTF-8.
+            pass
+
+        # Log the error
+        py_jama_rest_client_logger.error('API Client Error. Status: {} Message: {}'.format(status,
+                                                                                           response_message))
+
+        if response_message is not None and "already exists" in response_message:
+            raise AlreadyExistsException("Entity already exists.",
+                                         status_code=status,
+                                         reason=response_message)
+
+        if status == 401:
+            raise UnauthorizedException("Unauthorized: check credentials and permissions.  "
+                                        "API response message {}".format(response_message),
+                                        status_code=status,
+                                        reason=response_message)
+
+        if status == 404:
+            raise ResourceNotFoundException("Resource not found. check host url.",
+                                            status_code=status,
+                                            reason=response_message)
+
+        if status == 429:
+            raise TooManyRequestsException("Too many requests.  API throttling limit reached, or system under "
+                                           "maintenance.",
+                                           status_code=status,
+                                           reason=response_message)
+
+        raise APIClientException("{} {} Client Error.  Bad Request.  "
+                                 "API response message: {}".format(status, response.reason, response_message),
+                                 status_code=status,
+                                 reason=response_message)
+
+    if status in range(500, 600):
+        """These are server errors and network errors."""
+
+        # Log The Error
+        py_jama_rest_client_logger.error('{} Server error. {}'.format(status, response.reason))
+        raise APIServerException("{} Server Error.".format(status),
+                                 status_code=status,
+                                 reason=response.reason)
+
+    # Catch anything unexpected
+    py_jama_rest_client_logger.error('{} error. {}'.format(status, response.reason))
+    raise APIException("{} error".format(status),
+                       status_code=status,
+                       reason=response.reason)
+
+
+class DeadlineExceededException(APIException):
+    """This exception is thrown when an operation that makes several requests, such as fetching every page of a
+    resource, does not complete before its deadline.  completed is the number of results fetched before then, total
+    the number of results the operation would have fetched, or None if that was not known yet."""
+
+    def __init__(self, message, completed=0, total=None, elapsed=None):
+        super(DeadlineExceededException, self).__init__(message)
+        self.completed = completed
+        self.total = total
+        self.elapsed = elapsed
+
+
+class _Page(namedtuple('_Page', ['page_info', 'data'])):
+    """A fully decoded page of results, see codec.StreamedPage for the incrementally decoded kind."""
+    __slots__ = ()
+
+    def close(self):
+        pass
+
+
 class JamaClient:
     """A class to abstract communication with the Jama Connect API"""
 
@@ -56,17 +159,100 @@ class JamaClient:
                  api_version='/rest/v1/',
                  oauth=False,
                  verify=True,
-                 allowed_results_per_page=20):
+                 allowed_results_per_page=20,
+                 max_concurrency=1,
+                 retry_policy=None,
+                 rate_limiter=None,
+                 background_token_refresh=False,
+                 token_store=None,
+                 pool_connections=10,
+                 pool_maxsize=None,
+                 pool_block=False,
+                 keep_alive=True,
+                 codec='auto',
+                 stream_pages=False,
+                 timeout=(10, 120),
+                 deadline=None,
+                 transport=None,
+                 metrics=None,
+                 http_cache=None,
+                 metadata_cache=None,
+                 immutable_cache=None,
+                 coalesce_gets=False):
         """Jama Client initializer
         :rtype: JamaClient
         :param host_domain: String The domain associated with the Jama Connect host
         :param credentials: the user name and password as a tuple or client id and client secret if using Oauth.
         :param api_version: valid args are '/rest/[v1|latest|labs]/'
-        :param verify: Defaults to True, Setting this to False will skip SSL Certificate verification"""
+        :param verify: Defaults to True, Setting this to False will skip SSL Certificate verification
+        :param max_concurrency: Defaults to 1, the maximum number of pages fetched in parallel once the total number
+        of results for a paged resource is known.
+        :param retry_policy: Optional core.RetryPolicy, when set throttled and failed requests are retried with
+        backoff instead of raising straight away.
+        :param rate_limiter: Optional ratelimit.TokenBucket or ratelimit.FileTokenBucket, every request waits for a
+        token from it before it is sent.
+        :param background_token_refresh: Defaults to False, when using OAuth setting this to True renews the token on a
+        background thread before it expires, so requests never wait for the token server.  Call close() when finished
+        with the client.
+        :param token_store: Optional token_store.TokenStore, when using OAuth a still valid token from the store is
+        reused instead of fetching a new one, and new tokens are fetched on the first request rather than up front.
+        :param pool_connections: Defaults to 10, the number of hosts to keep a connection pool for.
+        :param pool_maxsize: the number of connections kept open to the host, defaults to 10 or max_concurrency if
+        that is larger.
+        :param pool_block: Defaults to False, setting this to True makes requests wait for a pooled connection instead
+        of opening an extra connection that is closed after use.
+        :param keep_alive: Defaults to True, setting this to False closes the connection after every request.
+        :param codec: JSON codec for request and response bodies, 'auto' (the default) uses orjson when it is
+        installed and the json module otherwise.  May also be 'json', 'orjson' or a codec.JsonCodec instance.
+        :param stream_pages: Defaults to False, setting this to True decodes paged results item by item as the
+        response is read, see codec.StreamedPage.  This bounds memory use for pages of very large items.
+        :param timeout: Defaults to (10, 120), the connect and read timeouts of every request in seconds, either as a
+        (connect, read) tuple or a single number for both.  Every method that makes requests takes a timeout argument
+        to override it for that call.
+        :param deadline: Optional number of seconds that fetching all pages of a paged resource may take, methods that
+        fetch pages take a deadline argument to override it for that call.  When it passes the operation stops and
+        DeadlineExceededException is raised.
+        :param transport: Optional transport.Transport that sends the requests instead of the default
+        transport.RequestsTransport, e.g. a transport.FakeTransport or transport.RecordReplayTransport for running
+        without a Jama server.  The pool settings only apply to the default transport.
+        :param metrics: Optional metrics.MetricsRegistry, or another metrics.MetricsRecorder, that records the
+        endpoint, verb, status, latency, body sizes and retries of every request.
+        :param http_cache: Optional http_cache.HttpCache, when set the responses of methods that get a single
+        resource by id, e.g. get_item, get_user or get_item_version, are cached and revalidated if they have an ETag or
+        Last-Modified header, so unchanged resources are not downloaded again.  Paged results are not cached.
+        :param metadata_cache: Optional metadata_cache.MetadataCache, when set the results of get_item_types,
+        get_item_type, get_pick_lists, get_pick_list_options, get_pick_list_option, get_relationship_types,
+        get_relationship_rule_sets and get_users are reused until they expire instead of being fetched again.
+        :param immutable_cache: Optional immutable_cache.ImmutableCache, when set the results of get_item_version,
+        get_versioned_item, get_abtract_item_version, get_abstract_versioned_item and get_baselines_versioneditems,
+        which never change, are stored permanently and never fetched again.
+        :param coalesce_gets: Defaults to False, setting this to True makes a GET that is identical to one already in
+        flight, e.g. the same get_user call made from several threads at once, wait for that request and share its
+        result or exception instead of sending another request."""
+        if max_concurrency < 1:
+            raise ValueError("Max concurrency must be at least 1")
+
         self.__credentials = credentials
         self.__allowed_results_per_page = allowed_results_per_page
+        self.__max_concurrency = max_concurrency
+        # Decoding is timed while a profiler is active, see profile.
+        self.__codec = ProfilingCodec(get_codec(codec))
+        self.__stream_pages = stream_pages
+        self.__deadline = deadline
+        self.__metadata_cache = metadata_cache
+        self.__immutable_cache = immutable_cache
+        self.__base_url = host_domain + api_version
+        # Whether the server filters abstractitems by id, None until get_items_by_ids has found out.
+        self.__filters_by_id = None
+        if pool_maxsize is None:
+            pool_maxsize = max(10, max_concurrency)
         try:
-            self.__core = Core(host_domain, credentials, api_version=api_version, oauth=oauth, verify=verify)
+            self.__core = Core(host_domain, credentials, api_version=api_version, oauth=oauth, verify=verify,
+                               retry_policy=retry_policy, rate_limiter=rate_limiter,
+                               background_token_refresh=background_token_refresh, token_store=token_store,
+                               pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block,
+                               keep_alive=keep_alive, codec=self.__codec, timeout=timeout, transport=transport,
+                               metrics=metrics, http_cache=http_cache, coalesce_gets=coalesce_gets)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
@@ -75,7 +261,11 @@ class JamaClient:
         py_jama_rest_client_logger.info('Created a new JamaClient instance. Domain: {} '
                                         'Connecting via Oauth: {}'.format(host_domain, oauth))
 
-    def get_available_endpoints(self):
+    def close(self):
+        """Stops the background token refresh, if any, and closes the connections held by this client."""
+        self.__core.close()
+
+    def get_available_endpoints(self, timeout=None):
         """
         Returns a list of all the available endpoints.
 
@@ -83,14 +273,15 @@ class JamaClient:
 
         """
         try:
-            response = self.__core.get('')
+            response = self.__core.get('', timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['data']
 
-    def get_baselines(self, project_id, allowed_results_per_page=__allowed_results_per_page):
+    def get_baselines(self, project_id, allowed_results_per_page=__allowed_results_per_page, timeout=None,
+                      deadline=None):
         """
         Returns a list of Baseline objects
         Args:
@@ -101,10 +292,11 @@ class JamaClient:
         """
         resource_path = 'baselines'
         params = {'project': project_id}
-        baseline_data = self.__get_all(resource_path, params=params, allowed_results_per_page=allowed_results_per_page)
+        baseline_data = self.__get_all(resource_path, params=params, allowed_results_per_page=allowed_results_per_page,
+                                       timeout=timeout, deadline=deadline)
         return baseline_data
 
-    def get_baseline(self, baseline_id):
+    def get_baseline(self, baseline_id, timeout=None):
         """
         This method will return a baseline
         Args:
@@ -115,14 +307,15 @@ class JamaClient:
         """
         resource_path = 'baselines/' + str(baseline_id)
         try:
-            response = self.__core.get(resource_path)
+            response = self.__core.get(resource_path, cache=True, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['data']
 
-    def get_baselines_versioneditems(self, baseline_id, allowed_results_per_page=__allowed_results_per_page):
+    def get_baselines_versioneditems(self, baseline_id, allowed_results_per_page=__allowed_results_per_page,
+                                     timeout=None, deadline=None):
         """
         Get all baseline items in a baseline with the specified ID
         Args:
@@ -131,18 +324,43 @@ class JamaClient:
         Returns: A list of versioned items belonging to the baseline
         """
         resource_path = 'baselines/' + str(baseline_id) + '/versioneditems'
-        baseline_items = self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page)
+        baseline_items = self.__immutable('get_baselines_versioneditems', resource_path, self.__get_all,
+                                          resource_path, allowed_results_per_page=allowed_results_per_page,
+                                          timeout=timeout, deadline=deadline)
         return baseline_items
 
-    def get_projects(self, allowed_results_per_page=__allowed_results_per_page):
+    def iter_baselines_versioneditems(self, baseline_id, allowed_results_per_page=__allowed_results_per_page,
+                                      timeout=None, deadline=None):
+        """
+        Generator version of get_baselines_versioneditems, yields versioned items page by page as they arrive.
+        Args:
+            baseline_id:  The id of the baseline to fetch items for.
+            allowed_results_per_page: Number of results per page
+        Returns: A generator of versioned items belonging to the baseline
+        """
+        resource_path = 'baselines/' + str(baseline_id) + '/versioneditems'
+        return self.__iter_all(resource_path, allowed_results_per_page=allowed_results_per_page, timeout=timeout,
+                               deadline=deadline)
+
+    def get_projects(self, allowed_results_per_page=__allowed_results_per_page, timeout=None, deadline=None):
         """This method will return all projects as JSON object
         :return: JSON Array of Item Objects.
         """
         resource_path = 'projects'
-        project_data = self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page)
+        project_data = self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page,
+                                      timeout=timeout, deadline=deadline)
         return project_data
 
-    def get_filter_results(self, filter_id, project_id=None, allowed_results_per_page=__allowed_results_per_page):
+    def iter_projects(self, allowed_results_per_page=__allowed_results_per_page, timeout=None, deadline=None):
+        """Generator version of get_projects, yields projects page by page as they arrive.
+        :return: generator of project objects.
+        """
+        resource_path = 'projects'
+        return self.__iter_all(resource_path, allowed_results_per_page=allowed_results_per_page, timeout=timeout,
+                               deadline=deadline)
+
+    def get_filter_results(self, filter_id, project_id=None, allowed_results_per_page=__allowed_results_per_page,
+                           timeout=None, deadline=None):
         """
         Get all results items for the filter with the specified ID
 
@@ -159,10 +377,33 @@ class JamaClient:
         params = None
         if project_id is not None:
             params = {'project': str(project_id)}
-        filter_results = self.__get_all(resource_path, params=params, allowed_results_per_page=allowed_results_per_page)
+        filter_results = self.__get_all(resource_path, params=params,
+                                        allowed_results_per_page=allowed_results_per_page, timeout=timeout,
+                                        deadline=deadline)
         return filter_results
 
-    def get_items(self, project_id, allowed_results_per_page=__allowed_results_per_page):
+    def iter_filter_results(self, filter_id, project_id=None, allowed_results_per_page=__allowed_results_per_page,
+                            timeout=None, deadline=None):
+        """
+        Generator version of get_filter_results, yields filter results page by page as they arrive.
+
+        Args:
+            filter_id: The ID of the filter to fetch the results for.
+            project_id: Use this only for filters that run on any project, where projectScope is CURRENT
+            allowed_results_per_page: Number of results per page
+
+        Returns:
+            A generator of items that match the filter.
+
+        """
+        resource_path = 'filters/' + str(filter_id) + '/results'
+        params = None
+        if project_id is not None:
+            params = {'project': str(project_id)}
+        return self.__iter_all(resource_path, params=params, allowed_results_per_page=allowed_results_per_page,
+                               timeout=timeout, deadline=deadline)
+
+    def get_items(self, project_id, allowed_results_per_page=__allowed_results_per_page, timeout=None, deadline=None):
         """
         This method will return all items in the specified project.
         Args:
@@ -174,10 +415,26 @@ class JamaClient:
         """
         resource_path = 'items'
         params = {'project': project_id}
-        item_data = self.__get_all(resource_path, params=params, allowed_results_per_page=allowed_results_per_page)
+        item_data = self.__get_all(resource_path, params=params, allowed_results_per_page=allowed_results_per_page,
+                                   timeout=timeout, deadline=deadline)
         return item_data
 
-    def get_item(self, item_id):
+    def iter_items(self, project_id, allowed_results_per_page=__allowed_results_per_page, timeout=None, deadline=None):
+        """
+        Generator version of get_items, yields the items in the specified project page by page as they arrive.
+        Args:
+            project_id: the project ID
+            allowed_results_per_page: number of results per page
+
+        Returns: a generator of item objects
+
+        """
+        resource_path = 'items'
+        params = {'project': project_id}
+        return self.__iter_all(resource_path, params=params, allowed_results_per_page=allowed_results_per_page,
+                               timeout=timeout, deadline=deadline)
+
+    def get_item(self, item_id, timeout=None):
         """
         This method will return a singular item of a specified item id
         Args:
@@ -188,14 +445,61 @@ class JamaClient:
         """
         resource_path = 'items/' + str(item_id)
         try:
-            response = self.__core.get(resource_path)
+            response = self.__core.get(resource_path, cache=True, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['data']
+
+    def get_items_by_ids(self, item_ids, max_url_length=2048, timeout=None):
+        """
+        Fetches many items, test plans, test cycles, test runs or attachments by id with a few requests.  The ids are
+        deduplicated and split into chunks of up to 50 ids that fit in max_url_length characters, each chunk is
+        fetched from the abstractitems endpoint with a multi-valued id parameter, and up to max_concurrency chunks are
+        fetched in parallel.  Servers that do not filter abstractitems by id are detected from the first chunk of the
+        first call, the ids are then fetched one by one, in parallel, by this and later calls.
+
+        Args:
+            item_ids: an iterable of item ids
+            max_url_length: the maximum length of a request URL
+
+        Returns: a tuple of a dictionary of id to item and a list of the ids that were not found, in the order given
 
-    def get_item_lock(self, item_id):
+        """
+        item_ids = list(dict.fromkeys(int(item_id) for item_id in item_ids))
+        resource_path = 'abstractitems'
+        chunks = self.__chunk_values(resource_path, 'id', item_ids, max_url_length)
+        items = {}
+        if not chunks:
+            return items, []
+
+        chunk_results = []
+        if self.__filters_by_id is None:
+            # Learn from the first chunk whether the server filters by id before fanning out, once per client.
+            first_chunk = self.__get_items_chunk(resource_path, chunks[0], timeout=timeout)
+            self.__filters_by_id = first_chunk is not None
+            if self.__filters_by_id:
+                chunk_results.append(first_chunk)
+            else:
+                py_jama_rest_client_logger.warning('The server does not filter abstractitems by id, fetching items '
+                                                   'one by one')
+
+        if not self.__filters_by_id:
+            for item in self.__run_concurrently(self.__get_abstract_item_or_none, [(item_id,) for item_id in item_ids],
+                                                timeout=timeout):
+                if item is not None:
+                    items[item['id']] = item
+        else:
+            chunk_results += self.__run_concurrently(
+                self.__get_items_chunk, [(resource_path, chunk) for chunk in chunks[len(chunk_results):]],
+                timeout=timeout)
+            for chunk, chunk_items in zip(chunks, chunk_results):
+                requested = set(chunk)
+                items.update((item['id'], item) for item in chunk_items if item['id'] in requested)
+        return items, [item_id for item_id in item_ids if item_id not in items]
+
+    def get_item_lock(self, item_id, timeout=None):
         """
         Get the locked state, last locked date, and last locked by user for the item with the specified ID
         Args:
@@ -207,14 +511,14 @@ class JamaClient:
         """
         resource_path = 'items/' + str(item_id) + '/lock'
         try:
-            response = self.__core.get(resource_path)
+            response = self.__core.get(resource_path, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['data']
 
-    def put_item_lock(self, item_id, locked):
+    def put_item_lock(self, item_id, locked, timeout=None):
         """
         Update the locked state of the item with the specified ID
         Args:
@@ -231,13 +535,13 @@ class JamaClient:
         resource_path = 'items/' + str(item_id) + '/lock'
         headers = {'content-type': 'application/json'}
         try:
-            response = self.__core.put(resource_path, data=json.dumps(body), headers=headers)
+            response = self.__core.put(resource_path, data=self.__codec.dumps(body), headers=headers, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
         return self.__handle_response_status(response)
 
-    def get_item_tags(self, item_id, allowed_results_per_page=__allowed_results_per_page):
+    def get_item_tags(self, item_id, allowed_results_per_page=__allowed_results_per_page, timeout=None, deadline=None):
         """
         Return all tags for the item with the specified ID
 
@@ -249,10 +553,11 @@ class JamaClient:
 
         """
         resource_path = 'items/' + str(item_id) + '/tags'
-        item_tags = self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page)
+        item_tags = self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page, timeout=timeout,
+                                   deadline=deadline)
         return item_tags
 
-    def get_attachment(self, attachment_id):
+    def get_attachment(self, attachment_id, timeout=None):
         """
         This method will return a singular attachment of a specified attachment id
         Args:
@@ -263,23 +568,26 @@ class JamaClient:
         """
         resource_path = 'attachments/' + str(attachment_id)
         try:
-            response = self.__core.get(resource_path)
+            response = self.__core.get(resource_path, cache=True, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['data']
 
-    def get_abstract_items_from_doc_key(self, doc_key_list, allowed_results_per_page=__allowed_results_per_page):
+    def get_abstract_items_from_doc_key(self, doc_key_list, allowed_results_per_page=__allowed_results_per_page,
+                                        timeout=None, deadline=None):
         """ DEPRECATED INSTEAD USE get_abstract_items below.
         This method will take in a list of document keys and return an array of JSON Objects associated with the
         document keys."""
         resource_path = 'abstractitems'
         params = {'documentKey': doc_key_list}
-        abstract_items = self.__get_all(resource_path, params=params, allowed_results_per_page=allowed_results_per_page)
+        abstract_items = self.__get_all(resource_path, params=params,
+                                        allowed_results_per_page=allowed_results_per_page, timeout=timeout,
+                                        deadline=deadline)
         return abstract_items
 
-    def get_relationship_rule_sets(self):
+    def get_relationship_rule_sets(self, timeout=None, deadline=None):
         """
         This method will return all relationship rule sets across all projects of the Jama Connect instance.
 
@@ -287,10 +595,11 @@ class JamaClient:
 
         """
         resource_path = 'relationshiprulesets/'
-        rule_sets = self.__get_all(resource_path)
+        rule_sets = self.__metadata('get_relationship_rule_sets', '', self.__get_all, resource_path, timeout=timeout,
+                                    deadline=deadline)
         return rule_sets
 
-    def get_relationship_rule_set(self, id):
+    def get_relationship_rule_set(self, id, timeout=None):
         """
         This method will return the relationship rule sets by id.
 
@@ -298,11 +607,11 @@ class JamaClient:
 
         """
         resource_path = 'relationshiprulesets/' + str(id)
-        response = self.__core.get(resource_path)
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        response = self.__core.get(resource_path, cache=True, timeout=timeout)
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['data']
 
-    def get_relationship_rule_set_projects(self, id):
+    def get_relationship_rule_set_projects(self, id, timeout=None, deadline=None):
         """
         This method will return the projects that have a given relationship rule set defined.
 
@@ -310,10 +619,10 @@ class JamaClient:
 
         """
         resource_path = 'relationshiprulesets/' + str(id) + '/projects'
-        projects = self.__get_all(resource_path)
+        projects = self.__get_all(resource_path, timeout=timeout, deadline=deadline)
         return projects
 
-    def get_relationship_types(self, allowed_results_per_page=__allowed_results_per_page):
+    def get_relationship_types(self, allowed_results_per_page=__allowed_results_per_page, timeout=None, deadline=None):
         """
         This method will return all relationship types of the across all projects of the Jama Connect instance.
 
@@ -324,10 +633,12 @@ class JamaClient:
 
         """
         resource_path = 'relationshiptypes/'
-        item_types = self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page)
+        item_types = self.__metadata('get_relationship_types', '', self.__get_all, resource_path,
+                                     allowed_results_per_page=allowed_results_per_page, timeout=timeout,
+                                     deadline=deadline)
         return item_types
 
-    def get_relationship_type(self, relationship_type_id):
+    def get_relationship_type(self, relationship_type_id, timeout=None):
         """
         Gets relationship type information for a specific relationship type id.
 
@@ -339,14 +650,14 @@ class JamaClient:
         """
         resource_path = 'relationshiptypes/' + str(relationship_type_id)
         try:
-            response = self.__core.get(resource_path)
+            response = self.__core.get(resource_path, cache=True, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['data']
 
-    def get_item_types(self, allowed_results_per_page=__allowed_results_per_page):
+    def get_item_types(self, allowed_results_per_page=__allowed_results_per_page, timeout=None, deadline=None):
         """
         This method will return all item types of the across all projects of the Jama Connect instance.
 
@@ -357,10 +668,12 @@ class JamaClient:
 
         """
         resource_path = 'itemtypes/'
-        item_types = self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page)
+        item_types = self.__metadata('get_item_types', '', self.__get_all, resource_path,
+                                     allowed_results_per_page=allowed_results_per_page, timeout=timeout,
+                                     deadline=deadline)
         return item_types
 
-    def get_item_type(self, item_type_id):
+    def get_item_type(self, item_type_id, timeout=None):
         """
         Gets item type information for a specific item type id.
 
@@ -371,15 +684,10 @@ class JamaClient:
 
         """
         resource_path = 'itemtypes/' + str(item_type_id)
-        try:
-            response = self.__core.get(resource_path)
-        except CoreException as err:
-            py_jama_rest_client_logger.error(err)
-            raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        return self.__metadata('get_item_type', str(item_type_id), self.__get_data, resource_path, timeout=timeout)
 
-    def get_items_synceditems(self, item_id, allowed_results_per_page=__allowed_results_per_page):
+    def get_items_synceditems(self, item_id, allowed_results_per_page=__allowed_results_per_page, timeout=None,
+                              deadline=None):
         """
         Get all synchronized items for the item with the specified ID
 
@@ -392,10 +700,11 @@ class JamaClient:
 
         """
         resource_path = 'items/' + str(item_id) + '/synceditems'
-        synced_items = self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page)
+        synced_items = self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page,
+                                      timeout=timeout, deadline=deadline)
         return synced_items
 
-    def get_items_synceditems_status(self, item_id, synced_item_id):
+    def get_items_synceditems_status(self, item_id, synced_item_id, timeout=None):
         """
         Get the sync status for the synced item with the specified ID
 
@@ -408,14 +717,14 @@ class JamaClient:
         """
         resource_path = 'items/' + str(item_id) + '/synceditems/' + str(synced_item_id) + '/syncstatus'
         try:
-            response = self.__core.get(resource_path)
+            response = self.__core.get(resource_path, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['data']
 
-    def get_item_versions(self, item_id):
+    def get_item_versions(self, item_id, timeout=None, deadline=None):
         """
         Get all versions for the item with the specified ID
 
@@ -425,10 +734,10 @@ class JamaClient:
         Returns: JSON array with all versions for the item
         """
         resource_path = 'items/' + str(item_id) + '/versions'
-        versions = self.__get_all(resource_path)
+        versions = self.__get_all(resource_path, timeout=timeout, deadline=deadline)
         return versions
 
-    def get_item_version(self, item_id, version_num):
+    def get_item_version(self, item_id, version_num, timeout=None):
         """
         Get the numbered version for the item with the specified ID
 
@@ -439,15 +748,10 @@ class JamaClient:
         Returns: a dictionary object representing the numbered version
         """
         resource_path = 'items/' + str(item_id) + '/versions/' + str(version_num)
-        try:
-            response = self.__core.get(resource_path)
-        except CoreException as err:
-            py_jama_rest_client_logger.error(err)
-            raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        return self.__immutable('get_item_version', resource_path, self.__get_data, resource_path,
+                                timeout=timeout)
 
-    def get_versioned_item(self, item_id, version_num):
+    def get_versioned_item(self, item_id, version_num, timeout=None):
         """
         Get the snapshot of the item at the specified version
 
@@ -458,15 +762,11 @@ class JamaClient:
         Returns: a dictionary object representing the versioned item
         """
         resource_path = 'items/' + str(item_id) + '/versions/' + str(version_num) + '/versioneditem'
-        try:
-            response = self.__core.get(resource_path)
-        except CoreException as err:
-            py_jama_rest_client_logger.error(err)
-            raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        return self.__immutable('get_versioned_item', resource_path, self.__get_data, resource_path,
+                                timeout=timeout)
 
-    def get_item_versions(self, item_id, allowed_results_per_page=__allowed_results_per_page):
+    def get_item_versions(self, item_id, allowed_results_per_page=__allowed_results_per_page, timeout=None,
+                          deadline=None):
         """
         Get all versions for the item with the specified ID
 
@@ -477,10 +777,11 @@ class JamaClient:
         Returns: JSON array with all versions for the item
         """
         resource_path = 'items/' + str(item_id) + '/versions'
-        versions = self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page)
+        versions = self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page, timeout=timeout,
+                                  deadline=deadline)
         return versions
 
-    def get_item_version(self, item_id, version_num):
+    def get_item_version(self, item_id, version_num, timeout=None):
         """
         Get the numbered version for the item with the specified ID
 
@@ -491,11 +792,10 @@ class JamaClient:
         Returns: a dictionary object representing the numbered version
         """
         resource_path = 'items/' + str(item_id) + '/versions/' + str(version_num)
-        response = self.__core.get(resource_path)
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        return self.__immutable('get_item_version', resource_path, self.__get_data, resource_path,
+                                timeout=timeout)
 
-    def get_versioned_item(self, item_id, version_num):
+    def get_versioned_item(self, item_id, version_num, timeout=None):
         """
         Get the snapshot of the item at the specified version
 
@@ -506,11 +806,10 @@ class JamaClient:
         Returns: a dictionary object representing the versioned item
         """
         resource_path = 'items/' + str(item_id) + '/versions/' + str(version_num) + '/versioneditem'
-        response = self.__core.get(resource_path)
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        return self.__immutable('get_versioned_item', resource_path, self.__get_data, resource_path,
+                                timeout=timeout)
 
-    def get_pick_lists(self, allowed_results_per_page=__allowed_results_per_page):
+    def get_pick_lists(self, allowed_results_per_page=__allowed_results_per_page, timeout=None, deadline=None):
         """
         Returns a list of all the pick lists
 
@@ -521,10 +820,12 @@ class JamaClient:
 
         """
         resource_path = 'picklists/'
-        pick_lists = self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page)
+        pick_lists = self.__metadata('get_pick_lists', '', self.__get_all, resource_path,
+                                     allowed_results_per_page=allowed_results_per_page, timeout=timeout,
+                                     deadline=deadline)
         return pick_lists
 
-    def get_pick_list(self, pick_list_id):
+    def get_pick_list(self, pick_list_id, timeout=None):
         """
         Gets all a singular picklist
 
@@ -536,14 +837,15 @@ class JamaClient:
         """
         resource_path = 'picklists/' + str(pick_list_id)
         try:
-            response = self.__core.get(resource_path)
+            response = self.__core.get(resource_path, cache=True, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['data']
 
-    def get_pick_list_options(self, pick_list_id, allowed_results_per_page=__allowed_results_per_page):
+    def get_pick_list_options(self, pick_list_id, allowed_results_per_page=__allowed_results_per_page, timeout=None,
+                              deadline=None):
         """
         Gets all all the picklist options for a single picklist
         Args:
@@ -554,10 +856,12 @@ class JamaClient:
 
         """
         resource_path = 'picklists/' + str(pick_list_id) + '/options'
-        pick_list_options = self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page)
+        pick_list_options = self.__metadata('get_pick_list_options', str(pick_list_id), self.__get_all, resource_path,
+                                            allowed_results_per_page=allowed_results_per_page, timeout=timeout,
+                                            deadline=deadline)
         return pick_list_options
 
-    def get_pick_list_option(self, pick_list_option_id):
+    def get_pick_list_option(self, pick_list_option_id, timeout=None):
         """
         Fetches a single picklist option from the API
         Args:
@@ -567,15 +871,11 @@ class JamaClient:
 
         """
         resource_path = 'picklistoptions/' + str(pick_list_option_id)
-        try:
-            response = self.__core.get(resource_path)
-        except CoreException as err:
-            py_jama_rest_client_logger.error(err)
-            raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        return self.__metadata('get_pick_list_option', str(pick_list_option_id), self.__get_data, resource_path,
+                               timeout=timeout)
 
-    def get_relationships(self, project_id, allowed_results_per_page=__allowed_results_per_page):
+    def get_relationships(self, project_id, allowed_results_per_page=__allowed_results_per_page, timeout=None,
+                          deadline=None):
         """
         Returns a list of all relationships of a specified project
 
@@ -589,10 +889,28 @@ class JamaClient:
         resource_path = 'relationships'
         params = {'project': project_id}
         relationship_data = self.__get_all(resource_path, params=params,
-                                           allowed_results_per_page=allowed_results_per_page)
+                                           allowed_results_per_page=allowed_results_per_page, timeout=timeout,
+                                           deadline=deadline)
         return relationship_data
 
-    def get_relationship(self, relationship_id):
+    def iter_relationships(self, project_id, allowed_results_per_page=__allowed_results_per_page, timeout=None,
+                           deadline=None):
+        """
+        Generator version of get_relationships, yields relationships page by page as they arrive.
+
+        Args:
+            project_id: the api project id of a project
+            allowed_results_per_page: number of results per page
+
+        Returns: a generator of dictionary objects that represents a relationships
+
+        """
+        resource_path = 'relationships'
+        params = {'project': project_id}
+        return self.__iter_all(resource_path, params=params, allowed_results_per_page=allowed_results_per_page,
+                               timeout=timeout, deadline=deadline)
+
+    def get_relationship(self, relationship_id, timeout=None):
         """
         Returns a specific relationship object of a specified relationship ID
 
@@ -604,12 +922,12 @@ class JamaClient:
         """
         resource_path = 'relationships/' + str(relationship_id)
         try:
-            response = self.__core.get(resource_path)
+            response = self.__core.get(resource_path, cache=True, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['data']
 
     def get_abstract_items(self,
                            project=None,
@@ -620,7 +938,7 @@ class JamaClient:
                            modified_date=None,
                            last_activity_date=None,
                            contains=None,
-                           sort_by=None):
+                           sort_by=None, timeout=None, deadline=None):
         """
         This method will return all items that match the query parameters entered.
 
@@ -640,7 +958,38 @@ class JamaClient:
 
         """
         resource_path = 'abstractitems'
+        params = JamaClient.__abstract_items_params(project, item_type, document_key, release, created_date,
+                                                    modified_date, last_activity_date, contains, sort_by)
+        abstract_items = self.__get_all(resource_path, params=params, timeout=timeout, deadline=deadline)
+        return abstract_items
+
+    def iter_abstract_items(self,
+                            project=None,
+                            item_type=None,
+                            document_key=None,
+                            release=None,
+                            created_date=None,
+                            modified_date=None,
+                            last_activity_date=None,
+                            contains=None,
+                            sort_by=None, timeout=None, deadline=None):
+        """
+        Generator version of get_abstract_items, yields matching items page by page as they arrive.  Takes the same
+        arguments as get_abstract_items.
+
+        Returns:
+            A generator of items.
+
+        """
+        resource_path = 'abstractitems'
+        params = JamaClient.__abstract_items_params(project, item_type, document_key, release, created_date,
+                                                    modified_date, last_activity_date, contains, sort_by)
+        return self.__iter_all(resource_path, params=params, timeout=timeout, deadline=deadline)
 
+    @staticmethod
+    def __abstract_items_params(project, item_type, document_key, release, created_date, modified_date,
+                                last_activity_date, contains, sort_by):
+        """Builds the query parameters for the abstractitems endpoint, skipping any that were not supplied."""
         # Add each parameter that is not null to the request.
         params = {}
 
@@ -671,10 +1020,41 @@ class JamaClient:
         if sort_by is not None:
             params['sortBy'] = sort_by
 
-        abstract_items = self.__get_all(resource_path, params=params)
-        return abstract_items
+        return params
 
-    def get_abstract_item(self, item_id):
+    def get_abstract_items_by_document_keys(self, document_keys, project=None, max_url_length=2048, timeout=None):
+        """
+        Looks up many items by document key.  The keys are deduplicated and split into batches that fit in
+        max_url_length characters, and up to max_concurrency batches are fetched from the abstractitems endpoint in
+        parallel.
+
+        Args:
+            document_keys: an iterable of document keys
+            project: optional array of project ids to limit the search to
+            max_url_length: the maximum length of a request URL
+
+        Returns: a dictionary of every document key given to its item, None for keys that matched no item
+
+        """
+        document_keys = list(dict.fromkeys(document_keys))
+        resource_path = 'abstractitems'
+        # Leave room for the project parameters in every batch.
+        project_length = sum(len('&project={}'.format(project_id)) for project_id in project or [])
+        batches = self.__chunk_values(resource_path, 'documentKey', document_keys, max_url_length - project_length)
+
+        calls = []
+        for batch in batches:
+            params = JamaClient.__abstract_items_params(project, None, batch, None, None, None, None, None, None)
+            calls.append((resource_path, params, 50))
+        items_by_key = dict.fromkeys(document_keys)
+        # The batches share one pool, each batch reads its pages on the thread it runs on.
+        for items in self.__run_concurrently(self.__get_all, calls, timeout=timeout, max_workers=1):
+            for item in items:
+                if item.get('documentKey') in items_by_key:
+                    items_by_key[item['documentKey']] = item
+        return items_by_key
+
+    def get_abstract_item(self, item_id, timeout=None):
         """
         This method will return an item, test plan, test cycle, test run, or attachment with the specified ID
         Args:
@@ -685,14 +1065,14 @@ class JamaClient:
         """
         resource_path = 'abstractitems/' + str(item_id)
         try:
-            response = self.__core.get(resource_path)
+            response = self.__core.get(resource_path, cache=True, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['data']
 
-    def get_abstract_item_versions(self, item_id):
+    def get_abstract_item_versions(self, item_id, timeout=None, deadline=None):
         """
         Get all versions for the item with the specified ID
 
@@ -702,10 +1082,10 @@ class JamaClient:
         Returns: JSON array with all versions for the item
         """
         resource_path = 'abstractitems/' + str(item_id) + '/versions'
-        versions = self.__get_all(resource_path)
+        versions = self.__get_all(resource_path, timeout=timeout, deadline=deadline)
         return versions
 
-    def get_abtract_item_version(self, item_id, version_num):
+    def get_abtract_item_version(self, item_id, version_num, timeout=None):
         """
         Get the numbered version for the item with the specified ID
 
@@ -716,15 +1096,10 @@ class JamaClient:
         Returns: a dictionary object representing the numbered version
         """
         resource_path = 'abstractitems/' + str(item_id) + '/versions/' + str(version_num)
-        try:
-            response = self.__core.get(resource_path)
-        except CoreException as err:
-            py_jama_rest_client_logger.error(err)
-            raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        return self.__immutable('get_abtract_item_version', resource_path, self.__get_data, resource_path,
+                                timeout=timeout)
 
-    def get_abstract_versioned_item(self, item_id, version_num):
+    def get_abstract_versioned_item(self, item_id, version_num, timeout=None):
         """
         Get the snapshot of the item at the specified version
 
@@ -735,16 +1110,12 @@ class JamaClient:
         Returns: a dictionary object representing the versioned item
         """
         resource_path = 'abstractitems/' + str(item_id) + '/versions/' + str(version_num) + '/versioneditem'
-        try:
-            response = self.__core.get(resource_path)
-        except CoreException as err:
-            py_jama_rest_client_logger.error(err)
-            raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        return self.__immutable('get_abstract_versioned_item', resource_path, self.__get_data, resource_path,
+                                timeout=timeout)
 
 
-    def get_item_children(self, item_id, allowed_results_per_page=__allowed_results_per_page):
+    def get_item_children(self, item_id, allowed_results_per_page=__allowed_results_per_page, timeout=None,
+                          deadline=None):
         """
         This method will return list of the child items of the item passed to the function.
         Args:
@@ -754,17 +1125,43 @@ class JamaClient:
         Returns: a List of Objects that represent the children of the item passed in.
         """
         resource_path = 'items/' + str(item_id) + '/children'
-        child_items = self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page)
+        child_items = self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page,
+                                     timeout=timeout, deadline=deadline)
         return child_items
 
-    def get_testruns(self, test_cycle_id, allowed_results_per_page=__allowed_results_per_page):
+    def iter_item_children(self, item_id, allowed_results_per_page=__allowed_results_per_page, timeout=None,
+                           deadline=None):
+        """
+        Generator version of get_item_children, yields the child items page by page as they arrive.
+        Args:
+            item_id: (int) The id of the item for which children items should be fetched
+            allowed_results_per_page: Number of results per page
+
+        Returns: a generator of Objects that represent the children of the item passed in.
+        """
+        resource_path = 'items/' + str(item_id) + '/children'
+        return self.__iter_all(resource_path, allowed_results_per_page=allowed_results_per_page, timeout=timeout,
+                               deadline=deadline)
+
+    def get_testruns(self, test_cycle_id, allowed_results_per_page=__allowed_results_per_page, timeout=None,
+                     deadline=None):
         """This method will return all test runs associated with the specified test cycle.  Test runs will be returned
         as a list of json objects."""
         resource_path = 'testcycles/' + str(test_cycle_id) + '/testruns'
-        testrun_data = self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page)
+        testrun_data = self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page,
+                                      timeout=timeout, deadline=deadline)
         return testrun_data
 
-    def get_items_upstream_relationships(self, item_id, allowed_results_per_page=__allowed_results_per_page):
+    def iter_testruns(self, test_cycle_id, allowed_results_per_page=__allowed_results_per_page, timeout=None,
+                      deadline=None):
+        """Generator version of get_testruns, yields the test runs of the specified test cycle page by page as they
+        arrive."""
+        resource_path = 'testcycles/' + str(test_cycle_id) + '/testruns'
+        return self.__iter_all(resource_path, allowed_results_per_page=allowed_results_per_page, timeout=timeout,
+                               deadline=deadline)
+
+    def get_items_upstream_relationships(self, item_id, allowed_results_per_page=__allowed_results_per_page,
+                                         timeout=None, deadline=None):
         """
         Returns a list of all the upstream relationships for the item with the specified ID.
         Args:
@@ -775,9 +1172,11 @@ class JamaClient:
 
         """
         resource_path = 'items/' + str(item_id) + '/upstreamrelationships'
-        return self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page)
+        return self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page, timeout=timeout,
+                              deadline=deadline)
 
-    def get_items_downstream_related(self, item_id, allowed_results_per_page=__allowed_results_per_page):
+    def get_items_downstream_related(self, item_id, allowed_results_per_page=__allowed_results_per_page, timeout=None,
+                                     deadline=None):
         """
         Returns a list of all the downstream related items for the item with the specified ID.
 
@@ -789,9 +1188,11 @@ class JamaClient:
 
         """
         resource_path = 'items/' + str(item_id) + '/downstreamrelated'
-        return self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page)
+        return self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page, timeout=timeout,
+                              deadline=deadline)
 
-    def get_items_downstream_relationships(self, item_id, allowed_results_per_page=__allowed_results_per_page):
+    def get_items_downstream_relationships(self, item_id, allowed_results_per_page=__allowed_results_per_page,
+                                           timeout=None, deadline=None):
         """
         Returns a list of all the downstream relationships for the item with the specified ID.
 
@@ -802,9 +1203,10 @@ class JamaClient:
 
         """
         resource_path = 'items/' + str(item_id) + '/downstreamrelationships'
-        return self.__get_all(resource_path, allowed_results_per_page=allowed_results_per_page)
+        return self.__get_all(resource_path, allowed_results_per_page=allowed_results_per_page, timeout=timeout,
+                              deadline=deadline)
 
-    def get_items_upstream_related(self, item_id):
+    def get_items_upstream_related(self, item_id, timeout=None, deadline=None):
         """
         Returns a list of all the upstream related items for the item with the specified ID.
 
@@ -815,9 +1217,9 @@ class JamaClient:
 
          """
         resource_path = 'items/' + str(item_id) + '/upstreamrelated'
-        return self.__get_all(resource_path)
+        return self.__get_all(resource_path, timeout=timeout, deadline=deadline)
 
-    def get_item_workflow_transitions(self, item_id):
+    def get_item_workflow_transitions(self, item_id, timeout=None, deadline=None):
         """
         Get all valid workflow transitions that can be made with the specified id
 
@@ -829,9 +1231,9 @@ class JamaClient:
 
         """
         resource_path = 'items/' + str(item_id) + '/workflowtransitionoptions'
-        return self.__get_all(resource_path)
+        return self.__get_all(resource_path, timeout=timeout, deadline=deadline)
 
-    def get_tags(self, project, allowed_results_per_page=__allowed_results_per_page):
+    def get_tags(self, project, allowed_results_per_page=__allowed_results_per_page, timeout=None, deadline=None):
         """
         Get all tags for the project with the specified id
         Args:
@@ -843,10 +1245,12 @@ class JamaClient:
         """
         resource_path = 'tags'
         params = {'project': project}
-        tag_data = self.__get_all(resource_path, params=params, allowed_results_per_page=allowed_results_per_page)
+        tag_data = self.__get_all(resource_path, params=params, allowed_results_per_page=allowed_results_per_page,
+                                  timeout=timeout, deadline=deadline)
         return tag_data
 
-    def get_tagged_items(self, tag_id, allowed_results_per_page=__allowed_results_per_page):
+    def get_tagged_items(self, tag_id, allowed_results_per_page=__allowed_results_per_page, timeout=None,
+                         deadline=None):
         """
         Get all items tagged with the specified ID
 
@@ -860,10 +1264,28 @@ class JamaClient:
         """
         resource_path = 'tags/' + str(tag_id) + '/items'
         params = None
-        tag_results = self.__get_all(resource_path, params=params, allowed_results_per_page=allowed_results_per_page)
+        tag_results = self.__get_all(resource_path, params=params, allowed_results_per_page=allowed_results_per_page,
+                                     timeout=timeout, deadline=deadline)
         return tag_results
 
-    def get_users(self, allowed_results_per_page=__allowed_results_per_page):
+    def iter_tagged_items(self, tag_id, allowed_results_per_page=__allowed_results_per_page, timeout=None,
+                          deadline=None):
+        """
+        Generator version of get_tagged_items, yields the tagged items page by page as they arrive.
+
+        Args:
+            tag_id: The ID of the tag to fetch the results for.
+            allowed_results_per_page: Number of results per page
+
+        Returns:
+            A generator of items that match the tag.
+
+        """
+        resource_path = 'tags/' + str(tag_id) + '/items'
+        return self.__iter_all(resource_path, allowed_results_per_page=allowed_results_per_page, timeout=timeout,
+                               deadline=deadline)
+
+    def get_users(self, allowed_results_per_page=__allowed_results_per_page, timeout=None, deadline=None):
         """
         Gets a list of all active users visible to the current user
 
@@ -874,10 +1296,11 @@ class JamaClient:
 
         """
         resource_path = 'users/'
-        users = self.__get_all(resource_path,  allowed_results_per_page=allowed_results_per_page)
+        users = self.__metadata('get_users', '', self.__get_all, resource_path,
+                                allowed_results_per_page=allowed_results_per_page, timeout=timeout, deadline=deadline)
         return users
 
-    def get_user(self, user_id):
+    def get_user(self, user_id, timeout=None):
         """
         Gets a single speificed user
 
@@ -889,13 +1312,13 @@ class JamaClient:
         """
         resource_path = 'users/' + str(user_id)
         try:
-            response = self.__core.get(resource_path)
+            response = self.__core.get(resource_path, cache=True, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        return response.json()['data']
+        return self.__codec.decode(response)['data']
 
-    def get_current_user(self):
+    def get_current_user(self, timeout=None):
         """
         Gets a current user
 
@@ -904,13 +1327,13 @@ class JamaClient:
         """
         resource_path = 'users/current'
         try:
-            response = self.__core.get(resource_path)
+            response = self.__core.get(resource_path, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        return response.json()['data']
+        return self.__codec.decode(response)['data']
 
-    def get_test_cycle(self, test_cycle_id):
+    def get_test_cycle(self, test_cycle_id, timeout=None):
         """
         This method will return JSON data about the test cycle specified by the test cycle id.
 
@@ -922,14 +1345,14 @@ class JamaClient:
         """
         resource_path = 'testcycles/' + str(test_cycle_id)
         try:
-            response = self.__core.get(resource_path)
+            response = self.__core.get(resource_path, cache=True, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['data']
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['data']
 
-    def delete_item(self, item_id):
+    def delete_item(self, item_id, timeout=None):
         """
         This method will delete an item in Jama Connect.
 
@@ -940,14 +1363,14 @@ class JamaClient:
         """
         resource_path = 'items/' + str(item_id)
         try:
-            response = self.__core.delete(resource_path)
+            response = self.__core.delete(resource_path, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
+        self.__handle_response_status(response)
         return response.status_code
 
-    def delete_relationships(self, relationship_id):
+    def delete_relationships(self, relationship_id, timeout=None):
         """
         Deletes a relationship with the specified relationship ID
 
@@ -959,14 +1382,77 @@ class JamaClient:
         """
         resource_path = 'relationships/' + str(relationship_id)
         try:
-            response = self.__core.delete(resource_path)
+            response = self.__core.delete(resource_path, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
+        self.__handle_response_status(response)
         return response.status_code
 
-    def patch_item(self, item_id, patches):
+    def delete_items_bulk(self, item_ids, max_workers=None, rate_limiter=None, timeout=None):
+        """
+        Deletes many items, sending up to max_workers delete_item requests at once.  Items that no longer exist,
+        e.g. because their parent was deleted first, count as deleted.  A failed delete does not stop the others.
+
+        Args:
+            item_ids: an iterable of item ids
+            max_workers: the maximum number of requests in flight, defaults to max_concurrency
+            rate_limiter: optional ratelimit.TokenBucket that paces these deletes, on top of the rate limiter of the
+            client, e.g. to leave room for other work on the same server
+
+        Returns: a tuple of the list of outcomes in the order of item_ids, 'deleted', 'already_deleted' or 'failed',
+        and a list of errors, one dictionary per failed id with its index in item_ids, item (the id), status_code
+        (None for a transport error such as a timeout), message and exception.  Ids given more than once are only
+        deleted once, every occurrence gets the outcome.
+
+        """
+        return self.__delete_bulk(self.delete_item, item_ids, max_workers, rate_limiter, timeout)
+
+    def delete_relationships_bulk(self, relationship_ids, max_workers=None, rate_limiter=None, timeout=None):
+        """
+        Deletes many relationships, sending up to max_workers delete_relationships requests at once.  Relationships
+        that no longer exist count as deleted.  A failed delete does not stop the others.
+
+        Args:
+            relationship_ids: an iterable of relationship ids
+            max_workers: the maximum number of requests in flight, defaults to max_concurrency
+            rate_limiter: optional ratelimit.TokenBucket that paces these deletes, on top of the rate limiter of the
+            client
+
+        Returns: a tuple of the list of outcomes in the order of relationship_ids, 'deleted', 'already_deleted' or
+        'failed', and a list of errors, see delete_items_bulk
+
+        """
+        return self.__delete_bulk(self.delete_relationships, relationship_ids, max_workers, rate_limiter, timeout)
+
+    def __delete_bulk(self, delete, ids, max_workers, rate_limiter, timeout):
+        def paced_delete(resource_id):
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            try:
+                delete(resource_id, timeout=timeout)
+            except ResourceNotFoundException:
+                return 'already_deleted'
+            return 'deleted'
+
+        ids = list(ids)
+        results = self.__run_bulk(paced_delete, ((resource_id,) for resource_id in dict.fromkeys(ids)),
+                                  max_workers=max_workers)
+        results = {resource_id: (outcome, err) for (resource_id,), outcome, err in results}
+
+        # Report against the positions in ids, duplicates were only deleted once.
+        outcomes = []
+        errors = []
+        for index, resource_id in enumerate(ids):
+            outcome, err = results[resource_id]
+            outcomes.append(outcome if err is None else 'failed')
+            if err is not None:
+                errors.append(JamaClient.__bulk_error(index, resource_id, err))
+        if errors:
+            py_jama_rest_client_logger.warning('Failed to delete {} of {}'.format(len(errors), len(outcomes)))
+        return outcomes, errors
+
+    def patch_item(self, item_id, patches, timeout=None):
         """
         This method will patch an item.
         Args:
@@ -987,21 +1473,62 @@ class JamaClient:
         headers = {'Content-Type': 'application/json',
                    'Accept': 'application/json'
                    }
-        data = json.dumps(patches)
+        data = self.__codec.dumps(patches)
 
         # Make the API Call
         try:
-            response = self.__core.patch(resource_path, data=data, headers=headers)
+            response = self.__core.patch(resource_path, data=data, headers=headers, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
 
         # validate response
-        JamaClient.__handle_response_status(response)
-        return response.json()['meta']['status']
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['meta']['status']
+
+    def patch_items_bulk(self, patches, max_workers=None, timeout=None):
+        """
+        Patches many items, sending up to max_workers patch_item requests at once.  A failed patch does not stop the
+        others.
+
+        Args:
+            patches: an iterable of (item_id, patches) pairs, see patch_item for the format of the patches
+            max_workers: the maximum number of requests in flight, defaults to max_concurrency
+
+        Returns: a tuple of the list of response statuses in the order of patches, None for patches that failed, and
+        a list of errors, one dictionary per failed patch with its index, item (the (item_id, patches) pair),
+        status_code, message and exception
+
+        """
+        statuses = []
+        errors = []
+        results = self.__run_bulk(self.patch_item, patches, max_workers=max_workers, timeout=timeout)
+        for index, (args, status, err) in enumerate(results):
+            statuses.append(status)
+            if err is not None:
+                errors.append(JamaClient.__bulk_error(index, args, err))
+        if errors:
+            py_jama_rest_client_logger.warning('Failed to patch {} of {} items'.format(len(errors), len(statuses)))
+        return statuses, errors
+
+    def patch_writer(self, max_pending=100, max_delay=5.0, max_workers=None, timeout=None):
+        """
+        Returns a patch_writer.PatchWriter that buffers patch operations, merges the ones for the same item and sends
+        them with patch_items_bulk.  Close it, or use it as a context manager, to send the remaining operations.
+
+        Args:
+            max_pending: the number of buffered operations that triggers sending them
+            max_delay: the number of seconds an operation may stay buffered
+            max_workers: the maximum number of requests in flight, defaults to max_concurrency
+
+        Returns: a PatchWriter
+
+        """
+        return PatchWriter(self, max_pending=max_pending, max_delay=max_delay, max_workers=max_workers,
+                           timeout=timeout)
 
     def post_user(self, username, password, first_name, last_name, email, license_type, phone=None, title=None,
-                  location=None):
+                  location=None, timeout=None):
         """
         Creates a new user
 
@@ -1034,14 +1561,15 @@ class JamaClient:
         resource_path = 'users/'
         headers = {'content-type': 'application/json'}
         try:
-            response = self.__core.post(resource_path, data=json.dumps(body), headers=headers)
+            response = self.__core.post(resource_path, data=self.__codec.dumps(body), headers=headers, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['meta']['id']
+        self.__handle_response_status(response)
+        self.__invalidate_metadata('get_users')
+        return self.__codec.decode(response)['meta']['id']
 
-    def post_tag(self, name: str, project: int):
+    def post_tag(self, name: str, project: int, timeout=None):
         """
         Create a new tag in the project with the specified ID
         Args:
@@ -1057,15 +1585,15 @@ class JamaClient:
         }
         headers = {'content-type': 'application/json'}
         try:
-            response = self.__core.post(resource_path, data=json.dumps(body), headers=headers)
+            response = self.__core.post(resource_path, data=self.__codec.dumps(body), headers=headers, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['meta']['id']
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['meta']['id']
 
     def post_testplans_testcycles(self, testplan_id, testcycle_name, start_date, end_date, testgroups_to_include=None,
-                                  testrun_status_to_include=None):
+                                  testrun_status_to_include=None, timeout=None):
         """
         This method will create a new Test Cycle.
 
@@ -1101,16 +1629,16 @@ class JamaClient:
 
         # Make the API Call
         try:
-            response = self.__core.post(resource_path, data=json.dumps(body), headers=headers)
+            response = self.__core.post(resource_path, data=self.__codec.dumps(body), headers=headers, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
 
         # Validate response
-        JamaClient.__handle_response_status(response)
-        return response.json()['meta']['id']
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['meta']['id']
 
-    def post_item(self, project, item_type_id, child_item_type_id, location, fields, global_id=None):
+    def post_item(self, project, item_type_id, child_item_type_id, location, fields, global_id=None, timeout=None):
         """ This method will post a new item to Jama Connect.
         :param global_id: optional param to post the item with a custom global id
         :param project integer representing the project to which this item is to be posted
@@ -1139,14 +1667,128 @@ class JamaClient:
 
         headers = {'content-type': 'application/json'}
         try:
-            response = self.__core.post(resource_path, data=json.dumps(body), headers=headers, params=params)
+            response = self.__core.post(resource_path, data=self.__codec.dumps(body), headers=headers, params=params,
+                                        timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['meta']['id']
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['meta']['id']
+
+    def post_items_bulk(self, items, max_workers=None, timeout=None):
+        """
+        Creates many items, sending up to max_workers post_item requests at once.  Requests still wait for the rate
+        limiter and are retried according to the retry policy of the client.  A failed item does not stop the others.
+
+        Args:
+            items: an iterable of dictionaries with the arguments of post_item: project, item_type_id,
+            child_item_type_id, location, fields and optionally global_id
+            max_workers: the maximum number of requests in flight, defaults to max_concurrency
+
+        Returns: a tuple of the list of created item ids in the order of items, None for items that failed, and a list
+        of errors, one dictionary per failed item with its index, item, status_code, message and exception
+
+        """
+        ids = []
+        errors = []
+        results = self.__run_bulk(self.__post_item_spec, ((item,) for item in items), max_workers=max_workers,
+                                  timeout=timeout)
+        for index, (args, item_id, err) in enumerate(results):
+            ids.append(item_id)
+            if err is not None:
+                errors.append(JamaClient.__bulk_error(index, args[0], err))
+        if errors:
+            py_jama_rest_client_logger.warning('Failed to create {} of {} items'.format(len(errors), len(ids)))
+        return ids, errors
+
+    def import_item_tree(self, project, location, nodes, preserve_order=True, max_workers=None, timeout=None):
+        """
+        Creates a tree of items.  Each item is created as soon as its parent exists, so independent subtrees are
+        created in parallel with up to max_workers requests in flight.  Jama places new items after their existing
+        siblings, so with preserve_order the siblings under each parent are created one after another, in order,
+        while their subtrees proceed in parallel.  Without it all children of an item are created at once, in no
+        particular order.
 
-    def post_item_tag(self, item_id, tag_id):
+        Args:
+            project: the id of the project to create the items in
+            location: the parent of the top level items, e.g. {'item': folder_id} or {'project': project_id}
+            nodes: a list of the top level items, dictionaries with a unique local key, item_type_id, fields and
+            optionally child_item_type_id, global_id and children, a list of nodes
+            preserve_order: Defaults to True, create the siblings under each parent in the order given
+            max_workers: the maximum number of requests in flight, defaults to max_concurrency
+
+        Returns: a tuple of a dictionary of local key to the id of the created item, and a list of errors, one
+        dictionary per item that was not created with its key, item, status_code, message and exception.  Requests
+        that fail without a response, e.g. timeouts and connection errors, are reported with a status_code of None.
+        The descendants of an item that failed are not created, they are reported with a message and no exception.
+
+        """
+        JamaClient.__check_tree_keys(nodes, set())
+        ids = {}
+        errors = []
+        pending = {}
+        with ThreadPoolExecutor(max_workers=max_workers or self.__max_concurrency) as executor:
+            def submit(siblings, position, parent_location):
+                node = siblings[position]
+                item = {'project': project, 'item_type_id': node['item_type_id'],
+                        'child_item_type_id': node.get('child_item_type_id', 0), 'location': parent_location,
+                        'fields': node['fields'], 'global_id': node.get('global_id')}
+                future = JamaClient.__submit_in_context(executor, JamaClient.__call_capturing, self.__post_item_spec,
+                                                        (item,), {'timeout': timeout})
+                pending[future] = (siblings, position, parent_location)
+
+            def submit_children(siblings, parent_location):
+                for position in range(min(1, len(siblings)) if preserve_order else len(siblings)):
+                    submit(siblings, position, parent_location)
+
+            submit_children(nodes, location)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    siblings, position, parent_location = pending.pop(future)
+                    node = siblings[position]
+                    item_id, err = future.result()
+                    if err is None:
+                        ids[node['key']] = item_id
+                        submit_children(node.get('children', []), {'item': item_id})
+                    else:
+                        # Transport errors have no status code.
+                        status_code = getattr(err, 'status_code', None)
+                        errors.append({'key': node['key'], 'item': node, 'status_code': status_code,
+                                       'message': str(err), 'exception': err})
+                        JamaClient.__skip_tree(node, errors)
+                    if preserve_order and position + 1 < len(siblings):
+                        submit(siblings, position + 1, parent_location)
+
+        if errors:
+            py_jama_rest_client_logger.warning('Failed to create {} of {} items'.format(len(errors),
+                                                                                        len(errors) + len(ids)))
+        return ids, errors
+
+    @staticmethod
+    def __check_tree_keys(nodes, keys):
+        for node in nodes:
+            if 'key' not in node:
+                raise ValueError("Every node needs a key")
+            if node['key'] in keys:
+                raise ValueError("Duplicate key: {}".format(node['key']))
+            keys.add(node['key'])
+            JamaClient.__check_tree_keys(node.get('children', []), keys)
+
+    @staticmethod
+    def __skip_tree(node, errors):
+        """Reports the descendants of an item that could not be created."""
+        for child in node.get('children', []):
+            errors.append({'key': child['key'], 'item': child, 'status_code': None,
+                           'message': 'Not created, the parent item {} was not created'.format(node['key']),
+                           'exception': None})
+            JamaClient.__skip_tree(child, errors)
+
+    def __post_item_spec(self, item, timeout=None):
+        return self.post_item(item['project'], item['item_type_id'], item['child_item_type_id'], item['location'],
+                              item['fields'], global_id=item.get('global_id'), timeout=timeout)
+
+    def post_item_tag(self, item_id, tag_id, timeout=None):
         """
         Add an existing tag to the item with the specified ID
         Args:
@@ -1162,14 +1804,14 @@ class JamaClient:
         resource_path = 'items/' + str(item_id) + '/tags'
         headers = {'content-type': 'application/json'}
         try:
-            response = self.__core.post(resource_path, data=json.dumps(body), headers=headers)
+            response = self.__core.post(resource_path, data=self.__codec.dumps(body), headers=headers, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
+        self.__handle_response_status(response)
         return response.status_code
 
-    def post_item_sync(self, source_item: int, pool_item: int):
+    def post_item_sync(self, source_item: int, pool_item: int, timeout=None):
         """
         add an item to an existing pool of global ids
         Args:
@@ -1186,14 +1828,14 @@ class JamaClient:
         resource_path = 'items/' + str(pool_item) + '/synceditems'
         headers = {'content-type': 'application/json'}
         try:
-            response = self.__core.post(resource_path, data=json.dumps(body), headers=headers)
+            response = self.__core.post(resource_path, data=self.__codec.dumps(body), headers=headers, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['meta']['id']
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['meta']['id']
 
-    def post_relationship(self, from_item: int, to_item: int, relationship_type=None):
+    def post_relationship(self, from_item: int, to_item: int, relationship_type=None, timeout=None):
         """
 
         Args:
@@ -1213,14 +1855,15 @@ class JamaClient:
         resource_path = 'relationships/'
         headers = {'content-type': 'application/json'}
         try:
-            response = self.__core.post(resource_path, data=json.dumps(body), headers=headers)
+            response = self.__core.post(resource_path, data=self.__codec.dumps(body), headers=headers, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['meta']['id']
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['meta']['id']
 
-    def put_relationship(self, relationship_id: int, from_item: int, to_item: int, relationship_type: int = None):
+    def put_relationship(self, relationship_id: int, from_item: int, to_item: int, relationship_type: int = None,
+                         timeout=None):
         """
 
             Args:
@@ -1239,13 +1882,13 @@ class JamaClient:
         resource_path = 'relationships/{}'.format(relationship_id)
         headers = {'content-type': 'application/json'}
         try:
-            response = self.__core.put(resource_path, data=json.dumps(body), headers=headers)
+            response = self.__core.put(resource_path, data=self.__codec.dumps(body), headers=headers, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
+        self.__handle_response_status(response)
 
-    def post_item_attachment(self, item_id, attachment_id):
+    def post_item_attachment(self, item_id, attachment_id, timeout=None):
         """
         Add an existing attachment to the item with the specified ID
         :param item_id: this is the ID of the item
@@ -1256,14 +1899,14 @@ class JamaClient:
         resource_path = 'items/' + str(item_id) + '/attachments'
         headers = {'content-type': 'application/json'}
         try:
-            response = self.__core.post(resource_path, data=json.dumps(body), headers=headers)
+            response = self.__core.post(resource_path, data=self.__codec.dumps(body), headers=headers, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
+        self.__handle_response_status(response)
         return response.status_code
 
-    def post_project_attachment(self, project_id, name, description):
+    def post_project_attachment(self, project_id, name, description, timeout=None):
         """
         This Method will make a new attachment object in the specified project
         :param project_id: The integer project ID to create the attachment in.
@@ -1281,14 +1924,14 @@ class JamaClient:
         resource_path = 'projects/' + str(project_id) + '/attachments'
         headers = {'content-type': 'application/json'}
         try:
-            response = self.__core.post(resource_path, data=json.dumps(body), headers=headers)
+            response = self.__core.post(resource_path, data=self.__codec.dumps(body), headers=headers, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
-        return response.json()['meta']['id']
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['meta']['id']
 
-    def put_item(self, project, item_id, item_type_id, child_item_type_id, location, fields):
+    def put_item(self, project, item_id, item_type_id, child_item_type_id, location, fields, timeout=None):
         """ This method wil
          PUT a new item to Jama Connect.
         :param project integer representing the project to which this item is to be posted
@@ -1311,13 +1954,13 @@ class JamaClient:
         resource_path = 'items/' + str(item_id)
         headers = {'content-type': 'application/json'}
         try:
-            response = self.__core.put(resource_path, data=json.dumps(body), headers=headers)
+            response = self.__core.put(resource_path, data=self.__codec.dumps(body), headers=headers, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
         return self.__handle_response_status(response)
 
-    def put_attachments_file(self, attachment_id, file_path):
+    def put_attachments_file(self, attachment_id, file_path, timeout=None):
         """
         Upload a file to a jama attachment
         :param attachment_id: the integer ID of the attachment item to which we are uploading the file
@@ -1328,7 +1971,7 @@ class JamaClient:
         with open(file_path, 'rb') as f:
             files = {'file': f}
             try:
-                response = self.__core.put(resource_path, files=files)
+                response = self.__core.put(resource_path, files=files, timeout=timeout)
             except CoreException as err:
                 py_jama_rest_client_logger.error(err)
                 raise APIException(str(err))
@@ -1336,7 +1979,7 @@ class JamaClient:
         return response.status_code
 
     def put_user(self, user_id, username, password, first_name, last_name, email, phone=None, title=None,
-                 location=None):
+                 location=None, timeout=None):
         """
         updates an existing user
 
@@ -1367,14 +2010,16 @@ class JamaClient:
         resource_path = 'users/' + str(user_id)
         headers = {'content-type': 'application/json'}
         try:
-            response = self.__core.put(resource_path, data=json.dumps(body), headers=headers)
+            response = self.__core.put(resource_path, data=self.__codec.dumps(body), headers=headers, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
             raise APIException
-        return self.__handle_response_status(response)
+        status = self.__handle_response_status(response)
+        self.__invalidate_metadata('get_users')
+        return status
 
-    def put_user_active(self, user_id, is_active):
+    def put_user_active(self, user_id, is_active, timeout=None):
         """
         updates an existing users active status
 
@@ -1390,18 +2035,20 @@ class JamaClient:
         resource_path = 'users/' + str(user_id) + '/active'
         headers = {'content-type': 'application/json'}
         try:
-            response = self.__core.put(resource_path, data=json.dumps(body), headers=headers)
+            response = self.__core.put(resource_path, data=self.__codec.dumps(body), headers=headers, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        return self.__handle_response_status(response)
+        status = self.__handle_response_status(response)
+        self.__invalidate_metadata('get_users')
+        return status
 
-    def put_test_run(self, test_run_id, data=None):
+    def put_test_run(self, test_run_id, data=None, timeout=None):
         """ This method will post a test run to Jama through the API"""
         resource_path = 'testruns/' + str(test_run_id)
         headers = {'content-type': 'application/json'}
         try:
-            response = self.__core.put(resource_path, data=data, headers=headers)
+            response = self.__core.put(resource_path, data=data, headers=headers, timeout=timeout)
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
@@ -1411,27 +2058,166 @@ class JamaClient:
         """This method will get all of the resources specified by the resource parameter, if an id or some other
         parameter is required for the resource, include it in the params parameter.
         Returns a single JSON array with all of the retrieved items."""
+        return list(self.__iter_all(resource, params=params, allowed_results_per_page=allowed_results_per_page,
+                                    **kwargs))
+
+    def __iter_all(self, resource, params=None, allowed_results_per_page=__allowed_results_per_page, deadline=None,
+                   **kwargs):
+        """Generator version of __get_all, yields the items of each page as soon as that page has been fetched.
+
+        deadline is the number of seconds fetching every page may take, None uses the default of this client.  When it
+        passes, DeadlineExceededException is raised with the number of results yielded so far."""
+        if deadline is None:
+            deadline = self.__deadline
+        if deadline is None:
+            yield from self.__iter_pages(resource, params, allowed_results_per_page, {}, **kwargs)
+            return
+
+        started_at = time.monotonic()
+        progress = {}
+        completed = 0
+        pages = self.__iter_pages(resource, params, allowed_results_per_page, progress, deadline=started_at + deadline,
+                                  **kwargs)
+        try:
+            for item in pages:
+                completed += 1
+                yield item
+        except CoreDeadlineExceededException as err:
+            total = progress.get('total_results')
+            message = 'Fetching {} did not complete within {} seconds, {} of {} results fetched'.format(
+                resource, deadline, completed, total if total is not None else 'unknown')
+            py_jama_rest_client_logger.error(message)
+            raise DeadlineExceededException(message, completed=completed, total=total,
+                                            elapsed=time.monotonic() - started_at) from err
+        finally:
+            pages.close()
+
+    def __iter_pages(self, resource, params, allowed_results_per_page, progress, max_workers=None, **kwargs):
+        """Yields the items of every page of the resource, recording the total number of results in progress.
+
+        The first page is fetched on its own to learn the total number of results, the remaining pages are then
+        requested by startAt offset, stepping by allowed_results_per_page, using up to max_workers worker threads,
+        max_concurrency by default.  At most that many pages are in flight at once, and items are always yielded in
+        page order.  Callers that already run on a worker thread pass max_workers=1 to page on it.  When the
+        server returns fewer results than requested the rest of the page is requested before moving on, so no
+        result is skipped or yielded twice."""
 
         if allowed_results_per_page < 1 or allowed_results_per_page > 50:
             raise ValueError("Allowed results per page must be between 1 and 50")
 
-        start_index = 0
-        allowed_results_per_page = 20
-        total_results = float("inf")
+        def get_page(start_at):
+            return self.__get_page_data(resource, start_at, params=params,
+                                        allowed_results_per_page=allowed_results_per_page, **kwargs)
+
+        def read_page(page, start_at, limit):
+            """Yields the items of the page up to the index limit, then those of further pages until limit is reached,
+            and returns the index after the last item yielded."""
+            end = yield from JamaClient.__read_page(page, start_at, limit)
+            while end < limit:
+                next_end = yield from JamaClient.__read_page(get_page(end), end, limit)
+                if next_end == end:
+                    # Results were removed while paging, there is nothing more to read here.
+                    break
+                end = next_end
+            return end
+
+        first_page = get_page(0)
+        end = yield from JamaClient.__read_page(first_page, 0, None)
+        total_results = first_page.page_info.get('totalResults')
+        progress['total_results'] = total_results
+        if end == 0 or end >= total_results:
+            return
+        if end < allowed_results_per_page:
+            yield from read_page(None, end, min(allowed_results_per_page, total_results))
+
+        start_indexes = range(allowed_results_per_page, total_results, allowed_results_per_page)
+        if not start_indexes:
+            return
+
+        def limit_of(start_at):
+            return min(start_at + allowed_results_per_page, total_results)
+
+        max_workers = max_workers or self.__max_concurrency
+        if max_workers == 1 or len(start_indexes) == 1:
+            for start_index in start_indexes:
+                yield from read_page(get_page(start_index), start_index, limit_of(start_index))
+            return
+
+        workers = min(max_workers, len(start_indexes))
+        start_indexes = iter(start_indexes)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            def submit(start_at):
+                return start_at, JamaClient.__submit_in_context(executor, get_page, start_at)
+
+            pending = deque(submit(start_index) for start_index in islice(start_indexes, workers))
+            try:
+                while pending:
+                    start_index, future = pending.popleft()
+                    page = future.result()
+                    # Keep the window full before handing this page to the caller.
+                    for next_start_index in islice(start_indexes, 1):
+                        pending.append(submit(next_start_index))
+                    yield from read_page(page, start_index, limit_of(start_index))
+            finally:
+                # Don't keep fetching pages that nobody will read, and release the ones already fetched.
+                for _, future in pending:
+                    if not future.cancel():
+                        future.add_done_callback(JamaClient.__close_page_future)
 
-        data = []
+    @staticmethod
+    def __page_items(page):
+        """Yields the items of the page, releasing the page when done or when the caller stops early."""
+        try:
+            yield from page.data
+        finally:
+            page.close()
 
-        while len(data) < total_results:
-            page_response = self.__get_page(resource, start_index, params=params, **kwargs)
-            page_json = page_response.json()
+    @staticmethod
+    def __read_page(page, start_at, limit):
+        """Yields the items of a page requested from start_at, up to the index limit if there is one, and returns the
+        index after the last item yielded.  page may be None to read nothing.  Raises APIException if the server
+        returned the page from another offset."""
+        if page is None:
+            return start_at
+        end = start_at
+        items = JamaClient.__page_items(page)
+        try:
+            for item in items:
+                if limit is not None and end >= limit:
+                    break
+                end += 1
+                yield item
+        finally:
+            items.close()
 
-            page_info = page_json['meta']['pageInfo']
-            start_index = page_info['startIndex'] + allowed_results_per_page
-            total_results = page_info.get('totalResults')
-            page_data = page_json.get('data')
-            data.extend(page_data)
+        try:
+            start_index = page.page_info.get('startIndex', start_at)
+        except ValueError:
+            # A streamed page that was not read to the end may not have reached its pageInfo.
+            start_index = start_at
+        if start_index != start_at:
+            raise APIException('Requested results from {} but the server returned them from {}'.format(
+                start_at, start_index))
+        return end
 
-        return data
+    @staticmethod
+    def __close_page_future(future):
+        if not future.cancelled() and future.exception() is None:
+            future.result().close()
+
+    def __get_page_data(self, resource, start_at, params=None, allowed_results_per_page=__allowed_results_per_page,
+                        **kwargs):
+        """This method will fetch one page of results and return it as a page object with page_info and data
+        attributes.  When streaming pages, the body of the response has not been read yet."""
+        if self.__stream_pages:
+            page_response = self.__get_page(resource, start_at, params=params,
+                                            allowed_results_per_page=allowed_results_per_page, stream=True, **kwargs)
+            return StreamedPage(page_response)
+
+        page_response = self.__get_page(resource, start_at, params=params,
+                                        allowed_results_per_page=allowed_results_per_page, **kwargs)
+        page_json = self.__codec.decode(page_response)
+        return _Page(page_json['meta']['pageInfo'], page_json.get('data'))
 
     def __get_page(self, resource, start_at, params=None,  allowed_results_per_page=__allowed_results_per_page,  **kwargs):
         """This method will return one page of results from the specified resource type.
@@ -1448,82 +2234,203 @@ class JamaClient:
 
         try:
             response = self.__core.get(resource, params=parameters, **kwargs)
+        except CoreDeadlineExceededException:
+            # Reported with the progress of the whole operation by __iter_all.
+            raise
         except CoreException as err:
             py_jama_rest_client_logger.error(err)
             raise APIException(str(err))
-        JamaClient.__handle_response_status(response)
+        self.__handle_response_status(response)
         return response
 
+    def __get_items_chunk(self, resource, item_ids, timeout=None):
+        """Returns the items with the given ids, at most 50, from one page of the resource.  Returns None if the
+        server ignored the id filter and answered with more results than there are ids."""
+        page = self.__get_page_data(resource, 0, params={'id': item_ids}, allowed_results_per_page=50,
+                                    timeout=timeout)
+        items = list(JamaClient.__page_items(page))
+        if page.page_info.get('totalResults', 0) > len(item_ids):
+            return None
+        return items
+
+    def __get_abstract_item_or_none(self, item_id, timeout=None):
+        try:
+            return self.get_abstract_item(item_id, timeout=timeout)
+        except ResourceNotFoundException:
+            return None
+
+    def __chunk_values(self, resource, name, values, max_url_length, max_per_chunk=50):
+        """Splits the values of a multi-valued query parameter into chunks of at most max_per_chunk values, each
+        small enough that a paged request for the resource with the chunk as the parameter fits in max_url_length
+        characters."""
+        base_length = len(self.__base_url + resource + '?startAt=0&maxResults=50')
+        chunks = []
+        chunk = []
+        length = base_length
+        for value in values:
+            value_length = len('&{}={}'.format(name, quote(str(value), safe='')))
+            if chunk and (len(chunk) >= max_per_chunk or length + value_length > max_url_length):
+                chunks.append(chunk)
+                chunk = []
+                length = base_length
+            chunk.append(value)
+            length += value_length
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def __run_concurrently(self, function, calls, **kwargs):
+        """Calls function(*args, **kwargs) for every args tuple in calls on up to max_concurrency threads, and returns
+        the results in the order of calls.  Raises the exception of the first call that failed."""
+        if self.__max_concurrency == 1 or len(calls) <= 1:
+            return [function(*args, **kwargs) for args in calls]
+        with ThreadPoolExecutor(max_workers=min(self.__max_concurrency, len(calls))) as executor:
+            futures = [JamaClient.__submit_in_context(executor, function, *args, **kwargs) for args in calls]
+            try:
+                return [future.result() for future in futures]
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def __run_bulk(self, function, calls, max_workers=None, **kwargs):
+        """Calls function(*args, **kwargs) for every args tuple in calls, an iterable that is consumed as calls
+        complete, on up to max_workers threads, max_concurrency by default.  Yields an (args, result, error) tuple for
+        every call in the order of calls.  A call that raises APIException, or a requests exception such as a timeout,
+        does not stop the others, its result is None and error is the exception."""
+        max_workers = max_workers or self.__max_concurrency
+        calls = iter(calls)
+        if max_workers == 1:
+            for args in calls:
+                yield (args,) + JamaClient.__call_capturing(function, args, kwargs)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            def submit(args):
+                return args, JamaClient.__submit_in_context(executor, JamaClient.__call_capturing, function, args,
+                                                            kwargs)
+
+            # Keep twice as many calls queued as there are workers, so a slow call does not leave workers idle.
+            pending = deque(submit(args) for args in islice(calls, 2 * max_workers))
+            try:
+                while pending:
+                    args, future = pending.popleft()
+                    for next_args in islice(calls, 1):
+                        pending.append(submit(next_args))
+                    yield (args,) + future.result()
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    @staticmethod
+    def __submit_in_context(executor, function, *args, **kwargs):
+        """Submits function(*args, **kwargs) to the executor, to run in a copy of the caller's context, so a profiler
+        attributes the requests it makes to the caller.  Returns the future."""
+        return executor.submit(contextvars.copy_context().run, function, *args, **kwargs)
+
     @staticmethod
-    def __handle_response_status(response):
+    def __call_capturing(function, args, kwargs):
+        """Returns a tuple of the result of the call and None, or of None and the exception it raised if that is an
+        APIException or a requests exception, e.g. a timeout or connection error."""
+        try:
+            return function(*args, **kwargs), None
+        except (APIException, requests.exceptions.RequestException) as err:
+            return None, err
+
+    @staticmethod
+    def __bulk_error(index, subject, err):
+        # Transport errors have no status code.
+        return {'index': index, 'item': subject, 'status_code': getattr(err, 'status_code', None),
+                'message': str(err), 'exception': err}
+
+    def __get_data(self, resource, timeout=None):
+        """Gets a single resource and returns the data of the response."""
+        try:
+            response = self.__core.get(resource, cache=True, timeout=timeout)
+        except CoreException as err:
+            py_jama_rest_client_logger.error(err)
+            raise APIException(str(err))
+        self.__handle_response_status(response)
+        return self.__codec.decode(response)['data']
+
+    def __metadata(self, endpoint, key, fetch, *args, **kwargs):
+        """Returns the result of fetch(*args, **kwargs) from the metadata cache when it is set.  Results depend on the
+        permissions of the user, they are never shared between users."""
+        if self.__metadata_cache is None:
+            return fetch(*args, **kwargs)
+        scope = '{}|{}'.format(self.__credentials[0], self.__base_url)
+        encoded = self.__metadata_cache.get(endpoint, key, scope=scope)
+        if encoded is not None:
+            return self.__codec.loads(encoded)
+        result = fetch(*args, **kwargs)
+        self.__metadata_cache.put(endpoint, key, self.__codec.dumps(result), scope=scope)
+        return result
+
+    def __immutable(self, endpoint, resource, fetch, *args, **kwargs):
+        """Returns the result of fetch(*args, **kwargs) for a resource that never changes, from the immutable cache
+        when it is set.  Results depend on the permissions of the user, they are never shared between users."""
+        if self.__immutable_cache is None:
+            return fetch(*args, **kwargs)
+        key = '{}|{}|{}'.format(self.__credentials[0], self.__base_url, resource)
+        encoded = self.__immutable_cache.get(endpoint, key)
+        if encoded is not None:
+            return self.__codec.loads(encoded)
+        result = fetch(*args, **kwargs)
+        self.__immutable_cache.put(endpoint, key, self.__codec.dumps(result))
+        return result
+
+    def __invalidate_metadata(self, endpoint):
+        if self.__metadata_cache is not None:
+            self.__metadata_cache.invalidate(endpoint)
+
+    def __handle_response_status(self, response):
         """ Utility method for checking http status codes.
         If the response code is not in the 200 range, An exception will be thrown."""
+        return _handle_response_status(response, self.__codec.decode)
 
-        status = response.status_code
+    def set_allowed_results_per_page(self, allowed_results_per_page):
+        self.__allowed_results_per_page = allowed_results_per_page
 
-        if status in range(200, 300):
-            return status
+    def get_allowed_results_per_page(self):
+        return self.__allowed_results_per_page
 
-        if status in range(400, 500):
-            """These are client errors. It is likely that something is wrong with the request."""
+    def set_max_concurrency(self, max_concurrency):
+        if max_concurrency < 1:
+            raise ValueError("Max concurrency must be at least 1")
+        self.__max_concurrency = max_concurrency
 
-            response_message = 'No Response'
+    def get_max_concurrency(self):
+        return self.__max_concurrency
 
-            try:
-                response_json = json.loads(response.text)
-                response_message = response_json.get('meta').get('message')
+    def get_metadata_cache(self):
+        return self.__metadata_cache
 
-            except json.JSONDecodeError:
-                pass
+    def get_immutable_cache(self):
+        return self.__immutable_cache
 
-            # Log the error
-            py_jama_rest_client_logger.error('API Client Error. Status: {} Message: {}'.format(status,
-                                                                                               response_message))
+    def get_retry_stats(self):
+        """Returns the retry counters of the underlying Core, see Core.get_retry_stats."""
+        return self.__core.get_retry_stats()
 
-            if response_message is not None and "already exists" in response_message:
-                raise AlreadyExistsException("Entity already exists.",
-                                             status_code=status,
-                                             reason=response_message)
+    @contextmanager
+    def profile(self):
+        """Returns a context manager that profiles the calls made within it, and yields a profiler.Profiler with the
+        call tree of the public methods called, the requests each made, their wall time, bytes, and the time spent on
+        the network and decoding JSON.  Only the calls made by the thread that entered it are profiled, this client is
+        not modified, so other threads can use it meanwhile and profiles can be nested.
 
-            if status == 401:
-                raise UnauthorizedException("Unauthorized: check credentials and permissions.  "
-                                            "API response message {}".format(response_message),
-                                            status_code=status,
-                                            reason=response_message)
+        Example:
+            with client.profile() as profiler:
+                client.get_items(project_id)
+            print(profiler.to_json(indent=2))
+        """
+        profiler = Profiler()
+        profiler.start()
+        try:
+            yield profiler
+        finally:
+            profiler.stop()
 
-            if status == 404:
-                raise ResourceNotFoundException("Resource not found. check host url.",
-                                                status_code=status,
-                                                reason=response_message)
-
-            if status == 429:
-                raise TooManyRequestsException("Too many requests.  API throttling limit reached, or system under "
-                                               "maintenance.",
-                                               status_code=status,
-                                               reason=response_message)
-
-            raise APIClientException("{} {} Client Error.  Bad Request.  "
-                                     "API response message: {}".format(status, response.reason, response_message),
-                                     status_code=status,
-                                     reason=response_message)
-
-        if status in range(500, 600):
-            """These are server errors and network errors."""
-
-            # Log The Error
-            py_jama_rest_client_logger.error('{} Server error. {}'.format(status, response.reason))
-            raise APIServerException("{} Server Error.".format(status),
-                                     status_code=status,
-                                     reason=response.reason)
-
-        # Catch anything unexpected
-        py_jama_rest_client_logger.error('{} error. {}'.format(status, response.reason))
-        raise APIException("{} error".format(status),
-                           status_code=status,
-                           reason=response.reason)
 
-    def set_allowed_results_per_page(self, allowed_results_per_page):
-        self.__allowed_results_per_page = allowed_results_per_page
-
-    def get_allowed_results_per_page(self):
-        return self.__allowed_results_per_page
+# Public methods record call tree nodes while a profiler is active in the caller's context, see JamaClient.profile.
+instrument(JamaClient, [name for name, value in vars(JamaClient).items()
+                        if not name.startswith('_') and name != 'profile' and inspect.isfunction(value)])
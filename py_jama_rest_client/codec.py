@@ -0,0 +1,196 @@
+import codecs
+import json
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonCodec:
+    """Encodes request bodies and decodes response bodies using the standard library json module.
+
+    Subclass this and override dumps and loads to plug in another JSON library."""
+
+    name = 'json'
+
+    def dumps(self, obj):
+        """Returns obj encoded as JSON, as str or bytes."""
+        return json.dumps(obj)
+
+    def loads(self, data):
+        """Returns the object decoded from the JSON str or bytes.  Raises json.JSONDecodeError for invalid JSON."""
+        return json.loads(data)
+
+    def decode(self, response):
+        """Returns the decoded body of the response.  The body is only decoded once, later calls for the same response
+        return the same object."""
+        try:
+            return response._py_jama_rest_client_json
+        except AttributeError:
+            pass
+        # Decode the raw bytes, this skips guessing the text encoding of the response.
+        decoded = self.loads(response.content)
+        response._py_jama_rest_client_json = decoded
+        return decoded
+
+
+class OrjsonCodec(JsonCodec):
+    """Encodes and decodes JSON with orjson, which is considerably faster than the standard library.  See
+    https://github.com/ijl/orjson"""
+
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+
+    def dumps(self, obj):
+        # Non string keys are converted to strings, as the json module would.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data):
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError.
+        return orjson.loads(data)
+
+
+def get_codec(codec='auto'):
+    """Returns a codec instance.
+    Args:
+        codec: 'auto' for orjson when it is installed and the json module otherwise, 'json', 'orjson', or a
+        JsonCodec instance which is returned as is.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec == 'auto':
+        return OrjsonCodec() if orjson is not None else JsonCodec()
+    if codec == 'json':
+        return JsonCodec()
+    if codec == 'orjson':
+        return OrjsonCodec()
+    raise ValueError("Unknown codec: {}".format(codec))
+
+
+class StreamedPage:
+    """Decodes a page of results from the response stream as it is read, instead of building the whole document first.
+
+    Iterate over data to get the elements of the page's 'data' array one at a time, each one is decoded only when it
+    is reached, and the text it was decoded from is released as the stream is read further.  The other top level
+    entries are decoded whole, page_info is available once they have been read, at the latest when data is exhausted.
+
+    Streamed pages are always decoded with the standard library json module.  The response is closed once data has
+    been exhausted, call close() to release it early."""
+
+    __whitespace = re.compile(r'[ \t\n\r]*')
+    __delimiters = frozenset(',]} \t\n\r')
+    __decoder = json.JSONDecoder()
+
+    def __init__(self, response, chunk_size=64 * 1024):
+        self.__response = response
+        self.__chunks = response.iter_content(chunk_size)
+        self.__text_decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+        self.__buffer = ''
+        self.__pos = 0
+        self.__eof = False
+        self.__document = {}
+        self.data = self.__iter_data()
+
+    @property
+    def page_info(self):
+        """The meta.pageInfo entry of the page.  Raises ValueError if it has not been read yet."""
+        try:
+            return self.__document['meta']['pageInfo']
+        except KeyError:
+            raise ValueError("pageInfo has not been read from the response yet")
+
+    def close(self):
+        self.data.close()
+        self.__response.close()
+
+    def __iter_data(self):
+        try:
+            self.__expect('{')
+            if self.__peek() == '}':
+                return
+            while True:
+                key = self.__value()
+                self.__expect(':')
+                if key == 'data' and self.__peek() == '[':
+                    self.__pos += 1
+                    if self.__peek() == ']':
+                        self.__pos += 1
+                    else:
+                        while True:
+                            yield self.__value()
+                            if self.__expect(',]') == ']':
+                                break
+                else:
+                    self.__document[key] = self.__value()
+                if self.__expect(',}') == '}':
+                    return
+        finally:
+            self.__response.close()
+
+    def __read(self):
+        """Appends the next chunk of the stream to the buffer, dropping the text that has already been decoded.
+        Returns False at the end of the stream."""
+        if self.__eof:
+            return False
+        chunk = next(self.__chunks, None)
+        if chunk is None:
+            self.__eof = True
+            text = self.__text_decoder.decode(b'', final=True)
+        else:
+            text = self.__text_decoder.decode(chunk)
+        self.__buffer = self.__buffer[self.__pos:] + text
+        self.__pos = 0
+        return True
+
+    def __peek(self):
+        """Skips whitespace and returns the next character without consuming it."""
+        while True:
+            self.__pos = self.__whitespace.match(self.__buffer, self.__pos).end()
+            if self.__pos < len(self.__buffer):
+                return self.__buffer[self.__pos]
+            if not self.__read():
+                raise self.__error('Unexpected end of JSON document')
+
+    def __expect(self, characters):
+        """Consumes the next character, which must be one of characters, and returns it."""
+        character = self.__peek()
+        if character not in characters:
+            raise self.__error('Expecting one of {!r}'.format(characters))
+        self.__pos += 1
+        return character
+
+    def __value(self):
+        """Decodes the complete JSON value that starts at the current position."""
+        self.__peek()
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(self.__buffer, self.__pos)
+            except json.JSONDecodeError:
+                # Incomplete value, read at least as much again as is buffered so large values are not re-decoded
+                # once per chunk.
+                if not self.__read_more():
+                    raise
+                continue
+            # A number (or literal) is only complete once a delimiter follows it, the rest of '1.5' or '2e3' may still
+            # be in the next chunk.
+            if (not isinstance(value, (dict, list, str)) and
+                    (end == len(self.__buffer) or self.__buffer[end] not in self.__delimiters) and self.__read()):
+                continue
+            self.__pos = end
+            return value
+
+    def __read_more(self):
+        wanted = 2 * (len(self.__buffer) - self.__pos)
+        if not self.__read():
+            return False
+        while len(self.__buffer) - self.__pos < wanted and self.__read():
+            pass
+        return True
+
+    def __error(self, message):
+        return json.JSONDecodeError(message, self.__buffer, self.__pos)
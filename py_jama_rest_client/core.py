@@ -1,6 +1,16 @@
+import copy
+import json
 import math
+import random
+import threading
+from email.utils import parsedate_to_datetime
 
 import requests
+
+from .codec import get_codec
+from .metrics import endpoint_template
+from .profiler import is_profiling, record_request
+from .transport import RequestsTransport
 import time
 import logging
 
@@ -23,100 +33,458 @@ class UnauthorizedTokenException(CoreException):
     pass
 
 
+class DeadlineExceededException(CoreException):
+    """This exception is thrown when a request can not be completed before its deadline."""
+    pass
+
+
+class RetryPolicy:
+    """Describes when Core should retry a request and how long it should wait before doing so.
+
+    Requests are retried when the response status is in status_codes, or when the connection fails, but only for the
+    HTTP verbs listed in methods.  By default only idempotent verbs are retried.  The wait before retry n is
+    backoff_factor * 2 ** (n - 1) seconds capped at max_backoff, randomized between zero and that value when jitter is
+    enabled.  When the server sends a Retry-After header that value is used instead, up to max_retry_after seconds."""
+
+    IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+    def __init__(self, max_attempts=3, backoff_factor=0.5, max_backoff=30, jitter=True,
+                 status_codes=(429, 500, 502, 503, 504), methods=IDEMPOTENT_METHODS, respect_retry_after=True,
+                 max_retry_after=120, retry_on_connection_error=True):
+        if max_attempts < 1:
+            raise ValueError("Max attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.retry_on_connection_error = retry_on_connection_error
+
+    def applies_to(self, method):
+        """Returns True if requests with this HTTP verb may be retried."""
+        return method.upper() in self.methods
+
+    def get_backoff(self, attempt, response=None):
+        """Returns the number of seconds to wait after the given attempt number failed."""
+        if response is not None and self.respect_retry_after:
+            retry_after = RetryPolicy.__parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+
+        backoff = min(self.backoff_factor * (2 ** (attempt - 1)), self.max_backoff)
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        return backoff
+
+    @staticmethod
+    def __parse_retry_after(value):
+        """Retry-After is either a number of seconds or an HTTP date."""
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+class _InFlightGet:
+    """A GET request that is being sent, which identical GETs made meanwhile wait for."""
+
+    __slots__ = ('done', 'response', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
 class Core:
     """ This Class will contain a collection of methods that interact directly with the Jama API and return A Requests
     Response Object.  This class will give the user more fine grained access to the JAMA API.  For more information
     on the Requests library visit: http://docs.python-requests.org/en/master/"""
 
-    def __init__(self, host_name, user_credentials, api_version='/rest/v1/', oauth=False, verify=True):
+    def __init__(self, host_name, user_credentials, api_version='/rest/v1/', oauth=False, verify=True,
+                 retry_policy=None, rate_limiter=None, background_token_refresh=False, token_refresh_lead=60,
+                 token_store=None, pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True,
+                 codec='auto', timeout=(10, 120), transport=None, metrics=None, http_cache=None,
+                 coalesce_gets=False):
         # Instance variables
         self.__api_version = api_version
         self.__host_name = host_name + self.__api_version
         self.__credentials = user_credentials
         self.__oauth = oauth
         self.__verify = verify
-        self.__session = requests.Session()
+        # The pool settings only apply to the default transport.
+        self.__transport = transport
+        if self.__transport is None:
+            self.__transport = RequestsTransport(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                                 pool_block=pool_block, keep_alive=keep_alive)
+        self.__retry_policy = retry_policy
+        self.__rate_limiter = rate_limiter
+        self.__codec = get_codec(codec)
+        self.__timeout = timeout
+        self.__metrics = metrics
+        self.__http_cache = http_cache
+        self.__coalesce_gets = coalesce_gets
+        self.__in_flight_lock = threading.Lock()
+        self.__in_flight = {}
+        self.__retry_stats_lock = threading.Lock()
+        self.__retry_stats = Core.__new_retry_stats()
 
         # Setup OAuth if needed.
         if self.__oauth:
             self.__token_host = host_name + '/rest/oauth/token'
             self.__token = None
-            self.__get_fresh_token()
+            self.__token_refresh_at = 0
+            self.__token_lock = threading.Lock()
+            self.__background_token_refresh = background_token_refresh
+            self.__token_refresh_lead = token_refresh_lead
+            self.__token_refresh_thread = None
+            self.__closed = threading.Event()
+            self.__token_store = token_store
+            self.__token_store_key = '{}|{}'.format(self.__token_host, user_credentials[0])
+            self.__token_from_store = False
+
+            # With a token store, reuse a stored token or fetch one when the first request is made.
+            with self.__token_lock:
+                if self.__token_store is None:
+                    self.__get_fresh_token()
+                else:
+                    self.__load_stored_token()
+
+    def close(self):
+        """Stops the background token refresh, if it is running, and closes the pooled connections."""
+        if self.__oauth:
+            self.__closed.set()
+        self.__transport.close()
 
     def delete(self, resource, **kwargs):
         """ This method will perform a delete operation on the specified resource"""
-        url = self.__host_name + resource
-        kwargs['verify'] = self.__verify
-
-        if self.__oauth:
-            self.__check_oauth_token()
-            kwargs['headers'] = self.__add_auth_header(**kwargs)
-            return self.__session.delete(url, **kwargs)
-
-        return self.__session.delete(url, auth=self.__credentials, **kwargs)
-
-    def get(self, resource, params=None, **kwargs):
-        """ This method will perform a get operation on the specified resource"""
-        url = self.__host_name + resource
-        kwargs['verify'] = self.__verify
-
-        if self.__oauth:
-            self.__check_oauth_token()
-            kwargs['headers'] = self.__add_auth_header(**kwargs)
-            return self.__session.get(url, params=params, **kwargs)
+        return self.__request('DELETE', resource, **kwargs)
 
-        return self.__session.get(url, auth=self.__credentials, params=params, **kwargs)
+    def get(self, resource, params=None, cache=False, **kwargs):
+        """ This method will perform a get operation on the specified resource.  When cache is True and this instance
+        has an HTTP cache, the response is cached and revalidated on later calls.  Only pass it for single resources,
+        caching every page of a listing would fill the cache with entries that are rarely requested again."""
+        return self.__request('GET', resource, params=params, cache=cache, **kwargs)
 
     def patch(self, resource, params=None, data=None, json=None, **kwargs):
         """ This method will perform a patch operation to the specified resource"""
-        url = self.__host_name + resource
-        kwargs['verify'] = self.__verify
-
-        if self.__oauth:
-            self.__check_oauth_token()
-            kwargs['headers'] = self.__add_auth_header(**kwargs)
-            return self.__session.patch(url, params=params, data=data, json=json, **kwargs)
-
-        return self.__session.patch(url, auth=self.__credentials, params=params, data=data, json=json, **kwargs)
+        return self.__request('PATCH', resource, params=params, data=data, json=json, **kwargs)
 
     def post(self, resource, params=None, data=None, json=None, **kwargs):
         """ This method will perform a post operation to the specified resource."""
-        url = self.__host_name + resource
-        kwargs['verify'] = self.__verify
-
-        if self.__oauth:
-            self.__check_oauth_token()
-            kwargs['headers'] = self.__add_auth_header(**kwargs)
-            return self.__session.post(url, params=params, data=data, json=json, **kwargs)
-
-        return self.__session.post(url, auth=self.__credentials, params=params, data=data, json=json, **kwargs)
+        return self.__request('POST', resource, params=params, data=data, json=json, **kwargs)
 
     def put(self, resource, params=None, data=None, json=None, **kwargs):
         """ This method will perform a put operation to the specified resource"""
+        return self.__request('PUT', resource, params=params, data=data, json=json, **kwargs)
+
+    def get_metrics(self):
+        return self.__metrics
+
+    def set_metrics(self, metrics):
+        """Sets the metrics.MetricsRecorder that requests are reported to, None stops recording."""
+        self.__metrics = metrics
+
+    def json(self, response):
+        """Returns the decoded JSON body of a response returned by this instance, decoding it only once."""
+        return self.__codec.decode(response)
+
+    def get_retry_stats(self):
+        """Returns a snapshot of the retry counters for this instance:
+        requests: number of calls made through this instance
+        retries: number of additional attempts made
+        retries_by_status: retries keyed by the status code that caused them, 'connection_error' for failed connections
+        exhausted: number of calls that still failed after the last attempt allowed by the retry policy
+        backoff_seconds: total time spent waiting between attempts"""
+        with self.__retry_stats_lock:
+            stats = dict(self.__retry_stats)
+            stats['retries_by_status'] = dict(stats['retries_by_status'])
+            return stats
+
+    def reset_retry_stats(self):
+        with self.__retry_stats_lock:
+            self.__retry_stats = Core.__new_retry_stats()
+
+    @staticmethod
+    def __new_retry_stats():
+        return {
+            'requests': 0,
+            'retries': 0,
+            'retries_by_status': {},
+            'exhausted': 0,
+            'backoff_seconds': 0.0,
+        }
+
+    def __request(self, method, resource, cache=False, **kwargs):
+        """Sends the request.  GETs wait for an identical GET that is in flight when coalescing is enabled, and
+        cached GET responses are revalidated when cache is True and there is an HTTP cache."""
+        if method == 'GET' and not kwargs.get('stream'):
+            if self.__coalesce_gets:
+                return self.__coalesced_get(resource, cache, **kwargs)
+            return self.__get(resource, cache, **kwargs)
+        return self.__metered_request(method, resource, **kwargs)
+
+    def __get(self, resource, cache, **kwargs):
+        if cache and self.__http_cache is not None:
+            return self.__cached_get(resource, **kwargs)
+        return self.__metered_request('GET', resource, **kwargs)
+
+    def __coalesced_get(self, resource, cache, **kwargs):
+        """Sends the GET unless an identical one (same resource, params and headers) is in flight, in which case it
+        waits for that one and returns a copy of its response, or raises its exception.  Waiting callers share the
+        timeout and deadline of the request they wait for."""
+        key = json.dumps([resource, kwargs.get('params'), kwargs.get('headers')], sort_keys=True, default=str)
+        with self.__in_flight_lock:
+            in_flight = self.__in_flight.get(key)
+            leader = in_flight is None
+            if leader:
+                in_flight = self.__in_flight[key] = _InFlightGet()
+
+        if not leader:
+            in_flight.done.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return copy.copy(in_flight.response)
+
+        try:
+            response = self.__get(resource, cache, **kwargs)
+            # Waiting callers get copies of an undecoded snapshot, so they never share decoded bodies with this one.
+            in_flight.response = copy.copy(response)
+            return response
+        except Exception as err:
+            in_flight.error = err
+            raise
+        finally:
+            with self.__in_flight_lock:
+                del self.__in_flight[key]
+            in_flight.done.set()
+
+    def __cached_get(self, resource, **kwargs):
+        """Sends a GET with the validators of the cached response, if there is one, and serves the cached body when
+        the server answers 304 Not Modified."""
+        # Responses depend on the permissions of the user, never share them between users.
+        key = '{}|{}{}|{}'.format(self.__credentials[0], self.__host_name, resource,
+                                  json.dumps(kwargs.get('params'), sort_keys=True, default=str))
+        entry = self.__http_cache.get(key)
+        if entry is not None:
+            headers = dict(kwargs.get('headers') or {})
+            if entry.etag is not None:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified is not None:
+                headers['If-Modified-Since'] = entry.last_modified
+            kwargs['headers'] = headers
+
+        response = self.__metered_request('GET', resource, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            self.__http_cache.count('hits')
+            response.close()
+            # A 304 carries the current validators and caching headers, they replace the stored ones.
+            entry = self.__http_cache.refresh(key, entry, response)
+            return entry.to_response(response.url)
+
+        self.__http_cache.count('misses')
+        if response.status_code == 200:
+            self.__http_cache.put(key, response)
+        return response
+
+    def __metered_request(self, method, resource, **kwargs):
+        """Sends the request, retrying it as allowed by the retry policy, and reports it to the metrics recorder and
+        the profiler active in this context."""
+        if self.__metrics is None and not is_profiling():
+            return self.__send_with_retries(method, resource, None, **kwargs)
+
+        progress = {'attempts': 0}
+        status = None
+        response = None
+        started_at = time.perf_counter()
+        try:
+            response = self.__send_with_retries(method, resource, progress, **kwargs)
+            status = response.status_code
+            return response
+        except Exception as err:
+            status = type(err).__name__
+            raise
+        finally:
+            self.__record_metrics(method, resource, status, time.perf_counter() - started_at, kwargs, response,
+                                  progress['attempts'])
+
+    def __record_metrics(self, method, resource, status, latency, kwargs, response, attempts):
+        data = kwargs.get('data')
+        if kwargs.get('json') is not None:
+            data = self.__codec.dumps(kwargs['json'])
+        request_bytes = len(data) if isinstance(data, (str, bytes)) else 0
+
+        response_bytes = 0
+        if response is not None:
+            if kwargs.get('stream'):
+                # Reading the body here would defeat streaming, rely on the header.
+                response_bytes = int(response.headers.get('Content-Length', 0))
+            else:
+                response_bytes = len(response.content)
+
+        endpoint = endpoint_template(resource)
+        record_request(endpoint, method, status, latency, request_bytes, response_bytes, max(0, attempts - 1))
+        if self.__metrics is None:
+            return
+        try:
+            self.__metrics.record(endpoint, method, status, latency, request_bytes, response_bytes,
+                                  max(0, attempts - 1))
+        except Exception as err:
+            py_jama_rest_client_logger.warning('Unable to record request metrics: {}'.format(err))
+
+    def __send_with_retries(self, method, resource, progress, timeout=None, deadline=None, **kwargs):
+        """Sends the request, retrying it as allowed by the retry policy.  When progress is a dictionary, its
+        'attempts' entry is kept up to date with the number of attempts made.
+
+        timeout is the connect and read timeout of each attempt, as a number of seconds or a (connect, read) tuple,
+        None uses the default of this instance.  deadline is a time.monotonic() value by which the request, including
+        retries, must have completed, the timeouts are shortened to fit and DeadlineExceededException is raised once
+        it has passed."""
         url = self.__host_name + resource
         kwargs['verify'] = self.__verify
-
+        if timeout is None:
+            timeout = self.__timeout
+        policy = self.__retry_policy
+
+        # Only retry the verbs the policy allows, and never multipart uploads, they read from open files.
+        if policy is not None and (not policy.applies_to(method) or 'files' in kwargs):
+            policy = None
+
+        attempt = 1
+        with self.__retry_stats_lock:
+            self.__retry_stats['requests'] += 1
+
+        while True:
+            if progress is not None:
+                progress['attempts'] = attempt
+
+            # Every attempt, including retries, spends a token.
+            if self.__rate_limiter is not None:
+                self.__rate_limiter.acquire()
+
+            kwargs['timeout'] = timeout
+            if deadline is not None:
+                kwargs['timeout'] = Core.__fit_timeout(timeout, self.__time_left(method, resource, deadline))
+
+            try:
+                response = self.__send(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as err:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise DeadlineExceededException('{} {} did not complete before its deadline'
+                                                    .format(method, resource)) from err
+                if policy is None or not policy.retry_on_connection_error:
+                    raise
+                if attempt >= policy.max_attempts:
+                    self.__count_exhausted()
+                    raise
+                reason = 'connection_error'
+                backoff = policy.get_backoff(attempt)
+            else:
+                if self.__oauth and response.status_code == 401 and self.__discard_stored_token():
+                    # The stored token was revoked or issued for another session, try again with a fresh one.
+                    response.close()
+                    continue
+                if self.__oauth and self.__token_from_store and response.status_code != 401:
+                    # The server accepted the stored token.
+                    self.__token_from_store = False
+                if policy is None or response.status_code not in policy.status_codes:
+                    return response
+                if attempt >= policy.max_attempts:
+                    self.__count_exhausted()
+                    return response
+                reason = response.status_code
+                backoff = policy.get_backoff(attempt, response)
+                response.close()
+
+            if deadline is not None and time.monotonic() + backoff >= deadline:
+                raise DeadlineExceededException('{} {} failed with {}, the deadline does not leave time to retry'
+                                                .format(method, resource, reason))
+
+            py_jama_rest_client_logger.warning('{} {} failed with {}, retrying in {:.2f} seconds (attempt {} of {})'
+                                               .format(method, resource, reason, backoff, attempt + 1,
+                                                       policy.max_attempts))
+            with self.__retry_stats_lock:
+                self.__retry_stats['retries'] += 1
+                retries_by_status = self.__retry_stats['retries_by_status']
+                retries_by_status[reason] = retries_by_status.get(reason, 0) + 1
+                self.__retry_stats['backoff_seconds'] += backoff
+
+            time.sleep(backoff)
+            attempt += 1
+
+    @staticmethod
+    def __time_left(method, resource, deadline):
+        time_left = deadline - time.monotonic()
+        if time_left <= 0:
+            raise DeadlineExceededException('{} {} was not sent before its deadline'.format(method, resource))
+        return time_left
+
+    @staticmethod
+    def __fit_timeout(timeout, time_left):
+        """Returns timeout, shortened so that neither the connect nor the read timeout runs past time_left."""
+        if isinstance(timeout, tuple):
+            return tuple(time_left if t is None else min(t, time_left) for t in timeout)
+        return time_left if timeout is None else min(timeout, time_left)
+
+    def __count_exhausted(self):
+        with self.__retry_stats_lock:
+            self.__retry_stats['exhausted'] += 1
+
+    def __send(self, method, url, **kwargs):
         if self.__oauth:
-            self.__check_oauth_token()
-            kwargs['headers'] = self.__add_auth_header(**kwargs)
-            return self.__session.put(url, data=data, params=params, json=json, **kwargs)
+            # Use one token for the whole request, the attribute may be replaced or discarded meanwhile.
+            token = self.__check_oauth_token()
+            kwargs['headers'] = self.__add_auth_header(token, **kwargs)
+            return self.__transport.request(method, url, **kwargs)
 
-        return self.__session.put(url, auth=self.__credentials, data=data, params=params, json=json, **kwargs)
+        return self.__transport.request(method, url, auth=self.__credentials, **kwargs)
 
     def __check_oauth_token(self):
-
-        if self.__token is None:
-            self.__get_fresh_token()
-
-        else:
-            time_elapsed = time.time() - self.__token_acquired_at
-            time_remaining = self.__token_expires_in - time_elapsed
-            if time_remaining < 60:
-                # if less than a minute remains, just get another token.
+        """Returns a token that is valid for at least another minute, fetching a new one if needed."""
+        # Fast path, no locking while the token has more than a minute left.
+        token = self.__token
+        if token is not None and time.time() < self.__token_refresh_at:
+            return token
+
+        # Only one thread fetches a token, the others wait for it and then reuse it.
+        with self.__token_lock:
+            if self.__token is None or time.time() >= self.__token_refresh_at:
                 self.__get_fresh_token()
+            if self.__token is None:
+                raise UnauthorizedTokenException("Unable to fetch token")
+            return self.__token
+
+    def __refresh_token_in_background(self):
+        """Body of the background refresh thread.  Renews the token token_refresh_lead seconds before requests would
+        have to, so that no request waits on the token server."""
+        while True:
+            wait = max(1.0, self.__token_renew_at - time.time())
+            if self.__closed.wait(wait):
+                return
+
+            try:
+                with self.__token_lock:
+                    if time.time() >= self.__token_renew_at:
+                        self.__get_fresh_token()
+            except Exception as err:
+                # Requests will still refresh the token themselves once it is about to expire.
+                py_jama_rest_client_logger.warning('Background OAuth token refresh failed: {}'.format(err))
+                if self.__closed.wait(10):
+                    return
 
     def __get_fresh_token(self):
-        """This method will fetch a new oauth bearer token from the oauth token server."""
+        """This method will fetch a new oauth bearer token from the oauth token server.  Callers must hold the token
+        lock."""
         data = {
             'grant_type': 'client_credentials'
         }
@@ -126,7 +494,8 @@ class Core:
 
         # Post to the token server, check if authorized
         try:
-            response = requests.post(self.__token_host, auth=self.__credentials, data=data, verify=self.__verify)
+            response = self.__transport.request('POST', self.__token_host, auth=self.__credentials, data=data,
+                                                verify=self.__verify, timeout=self.__timeout)
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             message = "Unable to fetch token: "
@@ -134,18 +503,78 @@ class Core:
 
         # If success get relevant data
         if response.status_code in [200, 201]:
-            response_json = response.json()
-            self.__token = response_json['access_token']
-            self.__token_expires_in = response_json['expires_in']
-            self.__token_acquired_at = math.floor(time_before_request)
+            response_json = self.__codec.decode(response)
+            self.__set_token(response_json['access_token'], response_json['expires_in'],
+                             math.floor(time_before_request))
+
+            if self.__token_store is not None:
+                token = {
+                    'access_token': self.__token,
+                    'expires_in': self.__token_expires_in,
+                    'acquired_at': self.__token_acquired_at,
+                }
+                try:
+                    self.__token_store.save(self.__token_store_key, token)
+                except Exception as err:
+                    py_jama_rest_client_logger.warning('Unable to store OAuth token: {}'.format(err))
 
         else:
             py_jama_rest_client_logger.error('Failed to retrieve OAuth Token')
 
-    def __add_auth_header(self, **kwargs):
+    def __set_token(self, access_token, expires_in, acquired_at):
+        """Installs a token.  Callers must hold the token lock."""
+        self.__token = access_token
+        self.__token_expires_in = expires_in
+        self.__token_acquired_at = acquired_at
+        self.__token_from_store = False
+
+        # If less than a minute remains, requests will get another token.  Set last, readers of
+        # __token_refresh_at skip the lock and must see the new token with it.
+        time_usable = self.__token_expires_in - 60
+        self.__token_renew_at = self.__token_acquired_at + max(time_usable / 2,
+                                                               time_usable - self.__token_refresh_lead)
+        self.__token_refresh_at = self.__token_acquired_at + time_usable
+
+        if self.__background_token_refresh and self.__token_refresh_thread is None:
+            self.__token_refresh_thread = threading.Thread(target=self.__refresh_token_in_background,
+                                                           name='py_jama_rest_client-token-refresh',
+                                                           daemon=True)
+            self.__token_refresh_thread.start()
+
+    def __load_stored_token(self):
+        """Installs the stored token if it is still valid.  Callers must hold the token lock."""
+        try:
+            token = self.__token_store.load(self.__token_store_key)
+        except Exception as err:
+            py_jama_rest_client_logger.warning('Unable to load stored OAuth token: {}'.format(err))
+            return
+
+        if token is None or token['acquired_at'] + token['expires_in'] - 60 <= time.time():
+            return
+
+        self.__set_token(token['access_token'], token['expires_in'], token['acquired_at'])
+        self.__token_from_store = True
+
+    def __discard_stored_token(self):
+        """Forgets the current token if it came from the token store and has not been accepted by the server yet.
+        Returns True if the token was discarded."""
+        with self.__token_lock:
+            if not self.__token_from_store:
+                return False
+            self.__token = None
+            self.__token_refresh_at = 0
+            self.__token_from_store = False
+            try:
+                self.__token_store.delete(self.__token_store_key)
+            except Exception as err:
+                py_jama_rest_client_logger.warning('Unable to delete stored OAuth token: {}'.format(err))
+            return True
+
+    @staticmethod
+    def __add_auth_header(token, **kwargs):
         headers = kwargs.get('headers')
         if headers is None:
             headers = {}
-        headers['Authorization'] = 'Bearer ' + self.__token
+        headers['Authorization'] = 'Bearer ' + token
         return headers
 
@@ -0,0 +1,290 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from requests.structures import CaseInsensitiveDict
+
+from .transport import build_response
+
+py_jama_rest_client_logger = logging.getLogger('py_jama_rest_client-http_cache')
+
+# Headers that describe the transfer rather than the body, requests has already decoded the body.
+_UNCACHED_HEADERS = frozenset(['set-cookie', 'content-length', 'content-encoding', 'transfer-encoding', 'connection',
+                               'keep-alive'])
+
+
+class CacheEntry:
+    """A cached response body with the validators used to revalidate it."""
+
+    __slots__ = ('headers', 'content', 'encoding', 'etag', 'last_modified', 'stored_at')
+
+    def __init__(self, headers, content, encoding=None, stored_at=None):
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+        validators = CaseInsensitiveDict(headers)
+        self.etag = validators.get('ETag')
+        self.last_modified = validators.get('Last-Modified')
+        self.stored_at = stored_at if stored_at is not None else time.time()
+
+    @staticmethod
+    def from_response(response):
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _UNCACHED_HEADERS}
+        return CacheEntry(headers, response.content, encoding=response.encoding)
+
+    def updated(self, response):
+        """Returns a copy of this entry with the headers of response, a 304 Not Modified for it, merged in."""
+        headers = dict(self.headers)
+        for name, value in response.headers.items():
+            if name.lower() in _UNCACHED_HEADERS:
+                continue
+            # Header names are case insensitive, the 304 may spell them differently.
+            for stored in [stored for stored in headers if stored.lower() == name.lower()]:
+                del headers[stored]
+            headers[name] = value
+        return CacheEntry(headers, self.content, encoding=self.encoding)
+
+    def to_response(self, url):
+        response = build_response('GET', url, 200, self.content, self.headers)
+        if self.encoding is not None:
+            response.encoding = self.encoding
+        return response
+
+
+class HttpCache:
+    """Caches the bodies of GET responses that carry an ETag or Last-Modified validator.
+
+    Core sends the validators of a cached response with If-None-Match and If-Modified-Since, and serves the cached body
+    when the server answers 304 Not Modified, so unchanged resources are not downloaded again.  Entries are kept in
+    memory in least recently used order, up to max_entries entries and max_bytes bytes of bodies.  When a store is
+    given, entries are also written to it and read back from it when they are not in memory, e.g. after a restart.
+
+    Responses are cached per user, share an instance between clients freely."""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, max_entries=10000, store=None):
+        """
+        Args:
+            max_bytes: the maximum total size of the bodies kept in memory
+            max_entries: the maximum number of responses kept in memory
+            store: optional DiskCacheStore, or another object with load, save, delete and clear methods
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.store = store
+        self.__lock = threading.Lock()
+        self.__entries = OrderedDict()
+        self.__bytes = 0
+        self.__stats = HttpCache.__new_stats()
+
+    def get(self, key):
+        """Returns the entry stored under key, or None."""
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                self.__entries.move_to_end(key)
+                return entry
+
+        if self.store is None:
+            return None
+        try:
+            entry = self.store.load(key)
+        except Exception as err:
+            py_jama_rest_client_logger.warning('Unable to read cached response: {}'.format(err))
+            return None
+        if entry is not None:
+            with self.__lock:
+                self.__remember(key, entry)
+        return entry
+
+    def put(self, key, response):
+        """Caches a 200 response if it has a validator and may be stored.  Returns True if it was cached."""
+        cache_control = response.headers.get('Cache-Control', '').lower()
+        if 'no-store' in cache_control or not (response.headers.get('ETag') or response.headers.get('Last-Modified')):
+            return False
+
+        entry = CacheEntry.from_response(response)
+        with self.__lock:
+            self.__remember(key, entry)
+            self.__stats['stores'] += 1
+        if self.store is not None:
+            try:
+                self.store.save(key, entry)
+            except Exception as err:
+                py_jama_rest_client_logger.warning('Unable to store cached response: {}'.format(err))
+        return True
+
+    def refresh(self, key, entry, response):
+        """Merges the headers of response, a 304 Not Modified answer to a revalidation of entry, into the entry
+        stored under key, and returns the updated entry."""
+        entry = entry.updated(response)
+        with self.__lock:
+            self.__remember(key, entry)
+        if self.store is not None:
+            try:
+                self.store.save(key, entry)
+            except Exception as err:
+                py_jama_rest_client_logger.warning('Unable to store cached response: {}'.format(err))
+        return entry
+
+    def invalidate(self, key):
+        """Removes the entry stored under key, if any."""
+        with self.__lock:
+            self.__forget(key)
+        if self.store is not None:
+            self.store.delete(key)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.__bytes = 0
+        if self.store is not None:
+            self.store.clear()
+
+    def count(self, outcome):
+        """Counts a cached request, outcome is 'hits' when the cached body was served and 'misses' otherwise."""
+        with self.__lock:
+            self.__stats[outcome] += 1
+
+    def get_stats(self):
+        """Returns the cache counters:
+        hits: requests answered with 304 and served from the cache
+        misses: requests that downloaded a body
+        stores: responses cached
+        evictions: entries dropped from memory to stay within the limits
+        entries, bytes: what is held in memory now"""
+        with self.__lock:
+            stats = dict(self.__stats)
+            stats['entries'] = len(self.__entries)
+            stats['bytes'] = self.__bytes
+            return stats
+
+    def __remember(self, key, entry):
+        """Adds the entry to memory and evicts the least recently used ones to make room.  Callers must hold the
+        lock."""
+        self.__forget(key)
+        size = len(entry.content)
+        if size > self.max_bytes:
+            return
+        self.__entries[key] = entry
+        self.__bytes += size
+        while len(self.__entries) > self.max_entries or self.__bytes > self.max_bytes:
+            _, evicted = self.__entries.popitem(last=False)
+            self.__bytes -= len(evicted.content)
+            self.__stats['evictions'] += 1
+
+    def __forget(self, key):
+        entry = self.__entries.pop(key, None)
+        if entry is not None:
+            self.__bytes -= len(entry.content)
+
+    @staticmethod
+    def __new_stats():
+        return {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+
+
+class DiskCacheStore:
+    """Keeps cached responses in a directory, one file per response, readable only by the current user.  When max_bytes
+    is set the least recently written files are removed once the directory grows past it.
+
+    The size of the directory is read once, when the store is created, and kept up to date as files are written and
+    removed.  Files that other processes write to the same directory are only counted after a restart."""
+
+    def __init__(self, path, max_bytes=None):
+        """
+        Args:
+            path: the cache directory, created if it does not exist
+            max_bytes: optional limit on the total size of the cached files
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        self.__lock = threading.Lock()
+        # File name to size, least recently written first.
+        self.__files = OrderedDict()
+        self.__bytes = 0
+        if max_bytes is not None:
+            self.__scan()
+
+    def load(self, key):
+        try:
+            with open(self.__file_path(key), 'rb') as cache_file:
+                header = json.loads(cache_file.readline().decode('utf-8'))
+                content = cache_file.read()
+        except FileNotFoundError:
+            return None
+        return CacheEntry(header['headers'], content, encoding=header.get('encoding'),
+                          stored_at=header.get('stored_at'))
+
+    def save(self, key, entry):
+        header = json.dumps({'headers': entry.headers, 'encoding': entry.encoding, 'stored_at': entry.stored_at})
+        header = header.encode('utf-8') + b'\n'
+        fd, temp_path = tempfile.mkstemp(dir=self.path, prefix='.cache-')
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                temp_file.write(header)
+                temp_file.write(entry.content)
+            os.replace(temp_path, self.__file_path(key))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        if self.max_bytes is not None:
+            with self.__lock:
+                name = self.__file_name(key)
+                self.__bytes -= self.__files.pop(name, 0)
+                self.__files[name] = len(header) + len(entry.content)
+                self.__bytes += self.__files[name]
+                self.__trim()
+
+    def delete(self, key):
+        name = self.__file_name(key)
+        try:
+            os.remove(os.path.join(self.path, name))
+        except FileNotFoundError:
+            pass
+        with self.__lock:
+            self.__bytes -= self.__files.pop(name, 0)
+
+    def clear(self):
+        for name in os.listdir(self.path):
+            if name.endswith('.cache'):
+                os.remove(os.path.join(self.path, name))
+        with self.__lock:
+            self.__files.clear()
+            self.__bytes = 0
+
+    def __file_path(self, key):
+        return os.path.join(self.path, self.__file_name(key))
+
+    @staticmethod
+    def __file_name(key):
+        return hashlib.sha256(key.encode('utf-8')).hexdigest() + '.cache'
+
+    def __scan(self):
+        """Reads the names and sizes of the files in the directory, oldest first."""
+        files = []
+        for name in os.listdir(self.path):
+            if name.endswith('.cache'):
+                try:
+                    stat = os.stat(os.path.join(self.path, name))
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, name))
+        for _, size, name in sorted(files):
+            self.__files[name] = size
+            self.__bytes += size
+
+    def __trim(self):
+        """Removes the least recently written files until the directory fits in max_bytes.  Callers must hold the
+        lock."""
+        while self.__bytes > self.max_bytes and self.__files:
+            name, size = self.__files.popitem(last=False)
+            try:
+                os.remove(os.path.join(self.path, name))
+            except FileNotFoundError:
+                pass
+            self.__bytes -= size
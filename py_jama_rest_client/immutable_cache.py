@@ -0,0 +1,133 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+py_jama_rest_client_logger = logging.getLogger('py_jama_rest_client-immutable_cache')
+
+
+class ImmutableCache:
+    """Keeps the results of JamaClient methods that return historical snapshots, which never change once they exist:
+    get_item_version, get_versioned_item, get_abtract_item_version, get_abstract_versioned_item and
+    get_baselines_versioneditems.
+
+    Results are stored in a SQLite database under the sha256 of the user, server and resource they came from, with no
+    expiry, so they are reused across runs and processes.  When the database grows past max_bytes the least recently
+    read results are removed.  Use ':memory:' as the path for a cache that only lives as long as the process.  The
+    database file is created readable by the current user only.
+
+    The total size is read when the cache is opened and kept up to date as results are stored and removed.  Results
+    stored by other processes sharing the database are counted when the cache is next trimmed.
+
+    Thread safe, share one instance between clients freely."""
+
+    def __init__(self, path, max_bytes=1024 * 1024 * 1024):
+        """
+        Args:
+            path: the SQLite database file, created if it does not exist
+            max_bytes: the maximum total size of the cached results
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.__lock = threading.Lock()
+        self.__stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+        if path not in ('', ':memory:'):
+            # SQLite creates missing files with the default permissions, results depend on the user's permissions.
+            os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+        self.__connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.__connection.execute('PRAGMA journal_mode=WAL')
+        self.__connection.execute('CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, '
+                                  'value BLOB NOT NULL, size INTEGER NOT NULL, accessed_at REAL NOT NULL)')
+        self.__connection.execute('CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at)')
+        self.__bytes = self.__total_size()
+
+    def get(self, endpoint, key):
+        """Returns the encoded result stored for the endpoint and key, or None."""
+        digest = ImmutableCache.__digest(endpoint, key)
+        with self.__lock:
+            try:
+                row = self.__connection.execute('SELECT value FROM results WHERE key = ?', (digest,)).fetchone()
+                if row is not None:
+                    self.__connection.execute('UPDATE results SET accessed_at = ? WHERE key = ?',
+                                              (time.time(), digest))
+            except sqlite3.Error as err:
+                py_jama_rest_client_logger.warning('Unable to read cached result: {}'.format(err))
+                row = None
+            self.__stats['hits' if row is not None else 'misses'] += 1
+        return bytes(row[0]) if row is not None else None
+
+    def put(self, endpoint, key, encoded):
+        """Stores the encoded result for the endpoint and key, then removes the least recently read results if the
+        cache is larger than max_bytes."""
+        if isinstance(encoded, str):
+            encoded = encoded.encode('utf-8')
+        if len(encoded) > self.max_bytes:
+            return
+        digest = ImmutableCache.__digest(endpoint, key)
+        with self.__lock:
+            try:
+                replaced = self.__size_of(digest)
+                self.__connection.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)',
+                                          (digest, endpoint, encoded, len(encoded), time.time()))
+                self.__bytes += len(encoded) - replaced
+                self.__stats['stores'] += 1
+                if self.__bytes > self.max_bytes:
+                    self.__trim()
+            except sqlite3.Error as err:
+                py_jama_rest_client_logger.warning('Unable to store cached result: {}'.format(err))
+
+    def invalidate(self, endpoint, key):
+        """Removes the result stored for the endpoint and key, e.g. for a baseline that was deleted."""
+        digest = ImmutableCache.__digest(endpoint, key)
+        with self.__lock:
+            self.__bytes -= self.__size_of(digest)
+            self.__connection.execute('DELETE FROM results WHERE key = ?', (digest,))
+
+    def clear(self):
+        with self.__lock:
+            self.__connection.execute('DELETE FROM results')
+            self.__bytes = 0
+
+    def close(self):
+        with self.__lock:
+            self.__connection.close()
+
+    def get_stats(self):
+        """Returns the cache counters of this instance, hits, misses, stores and evictions, and the number of entries
+        and bytes in the database."""
+        with self.__lock:
+            entries, size = self.__connection.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results').fetchone()
+            stats = dict(self.__stats)
+        stats['entries'] = entries
+        stats['bytes'] = size
+        return stats
+
+    def __total_size(self):
+        return self.__connection.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+
+    def __size_of(self, digest):
+        row = self.__connection.execute('SELECT size FROM results WHERE key = ?', (digest,)).fetchone()
+        return row[0] if row is not None else 0
+
+    def __trim(self):
+        """Removes the least recently read results until the cache fits in max_bytes.  Callers must hold the lock."""
+        # Recount, other processes may have stored or removed results meanwhile.
+        total = self.__bytes = self.__total_size()
+        if total <= self.max_bytes:
+            return
+        rows = self.__connection.execute('SELECT key, size FROM results ORDER BY accessed_at').fetchall()
+        evicted = []
+        for digest, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((digest,))
+            total -= size
+        self.__connection.executemany('DELETE FROM results WHERE key = ?', evicted)
+        self.__bytes = total
+        self.__stats['evictions'] += len(evicted)
+
+    @staticmethod
+    def __digest(endpoint, key):
+        return hashlib.sha256('{}|{}'.format(endpoint, key).encode('utf-8')).hexdigest()
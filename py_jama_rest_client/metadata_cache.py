@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class MetadataCache:
+    """Memoizes the results of JamaClient methods that return rarely changing, schema like data: item types, pick
+    lists and their options, relationship types, relationship rule sets and users.
+
+    Results are kept encoded, every hit decodes a fresh copy, so callers may modify what they get back.  Each entry
+    expires ttl seconds after it was fetched, the ttl can be set per method name.  The least recently used entries are
+    evicted when there are more than max_entries entries or they take more than max_bytes bytes.
+
+    Results are cached per scope, JamaClient uses its user and server as the scope, so one instance can be shared
+    between clients freely.  Thread safe."""
+
+    ENDPOINTS = ('get_item_types', 'get_item_type', 'get_pick_lists', 'get_pick_list_options', 'get_pick_list_option',
+                 'get_relationship_types', 'get_relationship_rule_sets', 'get_users')
+
+    def __init__(self, default_ttl=3600, ttls=None, max_entries=1024, max_bytes=16 * 1024 * 1024):
+        """
+        Args:
+            default_ttl: seconds a result is reused for
+            ttls: optional dictionary of method name to ttl, e.g. {'get_users': 300}, a ttl of 0 disables caching
+            for that method
+            max_entries: the maximum number of results kept
+            max_bytes: the maximum total size of the encoded results kept
+        """
+        unknown = set(ttls or {}) - set(MetadataCache.ENDPOINTS)
+        if unknown:
+            raise ValueError("Unknown endpoints: {}".format(', '.join(sorted(unknown))))
+
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.__lock = threading.Lock()
+        self.__entries = OrderedDict()
+        self.__bytes = 0
+        self.__stats = {}
+
+    def get_ttl(self, endpoint):
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def get(self, endpoint, key, scope=''):
+        """Returns the encoded result cached for the endpoint and key, or None if there is none or it expired.  key is
+        the id argument of the method as a string, '' for methods without one.  scope separates the results of
+        different users and servers."""
+        cached = (endpoint, scope, key)
+        with self.__lock:
+            entry = self.__entries.get(cached)
+            if entry is not None and entry[0] <= time.monotonic():
+                self.__forget(cached)
+                self.__count(endpoint, 'expirations')
+                entry = None
+            if entry is None:
+                self.__count(endpoint, 'misses')
+                return None
+            self.__entries.move_to_end(cached)
+            self.__count(endpoint, 'hits')
+            return entry[1]
+
+    def put(self, endpoint, key, encoded, scope=''):
+        """Caches the encoded result for the endpoint, key and scope, for the endpoint's ttl."""
+        ttl = self.get_ttl(endpoint)
+        if not ttl or len(encoded) > self.max_bytes:
+            return
+        cached = (endpoint, scope, key)
+        with self.__lock:
+            self.__forget(cached)
+            self.__entries[cached] = (time.monotonic() + ttl, encoded)
+            self.__bytes += len(encoded)
+            while len(self.__entries) > self.max_entries or self.__bytes > self.max_bytes:
+                (evicted_endpoint, _, _), (_, evicted) = self.__entries.popitem(last=False)
+                self.__bytes -= len(evicted)
+                self.__count(evicted_endpoint, 'evictions')
+
+    def invalidate(self, endpoint=None, key=None):
+        """Drops cached results, in every scope: all of them, all of one endpoint, or the ones for an endpoint and key.
+        key is the id argument of the method, e.g. the pick list id for get_pick_list_options."""
+        with self.__lock:
+            if endpoint is None:
+                self.__entries.clear()
+                self.__bytes = 0
+                return
+            key = str(key) if key is not None else None
+            for cached in [cached for cached in self.__entries
+                           if cached[0] == endpoint and (key is None or cached[2] == key)]:
+                self.__forget(cached)
+
+    def get_stats(self):
+        """Returns the hits, misses, expirations and evictions of each endpoint, and the number of entries and bytes
+        cached, e.g. {'endpoints': {'get_users': {'hits': 3, ...}}, 'entries': 1, 'bytes': 2048}"""
+        with self.__lock:
+            return {
+                'endpoints': {endpoint: dict(counts) for endpoint, counts in self.__stats.items()},
+                'entries': len(self.__entries),
+                'bytes': self.__bytes,
+            }
+
+    def __forget(self, cached):
+        entry = self.__entries.pop(cached, None)
+        if entry is not None:
+            self.__bytes -= len(entry[1])
+
+    def __count(self, endpoint, outcome):
+        counts = self.__stats.get(endpoint)
+        if counts is None:
+            counts = self.__stats[endpoint] = {'hits': 0, 'misses': 0, 'expirations': 0, 'evictions': 0}
+        counts[outcome] += 1
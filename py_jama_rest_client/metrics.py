@@ -0,0 +1,147 @@
+import bisect
+import re
+import threading
+
+_ID_SEGMENT = re.compile(r'^\d+$')
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def endpoint_template(resource):
+    """Returns the resource path with its ids replaced by {id}, e.g. 'items/{id}/children' for 'items/42/children', so
+    that requests for different objects are counted together."""
+    if not resource:
+        return '/'
+    return '/'.join('{id}' if _ID_SEGMENT.match(segment) else segment for segment in resource.strip('/').split('/'))
+
+
+class MetricsRecorder:
+    """Base class for receivers of Core's request metrics.  Core calls record once for every request it makes,
+    after the last attempt, whether it succeeded or not.  Subclass this to forward metrics to another system, or use
+    MetricsRegistry to keep them in memory."""
+
+    def record(self, endpoint, method, status, latency, request_bytes, response_bytes, retries):
+        """
+        Args:
+            endpoint: the resource path with ids replaced by {id}, see endpoint_template
+            method: the HTTP verb
+            status: the status code of the final response, or the name of the exception that ended the request
+            latency: seconds from the first attempt until the final response, including retries and their backoff
+            request_bytes: the size of the request body
+            response_bytes: the size of the final response body, 0 when it is not known up front
+            retries: the number of attempts after the first
+        """
+        raise NotImplementedError
+
+
+class MetricsRegistry(MetricsRecorder):
+    """Keeps request counters and latency histograms per endpoint and verb in memory.  Thread safe, share one instance
+    between clients to aggregate them.
+
+    Read the metrics with snapshot, or with prometheus_text in the Prometheus text exposition format."""
+
+    def __init__(self, latency_buckets=DEFAULT_LATENCY_BUCKETS, prefix='jama_client'):
+        """
+        Args:
+            latency_buckets: the upper bounds in seconds of the latency histogram buckets
+            prefix: the prefix of the metric names in prometheus_text
+        """
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self.prefix = prefix
+        self.__lock = threading.Lock()
+        self.__series = {}
+
+    def record(self, endpoint, method, status, latency, request_bytes, response_bytes, retries):
+        bucket = bisect.bisect_left(self.latency_buckets, latency)
+        with self.__lock:
+            series = self.__series.get((endpoint, method))
+            if series is None:
+                series = self.__series[(endpoint, method)] = MetricsRegistry.__new_series(self.latency_buckets)
+            series['requests'] += 1
+            series['by_status'][status] = series['by_status'].get(status, 0) + 1
+            series['retries'] += retries
+            series['request_bytes'] += request_bytes
+            series['response_bytes'] += response_bytes
+            series['latency_sum'] += latency
+            series['latency_counts'][bucket] += 1
+
+    def reset(self):
+        with self.__lock:
+            self.__series = {}
+
+    def snapshot(self):
+        """Returns a list with one dictionary per endpoint and verb, sorted by total latency, slowest first:
+        endpoint, method: what was requested
+        requests: the number of requests made
+        by_status: the number of requests by final status code, or exception name
+        retries: the total number of retries
+        request_bytes, response_bytes: the total bytes sent and received in bodies
+        latency_sum: the total seconds spent
+        latency_buckets: a list of (upper bound in seconds, number of requests that took at most that long) pairs,
+        the last upper bound is float('inf')"""
+        with self.__lock:
+            snapshot = []
+            for (endpoint, method), series in self.__series.items():
+                cumulative = 0
+                buckets = []
+                for upper_bound, count in zip(self.latency_buckets + (float('inf'),), series['latency_counts']):
+                    cumulative += count
+                    buckets.append((upper_bound, cumulative))
+                snapshot.append({
+                    'endpoint': endpoint,
+                    'method': method,
+                    'requests': series['requests'],
+                    'by_status': dict(series['by_status']),
+                    'retries': series['retries'],
+                    'request_bytes': series['request_bytes'],
+                    'response_bytes': series['response_bytes'],
+                    'latency_sum': series['latency_sum'],
+                    'latency_buckets': buckets,
+                })
+        snapshot.sort(key=lambda series: series['latency_sum'], reverse=True)
+        return snapshot
+
+    def prometheus_text(self):
+        """Returns the metrics in the Prometheus text exposition format, to serve from a metrics endpoint."""
+        prefix = self.prefix
+        snapshot = self.snapshot()
+        lines = ['# TYPE {}_requests_total counter'.format(prefix)]
+        for series in snapshot:
+            for status, count in sorted(series['by_status'].items(), key=lambda item: str(item[0])):
+                lines.append('{}_requests_total{} {}'.format(prefix, MetricsRegistry.__labels(series, status=status),
+                                                             count))
+        for name in ('retries', 'request_bytes', 'response_bytes'):
+            lines.append('# TYPE {}_{}_total counter'.format(prefix, name))
+            for series in snapshot:
+                lines.append('{}_{}_total{} {}'.format(prefix, name, MetricsRegistry.__labels(series), series[name]))
+
+        lines.append('# TYPE {}_request_duration_seconds histogram'.format(prefix))
+        for series in snapshot:
+            for upper_bound, count in series['latency_buckets']:
+                le = '+Inf' if upper_bound == float('inf') else repr(upper_bound)
+                lines.append('{}_request_duration_seconds_bucket{} {}'.format(
+                    prefix, MetricsRegistry.__labels(series, le=le), count))
+            lines.append('{}_request_duration_seconds_sum{} {!r}'.format(prefix, MetricsRegistry.__labels(series),
+                                                                         series['latency_sum']))
+            lines.append('{}_request_duration_seconds_count{} {}'.format(prefix, MetricsRegistry.__labels(series),
+                                                                        series['requests']))
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def __new_series(latency_buckets):
+        return {
+            'requests': 0,
+            'by_status': {},
+            'retries': 0,
+            'request_bytes': 0,
+            'response_bytes': 0,
+            'latency_sum': 0.0,
+            # One count per bucket plus one for requests slower than the last bucket.
+            'latency_counts': [0] * (len(latency_buckets) + 1),
+        }
+
+    @staticmethod
+    def __labels(series, **extra):
+        labels = [('endpoint', series['endpoint']), ('method', series['method'])] + sorted(extra.items())
+        return '{' + ','.join('{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+                              for name, value in labels) + '}'
@@ -0,0 +1,162 @@
+import logging
+import threading
+import time
+
+py_jama_rest_client_logger = logging.getLogger('py_jama_rest_client-patch_writer')
+
+# Operations that set or remove the value at their path, an operation of one of these kinds makes earlier ones on the
+# same path, or below it, pointless.
+_SETTING_OPS = frozenset(['add', 'replace', 'remove'])
+
+
+def _is_array_index(path):
+    last_segment = path.rsplit('/', 1)[-1]
+    return last_segment == '-' or last_segment.isdigit()
+
+
+def _supersedes(operation, earlier):
+    """Returns True if applying earlier before operation makes no difference to the result."""
+    if operation['op'] not in _SETTING_OPS:
+        return False
+    # Adding or removing an array element shifts the elements after it, so operations on array elements are never
+    # redundant, e.g. two removes of /fields/tags/0 remove two elements.
+    path = operation['path']
+    if _is_array_index(path) or _is_array_index(earlier['path']):
+        return False
+    return earlier['path'] == path or earlier['path'].startswith(path + '/')
+
+
+class PatchWriter:
+    """Buffers JSON patch operations for items and sends them with as few patch_item requests as possible.
+
+    All operations buffered for an item are merged into one request, dropping the ones a later operation on the same
+    path overrides.  Buffered operations are sent, one request per item with up to max_workers requests in parallel,
+    once max_pending operations are buffered, once the oldest has waited max_delay seconds, on flush and on close.
+    Create one with JamaClient.patch_writer and use it as a context manager:
+
+        with client.patch_writer() as writer:
+            writer.add(item_id, [{'op': 'replace', 'path': '/fields/status', 'value': 292}])
+        print(writer.get_errors())
+
+    Thread safe.  Failed requests do not raise, they are collected in get_errors."""
+
+    def __init__(self, client, max_pending=100, max_delay=5.0, max_workers=None, timeout=None):
+        """
+        Args:
+            client: the JamaClient that sends the patches
+            max_pending: the number of buffered operations that triggers a flush
+            max_delay: the number of seconds an operation may stay buffered, None waits for max_pending or flush
+            max_workers: the maximum number of requests in flight, defaults to the client's max_concurrency
+            timeout: the timeout of the requests, defaults to the client's
+        """
+        self.client = client
+        self.max_pending = max_pending
+        self.max_delay = max_delay
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.__lock = threading.Condition()
+        # Flushes are sent one at a time, so the patches for an item arrive in the order they were added.
+        self.__flush_lock = threading.Lock()
+        self.__pending = {}
+        self.__pending_count = 0
+        self.__oldest = None
+        self.__errors = []
+        self.__stats = {'operations': 0, 'superseded': 0, 'requests': 0, 'flushes': 0}
+        self.__closed = False
+        self.__timer = None
+        if max_delay is not None:
+            self.__timer = threading.Thread(target=self.__flush_when_due, name='jama-patch-writer', daemon=True)
+            self.__timer.start()
+
+    def add(self, item_id, patches):
+        """Buffers patch operations for an item, see JamaClient.patch_item for their format.  Flushes when
+        max_pending operations are buffered."""
+        with self.__lock:
+            if self.__closed:
+                raise ValueError("The patch writer is closed")
+            operations = self.__pending.setdefault(item_id, [])
+            for operation in patches:
+                # A move, copy or test depends on the operations before it, never drop anything before one.
+                barrier = max((index + 1 for index, earlier in enumerate(operations)
+                               if earlier['op'] not in _SETTING_OPS), default=0)
+                kept = operations[:barrier] + [earlier for earlier in operations[barrier:]
+                                               if not _supersedes(operation, earlier)]
+                self.__stats['superseded'] += len(operations) - len(kept)
+                self.__pending_count -= len(operations) - len(kept)
+                kept.append(operation)
+                operations[:] = kept
+                self.__pending_count += 1
+                self.__stats['operations'] += 1
+            if self.__oldest is None:
+                self.__oldest = time.monotonic()
+                self.__lock.notify_all()
+            full = self.__pending_count >= self.max_pending
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Sends all buffered operations and returns the errors of the requests that failed, see get_errors."""
+        with self.__flush_lock:
+            with self.__lock:
+                pending = self.__pending
+                self.__pending = {}
+                self.__pending_count = 0
+                self.__oldest = None
+            if not pending:
+                return []
+
+            _, errors = self.client.patch_items_bulk(pending.items(), max_workers=self.max_workers,
+                                                     timeout=self.timeout)
+            with self.__lock:
+                self.__stats['requests'] += len(pending)
+                self.__stats['flushes'] += 1
+                self.__errors.extend(errors)
+            return errors
+
+    def close(self):
+        """Flushes the buffered operations and stops the flush timer."""
+        with self.__lock:
+            self.__closed = True
+            self.__lock.notify_all()
+        if self.__timer is not None:
+            self.__timer.join()
+        self.flush()
+
+    def get_errors(self):
+        """Returns one dictionary per failed request, with the index of the item within its flush, the item as an
+        (item_id, patches) tuple, and the status_code (None for a transport error such as a timeout), message and
+        exception of the failure."""
+        with self.__lock:
+            return list(self.__errors)
+
+    def get_stats(self):
+        """Returns the number of operations added, operations dropped because a later one overrode them, requests
+        sent and flushes, and the number of operations buffered now."""
+        with self.__lock:
+            stats = dict(self.__stats)
+            stats['pending'] = self.__pending_count
+            return stats
+
+    def __flush_when_due(self):
+        while True:
+            with self.__lock:
+                while not self.__closed:
+                    if self.__oldest is None:
+                        self.__lock.wait()
+                        continue
+                    remaining = self.__oldest + self.max_delay - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.__lock.wait(remaining)
+                if self.__closed:
+                    return
+            try:
+                self.flush()
+            except Exception as err:
+                py_jama_rest_client_logger.error('Unable to flush patches: {}'.format(err))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
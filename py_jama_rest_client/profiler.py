@@ -0,0 +1,199 @@
+import contextvars
+import functools
+import inspect
+import json
+import threading
+import time
+
+from .codec import JsonCodec
+
+# The profiler and call tree node that requests and nested calls made in this context belong to.
+_current_node = contextvars.ContextVar('py_jama_rest_client_profile_node', default=(None, None))
+
+
+class ProfileNode:
+    """One node of a profile's call tree: a JamaClient method call, or an HTTP request made by one.
+
+    Method nodes have the wall time spent in the call, and the time their own code spent decoding JSON.  Request
+    nodes have the latency of the request (including retries), its status, body sizes and retry count."""
+
+    def __init__(self, name, kind='call'):
+        self.name = name
+        self.kind = kind
+        self.wall_time = 0.0
+        self.decode_time = 0.0
+        self.status = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.retries = 0
+        self.children = []
+        self.__lock = threading.Lock()
+
+    def add_child(self, node):
+        with self.__lock:
+            self.children.append(node)
+
+    def add_decode_time(self, seconds):
+        with self.__lock:
+            self.decode_time += seconds
+
+    def to_dict(self):
+        """Returns the node and its subtree as a dictionary.  network_time, decode_time, requests and the byte counts
+        are totals over the subtree.  When pages are fetched in parallel network_time can exceed wall_time, it is the
+        sum of the request latencies."""
+        node = {'name': self.name, 'type': self.kind, 'wall_time': self.wall_time}
+        if self.kind == 'request':
+            node.update(status=self.status, network_time=self.wall_time, decode_time=0.0, requests=1,
+                        retries=self.retries, bytes_sent=self.bytes_sent, bytes_received=self.bytes_received)
+            return node
+
+        children = [child.to_dict() for child in list(self.children)]
+        node.update(network_time=sum(child['network_time'] for child in children),
+                    decode_time=self.decode_time + sum(child['decode_time'] for child in children),
+                    requests=sum(child['requests'] for child in children),
+                    retries=sum(child['retries'] for child in children),
+                    bytes_sent=sum(child['bytes_sent'] for child in children),
+                    bytes_received=sum(child['bytes_received'] for child in children),
+                    children=children)
+        return node
+
+
+class Profiler:
+    """Records a call tree of the public JamaClient methods called while it is active, with the requests each of
+    them made.  Create one with JamaClient.profile():
+
+        with client.profile() as profiler:
+            client.get_items(project_id)
+        print(profiler.to_json(indent=2))
+
+    The profiler is only active in the context that entered the with block, and in the worker threads the client
+    starts for calls made there.  Calls made by other threads, or outside of the block, are not recorded.  Profiles
+    may be nested, the calls made in the inner block are only recorded by the inner profiler."""
+
+    def __init__(self):
+        self.root = ProfileNode('profile')
+        self.__started_at = None
+        self.__token = None
+
+    def start(self):
+        self.__token = _current_node.set((self, self.root))
+        self.__started_at = time.perf_counter()
+
+    def stop(self):
+        self.root.wall_time = time.perf_counter() - self.__started_at
+        _current_node.reset(self.__token)
+
+    def to_dict(self):
+        return self.root.to_dict()
+
+    def to_json(self, indent=None):
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_folded(self):
+        """Returns the call tree as folded stacks, one 'caller;callee;request microseconds' line per distinct stack,
+        the input format of flamegraph.pl and speedscope.  Each stack is weighted by the time spent in it and not in
+        its children.  Requests made in parallel are counted in full, so the total can exceed the wall time."""
+        stacks = {}
+        Profiler.__fold(self.root, '', stacks)
+        return '\n'.join('{} {}'.format(stack, microseconds) for stack, microseconds in stacks.items()
+                         if microseconds > 0) + '\n'
+
+    @staticmethod
+    def __fold(node, prefix, stacks):
+        stack = prefix + node.name.replace(';', ':').replace(' ', '_')
+        children_time = 0.0
+        for child in list(node.children):
+            children_time += child.wall_time
+            Profiler.__fold(child, stack + ';', stacks)
+        self_time = max(0.0, node.wall_time - children_time) if node.kind != 'request' else node.wall_time
+        stacks[stack] = stacks.get(stack, 0) + int(self_time * 1000000)
+
+
+def is_profiling():
+    """Returns True if a profiler is active in the current context."""
+    return _current_node.get()[0] is not None
+
+
+def record_request(endpoint, method, status, latency, request_bytes, response_bytes, retries):
+    """Adds a request node to the current node of the profiler active in the current context, if there is one."""
+    profiler, parent = _current_node.get()
+    if profiler is None:
+        return
+    node = ProfileNode('{} {}'.format(method, endpoint), kind='request')
+    node.wall_time = latency
+    node.status = status
+    node.bytes_sent = request_bytes
+    node.bytes_received = response_bytes
+    node.retries = retries
+    parent.add_child(node)
+
+
+def instrument(cls, names):
+    """Replaces the named methods of the class with versions that add a call tree node to the profiler active in the
+    caller's context, and otherwise only call the method."""
+    for name in names:
+        setattr(cls, name, _profiled(name, getattr(cls, name)))
+
+
+def _profiled(name, method):
+    @functools.wraps(method)
+    def profiled(*args, **kwargs):
+        profiler, parent = _current_node.get()
+        if profiler is None:
+            return method(*args, **kwargs)
+        node = ProfileNode(name)
+        parent.add_child(node)
+        token = _current_node.set((profiler, node))
+        started_at = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        finally:
+            node.wall_time += time.perf_counter() - started_at
+            _current_node.reset(token)
+        if inspect.isgenerator(result):
+            return _profiled_generator(profiler, node, result)
+        return result
+    return profiled
+
+
+def _profiled_generator(profiler, node, generator):
+    """Generators do their work while they are iterated, attribute each step to the call's node."""
+    try:
+        while True:
+            token = _current_node.set((profiler, node))
+            started_at = time.perf_counter()
+            try:
+                item = next(generator)
+            except StopIteration:
+                return
+            finally:
+                node.wall_time += time.perf_counter() - started_at
+                _current_node.reset(token)
+            yield item
+    finally:
+        generator.close()
+
+
+class ProfilingCodec(JsonCodec):
+    """Delegates to another codec, adding the time spent decoding responses to the current node of the profiler
+    active in the current context, if there is one."""
+
+    def __init__(self, codec):
+        self.__codec = codec
+        self.name = codec.name
+
+    def dumps(self, obj):
+        return self.__codec.dumps(obj)
+
+    def loads(self, data):
+        return self.__codec.loads(data)
+
+    def decode(self, response):
+        _, node = _current_node.get()
+        if node is None:
+            return self.__codec.decode(response)
+        started_at = time.perf_counter()
+        try:
+            return self.__codec.decode(response)
+        finally:
+            node.add_decode_time(time.perf_counter() - started_at)
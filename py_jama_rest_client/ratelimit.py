@@ -0,0 +1,118 @@
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class TokenBucket:
+    """A thread safe token bucket rate limiter.  Tokens are added at rate tokens per second up to burst tokens, every
+    request takes one token and waits for one to become available if the bucket is empty.
+
+    Share one instance between clients to hold their combined request rate under the server limit."""
+
+    def __init__(self, rate, burst=None):
+        """
+        Args:
+            rate: the sustained number of requests per second
+            burst: the maximum number of requests that may be made at once after a quiet period, defaults to rate
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be greater than 0")
+
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        if self.burst < 1:
+            raise ValueError("Burst must be at least 1")
+
+        self.__lock = threading.Lock()
+        self.__tokens = self.burst
+        self.__updated_at = time.monotonic()
+
+    def acquire(self):
+        """Takes one token from the bucket, blocking until one is available.  Returns the time spent waiting."""
+        waited = 0.0
+        while True:
+            with self.__lock:
+                now = time.monotonic()
+                self.__tokens = min(self.burst, self.__tokens + (now - self.__updated_at) * self.rate)
+                self.__updated_at = now
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return waited
+                wait = (1 - self.__tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+class FileTokenBucket:
+    """A token bucket whose state is kept in a file, so that processes on the same host can share one rate limit.
+
+    Every acquire takes an exclusive advisory lock (flock) on the file while it updates the bucket.  The file is
+    created if it does not exist.  Only available on POSIX systems."""
+
+    def __init__(self, path, rate, burst=None):
+        """
+        Args:
+            path: the file that holds the bucket state, every process sharing the limit must use the same path
+            rate: the sustained number of requests per second
+            burst: the maximum number of requests that may be made at once after a quiet period, defaults to rate
+        """
+        if fcntl is None:
+            raise NotImplementedError("FileTokenBucket requires fcntl, which is not available on this platform")
+        if rate <= 0:
+            raise ValueError("Rate must be greater than 0")
+
+        self.path = path
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        if self.burst < 1:
+            raise ValueError("Burst must be at least 1")
+
+    def acquire(self):
+        """Takes one token from the bucket, blocking until one is available.  Returns the time spent waiting."""
+        waited = 0.0
+        while True:
+            wait = self.__try_acquire()
+            if wait == 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    def __try_acquire(self):
+        """Takes a token if one is available and returns 0, otherwise returns how long until one will be."""
+        # Each call opens its own file description, flock then also serializes threads within this process.
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            # Wall clock time, monotonic clocks are not comparable between processes.
+            now = time.time()
+            tokens, updated_at = self.__read_state(fd, now)
+            tokens = min(self.burst, tokens + max(0.0, now - updated_at) * self.rate)
+
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / self.rate
+
+            state = '{!r} {!r}'.format(tokens, now).encode('ascii')
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, state)
+            return wait
+        finally:
+            os.close(fd)
+
+    def __read_state(self, fd, now):
+        os.lseek(fd, 0, os.SEEK_SET)
+        content = os.read(fd, 64)
+        try:
+            tokens, updated_at = content.decode('ascii').split()
+            return float(tokens), float(updated_at)
+        except ValueError:
+            # A new (or unreadable) file starts out full.
+            return self.burst, now
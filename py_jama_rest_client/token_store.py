@@ -0,0 +1,92 @@
+import json
+import logging
+import os
+import tempfile
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+py_jama_rest_client_logger = logging.getLogger('py_jama_rest_client-token_store')
+
+
+class TokenStore:
+    """Base class for OAuth token caches.  Core stores every token it fetches under a key made of the token host and
+    the client id, and reuses a stored token that is still valid instead of fetching a new one.
+
+    Tokens are dictionaries with the entries 'access_token', 'expires_in' and 'acquired_at' (epoch seconds).  Subclass
+    this and implement load, save and delete to keep tokens somewhere else, e.g. a shared cache service."""
+
+    def load(self, key):
+        """Returns the token stored under key, or None."""
+        raise NotImplementedError
+
+    def save(self, key, token):
+        """Stores token under key, replacing any previous token."""
+        raise NotImplementedError
+
+    def delete(self, key):
+        """Removes the token stored under key, if there is one."""
+        raise NotImplementedError
+
+
+class FileTokenStore(TokenStore):
+    """Keeps tokens in a JSON file that only the current user can read or write.  Safe to share between processes,
+    updates are made under an advisory lock where available and written atomically."""
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path: the token file, defaults to ~/.py_jama_rest_client/tokens.json
+        """
+        if path is None:
+            path = os.path.join(os.path.expanduser('~'), '.py_jama_rest_client', 'tokens.json')
+        self.path = path
+
+    def load(self, key):
+        return self.__read().get(key)
+
+    def save(self, key, token):
+        self.__update(key, token)
+
+    def delete(self, key):
+        self.__update(key, None)
+
+    def __read(self):
+        try:
+            with open(self.path, 'r') as token_file:
+                return json.load(token_file)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            py_jama_rest_client_logger.warning('Ignoring unreadable token file {}'.format(self.path))
+            return {}
+
+    def __update(self, key, token):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        lock_fd = os.open(self.path + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+
+            tokens = self.__read()
+            if token is None:
+                if tokens.pop(key, None) is None:
+                    return
+            else:
+                tokens[key] = token
+
+            # mkstemp creates the file with 0600 permissions, replace the old file only once it is fully written.
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.tokens-')
+            try:
+                with os.fdopen(fd, 'w') as temp_file:
+                    json.dump(tokens, temp_file)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        finally:
+            os.close(lock_fd)
@@ -0,0 +1,291 @@
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+class Transport:
+    """Base class for the layer that sends Core's HTTP requests.  Core calls request for every request it makes,
+    including OAuth token requests, and close when it is closed.
+
+    request takes the arguments of requests.Session.request and returns a requests.Response.  Connection failures and
+    timeouts should be raised as requests.exceptions.ConnectionError and requests.exceptions.Timeout, which Core
+    retries when its retry policy allows."""
+
+    def request(self, method, url, **kwargs):
+        """Sends the request and returns the response."""
+        raise NotImplementedError
+
+    def close(self):
+        """Releases any connections held by this transport."""
+        pass
+
+
+class RequestsTransport(Transport):
+    """Sends requests over a pooled requests.Session, this is the transport Core uses by default."""
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True):
+        """
+        Args:
+            pool_connections: the number of hosts to keep connection pools for
+            pool_maxsize: the number of connections kept open per host
+            pool_block: when True, requests wait for a free connection instead of opening an extra one that is thrown
+            away afterwards
+            keep_alive: when False, connections are closed after every request
+        """
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+
+    def request(self, method, url, **kwargs):
+        return self.session.request(method, url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+class FakeTransport(Transport):
+    """An in-memory transport that answers requests from canned responses without any network access.
+
+    Register responses with add, keyed by verb and URL path, or pass a handler that builds responses for requests
+    that have no canned response.  Every request received is appended to requests for inspection.  Requests matching
+    neither get a 404 response."""
+
+    def __init__(self, handler=None):
+        """
+        Args:
+            handler: optional function called as handler(method, url, params, body) for requests without a canned
+            response, it returns a (status_code, body, headers) tuple or None for a 404.  body is bytes, str, or an
+            object that is encoded as JSON.
+        """
+        self.handler = handler
+        self.requests = []
+        self.__routes = {}
+        self.__lock = threading.Lock()
+
+    def add(self, method, path, body=None, status_code=200, headers=None):
+        """Answers every method request to the URL path (e.g. '/rest/v1/items/1') with the given response.  body is
+        bytes, str, or an object that is encoded as JSON."""
+        self.__routes[(method.upper(), path)] = (status_code, body, headers)
+
+    def request(self, method, url, params=None, data=None, json=None, **kwargs):
+        body = data if json is None else json
+        with self.__lock:
+            self.requests.append({'method': method, 'url': url, 'params': params, 'body': body})
+
+        route = self.__routes.get((method.upper(), urlsplit(url).path))
+        if route is None and self.handler is not None:
+            route = self.handler(method, url, params, body)
+        if route is None:
+            route = (404, {'meta': {'status': 'Not Found', 'message': 'No fake response for this request'}}, None)
+
+        status_code, body, headers = route
+        if body is not None and not isinstance(body, (bytes, str)):
+            body = _dumps(body)
+            headers = dict(headers or {})
+            headers.setdefault('Content-Type', 'application/json')
+        return build_response(method, url, status_code, body, headers)
+
+
+class RecordingNotFoundException(LookupError):
+    """This exception is raised when a replaying RecordReplayTransport has no recording for a request."""
+    pass
+
+
+class RecordReplayTransport(Transport):
+    """Records request and response pairs to a directory, and replays them later without network access.
+
+    Requests are matched on verb, URL, query parameters and body, never on credentials.  When the same request is
+    recorded several times, the responses are replayed in the order they were recorded, the last one repeating.
+    Recordings are written readable by the current user only, with OAuth access tokens and Authorization headers
+    replaced by a placeholder, which is all a replaying client needs.
+
+    Modes:
+        'record': send every request with the wrapped transport and save the responses, replacing older recordings
+        'replay': answer every request from the recordings, raising RecordingNotFoundException when there is none
+        'auto': replay the requests that have recordings, record the others
+    """
+
+    MODES = ('record', 'replay', 'auto')
+    REDACTED = 'REDACTED'
+
+    def __init__(self, path, mode='replay', transport=None):
+        """
+        Args:
+            path: the directory holding the recordings, created if it does not exist
+            mode: 'record', 'replay' or 'auto'
+            transport: the transport that sends requests when recording, defaults to a RequestsTransport
+        """
+        if mode not in RecordReplayTransport.MODES:
+            raise ValueError("Mode must be one of {}".format(', '.join(RecordReplayTransport.MODES)))
+
+        self.path = path
+        self.mode = mode
+        self.__transport = transport
+        if self.__transport is None and mode != 'replay':
+            self.__transport = RequestsTransport()
+        self.__lock = threading.Lock()
+        self.__replayed = {}
+        self.__recorded = set()
+        os.makedirs(path, mode=0o700, exist_ok=True)
+
+    def request(self, method, url, params=None, data=None, json=None, files=None, **kwargs):
+        key = RecordReplayTransport.__key(method, url, params, data, json, files)
+        file_path = os.path.join(self.path, key + '.json')
+
+        if self.mode != 'record':
+            with self.__lock:
+                recording = self.__load(file_path)
+                if recording is not None or self.mode == 'replay':
+                    if recording is None:
+                        raise RecordingNotFoundException('No recording for {} {}'.format(method, url))
+                    index = self.__replayed.get(key, 0)
+                    self.__replayed[key] = index + 1
+                    responses = recording['responses']
+                    return RecordReplayTransport.__to_response(method, url, responses[min(index, len(responses) - 1)])
+
+        response = self.__transport.request(method, url, params=params, data=data, json=json, files=files, **kwargs)
+        with self.__lock:
+            recording = None
+            if key in self.__recorded:
+                recording = self.__load(file_path)
+            if recording is None:
+                recording = {
+                    'request': {'method': method, 'url': url, 'params': _jsonable(params)},
+                    'responses': [],
+                }
+            recording['responses'].append(RecordReplayTransport.__from_response(response))
+            self.__save(file_path, recording)
+            self.__recorded.add(key)
+        return response
+
+    def close(self):
+        if self.__transport is not None:
+            self.__transport.close()
+
+    @staticmethod
+    def __key(method, url, params, data, json, files):
+        parts = [method.upper(), url, _dumps(_jsonable(params), sort_keys=True)]
+        if json is not None:
+            parts.append(_dumps(json, sort_keys=True))
+        elif isinstance(data, dict):
+            parts.append(_dumps(data, sort_keys=True))
+        elif isinstance(data, str):
+            parts.append(data)
+        elif isinstance(data, bytes):
+            parts.append(base64.b64encode(data).decode('ascii'))
+        if files is not None:
+            # Uploads are matched on their field names, the file contents are not read.
+            parts.append(_dumps(sorted(files), sort_keys=True))
+        return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def __from_response(response):
+        headers = {}
+        for name, value in response.headers.items():
+            # Cookies may carry a session, they are not needed to replay responses.
+            if name.lower() == 'set-cookie':
+                continue
+            headers[name] = RecordReplayTransport.REDACTED if name.lower() == 'authorization' else value
+        recorded = {
+            'status_code': response.status_code,
+            'reason': response.reason,
+            'headers': headers,
+        }
+        content = response.content
+        try:
+            recorded['body'] = RecordReplayTransport.__redact_body(content.decode('utf-8'))
+        except UnicodeDecodeError:
+            recorded['body_base64'] = base64.b64encode(content).decode('ascii')
+        return recorded
+
+    @staticmethod
+    def __redact_body(body):
+        """Replaces the access token of an OAuth token response with a placeholder, other bodies are kept as is."""
+        if 'access_token' not in body:
+            return body
+        try:
+            document = json.loads(body)
+        except ValueError:
+            return body
+        if not isinstance(document, dict) or 'access_token' not in document:
+            return body
+        document['access_token'] = RecordReplayTransport.REDACTED
+        return json.dumps(document)
+
+    @staticmethod
+    def __to_response(method, url, recorded):
+        if 'body_base64' in recorded:
+            body = base64.b64decode(recorded['body_base64'])
+        else:
+            body = recorded['body'].encode('utf-8')
+        return build_response(method, url, recorded['status_code'], body, recorded['headers'],
+                              reason=recorded.get('reason'))
+
+    @staticmethod
+    def __load(file_path):
+        try:
+            with open(file_path, 'r') as recording_file:
+                return json.load(recording_file)
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def __save(file_path, recording):
+        # mkstemp creates the file with 0600 permissions, replace the old file only once it is fully written.
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), prefix='.recording-')
+        try:
+            with os.fdopen(fd, 'w') as recording_file:
+                json.dump(recording, recording_file, indent=2, sort_keys=True)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+def build_response(method, url, status_code, body=None, headers=None, reason=None):
+    """Returns a requests.Response with the given status, body and headers, as if it had been read from the network."""
+    if body is None:
+        body = b''
+    elif isinstance(body, str):
+        body = body.encode('utf-8')
+
+    if reason is None:
+        try:
+            reason = HTTPStatus(status_code).phrase
+        except ValueError:
+            reason = ''
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = reason
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.headers.setdefault('Content-Length', str(len(body)))
+    response.url = url
+    response.encoding = 'utf-8'
+    response.request = requests.Request(method, url).prepare()
+    response._content = body
+    response._content_consumed = True
+    return response
+
+
+def _jsonable(params):
+    """Query parameters as a JSON serializable dictionary, lists and tuples become lists."""
+    if params is None:
+        return None
+    return {str(k): list(v) if isinstance(v, (list, tuple)) else v for k, v in params.items()}
+
+
+def _dumps(obj, sort_keys=False):
+    return json.dumps(obj, sort_keys=sort_keys, default=str)
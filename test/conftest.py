@@ -0,0 +1,35 @@
+import json
+import os
+
+import pytest
+
+# Filled by the benchmark tests, reported at the end of the run.
+BENCHMARK_RESULTS = []
+
+
+@pytest.fixture(scope='session')
+def benchmark_results():
+    """The list benchmark tests append their measurements to, one dictionary per run."""
+    return BENCHMARK_RESULTS
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not BENCHMARK_RESULTS:
+        return
+
+    terminalreporter.section('benchmarks')
+    columns = ['name', 'page_size', 'concurrency', 'items', 'items_per_second', 'peak_memory_kb', 'requests']
+    terminalreporter.write_line(''.join('{:>18}'.format(column) for column in columns))
+    for result in BENCHMARK_RESULTS:
+        row = []
+        for column in columns:
+            value = result[column]
+            row.append('{:>18.1f}'.format(value) if isinstance(value, float) else '{:>18}'.format(value))
+        terminalreporter.write_line(''.join(row))
+
+    # Set JAMA_BENCHMARK_OUTPUT to keep the measurements, e.g. to compare runs in CI.
+    output_path = os.environ.get('JAMA_BENCHMARK_OUTPUT')
+    if output_path:
+        with open(output_path, 'w') as output_file:
+            json.dump(BENCHMARK_RESULTS, output_file, indent=2)
+        terminalreporter.write_line('Benchmark results written to {}'.format(output_path))
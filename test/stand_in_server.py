@@ -0,0 +1,314 @@
+"""A local stand-in for the parts of the Jama REST API that the paged client methods use.
+
+The server answers the items, relationships and filter results endpoints with generated data of a realistic size,
+paged the way Jama pages them, and issues OAuth tokens.  Latency and throttling (429 responses) can be injected to
+see how the client behaves against a slow or busy server.  Throttling is deterministic, every nth API request is
+answered with 429, so that runs can be compared.
+
+Run it on its own with `python -m test.stand_in_server --port 8080`, or start it from a test with JamaStandInServer,
+which runs it in a separate process so that it does not share the GIL or the memory statistics of the client."""
+
+import argparse
+import json
+import multiprocessing
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from urllib.request import urlopen
+
+API_PREFIX = '/rest/v1/'
+STATS_PATH = '/__stand_in__/stats'
+MAX_RESULTS = 50
+
+
+class StandInData:
+    """The generated content of the server.  Every project has the same number of items and relationships, and every
+    filter returns the same number of items.  description_size is the size in characters of each item's rich text
+    description, which makes up most of the payload, as it does for real requirements."""
+
+    def __init__(self, items_per_project=1000, relationships_per_project=1000, filter_results=1000,
+                 description_size=1500):
+        self.items_per_project = items_per_project
+        self.relationships_per_project = relationships_per_project
+        self.filter_results = filter_results
+        self.description_size = description_size
+
+    def item(self, project_id, index):
+        item_id = project_id * 1000000 + index
+        description = '<p>' + ('Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' *
+                               (self.description_size // 57 + 1))[:self.description_size] + '</p>'
+        return {
+            'id': item_id,
+            'documentKey': 'PRJ{}-REQ-{}'.format(project_id, index + 1),
+            'globalId': 'GID-{}'.format(item_id),
+            'itemType': 24,
+            'project': project_id,
+            'createdDate': '2020-01-01T00:00:00.000+0000',
+            'modifiedDate': '2020-06-01T12:00:00.000+0000',
+            'lastActivityDate': '2020-06-01T12:00:00.000+0000',
+            'createdBy': 18,
+            'modifiedBy': 18,
+            'fields': {
+                'documentKey': 'PRJ{}-REQ-{}'.format(project_id, index + 1),
+                'globalId': 'GID-{}'.format(item_id),
+                'name': 'Requirement {}'.format(index + 1),
+                'description': description,
+                'status': 292,
+                'priority': 305,
+                'release': None,
+            },
+            'resources': {
+                'self': {'allowed': ['GET', 'PUT', 'PATCH', 'DELETE']}
+            },
+            'location': {
+                'sortOrder': index,
+                'globalSortOrder': index,
+                'sequence': '1.{}'.format(index + 1),
+                'parent': {'item': project_id * 1000000}
+            },
+            'lock': {'locked': False, 'lastLockedDate': None},
+            'type': 'items'
+        }
+
+    def relationship(self, project_id, index):
+        base = project_id * 1000000
+        return {
+            'id': base + index,
+            'fromItem': base + index,
+            'toItem': base + (index + 1) % max(1, self.items_per_project),
+            'relationshipType': 4,
+            'suspect': False,
+            'type': 'relationships'
+        }
+
+    def page(self, resource, owner_id, start_at, max_results):
+        """Returns the body of one page of the resource as a dictionary."""
+        if resource == 'items':
+            total, build = self.items_per_project, self.item
+        elif resource == 'relationships':
+            total, build = self.relationships_per_project, self.relationship
+        else:
+            total, build = self.filter_results, self.item
+
+        max_results = min(max_results, MAX_RESULTS)
+        data = [build(owner_id, index) for index in range(start_at, min(start_at + max_results, total))]
+        return {
+            'meta': {
+                'status': 'OK',
+                'timestamp': '2020-06-01T12:00:00.000+0000',
+                'pageInfo': {
+                    'startIndex': start_at,
+                    'resultCount': len(data),
+                    'totalResults': total
+                }
+            },
+            'links': {},
+            'data': data
+        }
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Handles one connection.  The server settings are attributes of the server: data, latency, throttle_every,
+    retry_after and the request statistics."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super(StandInHandler, self).setup()
+        # Headers and body are written separately, without this Nagle's algorithm delays small responses.
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == STATS_PATH:
+            return self.__send_json(200, self.server.get_stats(), count=False)
+
+        query = parse_qs(url.query)
+        self.__delay()
+        if self.server.next_request_throttled():
+            return self.__send_json(429, {'meta': {'status': 'Too Many Requests', 'message': 'Slow down'}},
+                                    headers={'Retry-After': str(self.server.retry_after)})
+
+        parts = url.path[len(API_PREFIX):].strip('/').split('/') if url.path.startswith(API_PREFIX) else []
+        start_at = int(query.get('startAt', ['0'])[0])
+        max_results = int(query.get('maxResults', ['20'])[0])
+        data = self.server.data
+
+        if parts == ['items'] and 'project' in query:
+            return self.__send_json(200, data.page('items', int(query['project'][0]), start_at, max_results))
+        if parts == ['relationships'] and 'project' in query:
+            return self.__send_json(200, data.page('relationships', int(query['project'][0]), start_at,
+                                                   max_results))
+        if len(parts) == 3 and parts[0] == 'filters' and parts[2] == 'results':
+            return self.__send_json(200, data.page('filters', int(parts[1]), start_at, max_results))
+        if len(parts) == 2 and parts[0] == 'items':
+            item_id = int(parts[1])
+            return self.__send_json(200, {'meta': {'status': 'OK'},
+                                          'data': data.item(item_id // 1000000, item_id % 1000000)})
+
+        self.__send_json(404, {'meta': {'status': 'Not Found', 'message': 'Resource not found'}})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if urlsplit(self.path).path == STATS_PATH:
+            self.server.reset_stats()
+            return self.__send_json(200, {}, count=False)
+        if urlsplit(self.path).path == '/rest/oauth/token':
+            self.__delay()
+            return self.__send_json(200, {'access_token': 'stand-in-token', 'token_type': 'bearer',
+                                          'expires_in': 3600, 'scope': 'read write'})
+        self.__send_json(404, {'meta': {'status': 'Not Found', 'message': 'Resource not found'}})
+
+    def __delay(self):
+        if self.server.latency > 0:
+            time.sleep(self.server.latency)
+
+    def __send_json(self, status, body, headers=None, count=True):
+        content = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+        if count:
+            self.server.count_request(status, len(content))
+
+
+class StandInHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, data=None, latency=0.0, throttle_every=0, retry_after=0):
+        super(StandInHTTPServer, self).__init__(address, StandInHandler)
+        self.data = data if data is not None else StandInData()
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.__stats_lock = threading.Lock()
+        self.__received = 0
+        self.reset_stats()
+
+    def next_request_throttled(self):
+        with self.__stats_lock:
+            self.__received += 1
+            return self.throttle_every > 0 and self.__received % self.throttle_every == 0
+
+    def count_request(self, status, response_bytes):
+        with self.__stats_lock:
+            self.__stats['requests'] += 1
+            self.__stats['response_bytes'] += response_bytes
+            by_status = self.__stats['by_status']
+            by_status[str(status)] = by_status.get(str(status), 0) + 1
+
+    def get_stats(self):
+        with self.__stats_lock:
+            return {'requests': self.__stats['requests'], 'response_bytes': self.__stats['response_bytes'],
+                    'by_status': dict(self.__stats['by_status'])}
+
+    def reset_stats(self):
+        with self.__stats_lock:
+            self.__stats = {'requests': 0, 'response_bytes': 0, 'by_status': {}}
+
+
+def serve(port, settings, ready=None):
+    """Runs the server until the process ends.  When ready is a multiprocessing connection the port is sent to it once
+    the server is listening."""
+    server = StandInHTTPServer(('127.0.0.1', port), data=StandInData(**settings.get('data', {})),
+                               latency=settings.get('latency', 0.0),
+                               throttle_every=settings.get('throttle_every', 0),
+                               retry_after=settings.get('retry_after', 0))
+    if ready is not None:
+        ready.send(server.server_address[1])
+        ready.close()
+    server.serve_forever()
+
+
+class JamaStandInServer:
+    """Runs the stand-in server in a child process.  Use it as a context manager, or call start and stop.
+
+    Args:
+        items_per_project, relationships_per_project, filter_results, description_size: see StandInData
+        latency: seconds added to every API request
+        throttle_every: answer every nth API request with 429, 0 never does
+        retry_after: the Retry-After header value sent with 429 responses
+    """
+
+    def __init__(self, latency=0.0, throttle_every=0, retry_after=0, **data):
+        self.settings = {
+            'latency': latency,
+            'throttle_every': throttle_every,
+            'retry_after': retry_after,
+            'data': data,
+        }
+        self.url = None
+        self.__process = None
+
+    def start(self):
+        context = multiprocessing.get_context('spawn')
+        receiver, sender = context.Pipe(duplex=False)
+        self.__process = context.Process(target=serve, args=(0, self.settings, sender), daemon=True)
+        self.__process.start()
+        sender.close()
+        if not receiver.poll(30):
+            self.stop()
+            raise RuntimeError('The stand-in server did not start')
+        self.url = 'http://127.0.0.1:{}'.format(receiver.recv())
+        receiver.close()
+        return self
+
+    def stop(self):
+        if self.__process is not None:
+            self.__process.terminate()
+            self.__process.join()
+            self.__process = None
+
+    def get_stats(self):
+        """Returns the number of API requests answered, their total response size and their count by status."""
+        with urlopen(self.url + STATS_PATH) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+    def reset_stats(self):
+        urlopen(self.url + STATS_PATH, data=b'').close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Runs a local stand-in for the Jama REST API.')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--items-per-project', type=int, default=1000)
+    parser.add_argument('--relationships-per-project', type=int, default=1000)
+    parser.add_argument('--filter-results', type=int, default=1000)
+    parser.add_argument('--description-size', type=int, default=1500)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every request')
+    parser.add_argument('--throttle-every', type=int, default=0, help='answer every nth request with 429')
+    parser.add_argument('--retry-after', type=int, default=0)
+    args = parser.parse_args()
+
+    settings = {
+        'latency': args.latency,
+        'throttle_every': args.throttle_every,
+        'retry_after': args.retry_after,
+        'data': {
+            'items_per_project': args.items_per_project,
+            'relationships_per_project': args.relationships_per_project,
+            'filter_results': args.filter_results,
+            'description_size': args.description_size,
+        }
+    }
+    print('Serving the Jama stand-in on http://127.0.0.1:{}'.format(args.port))
+    serve(args.port, settings)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Offline tests for AsyncJamaClient, run against the local stand-in server."""
+
+import asyncio
+import socket
+from unittest import TestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from py_jama_rest_client.async_client import AsyncJamaClient
+from py_jama_rest_client.client import APIException, TooManyRequestsException
+
+from .stand_in_server import JamaStandInServer
+
+
+class TestAsyncJamaClient(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Every third request is throttled, without retries the third page fails.
+        cls.server = JamaStandInServer(latency=0.01, throttle_every=3, items_per_project=200).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test_failed_page_cancels_the_others(self):
+        async def run():
+            async with AsyncJamaClient(self.server.url, ('username', 'password'), max_concurrency=4) as client:
+                with self.assertRaises(TooManyRequestsException):
+                    await client.get_items(1, allowed_results_per_page=20)
+                # The pages that were in flight have been cancelled and awaited.
+                return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+        self.assertEqual(asyncio.run(run()), [])
+
+    def test_connection_error(self):
+        with socket.socket() as unused:
+            unused.bind(('127.0.0.1', 0))
+            url = 'http://127.0.0.1:{}'.format(unused.getsockname()[1])
+
+        async def run():
+            async with AsyncJamaClient(url, ('username', 'password')) as client:
+                await client.get_item(1)
+
+        with self.assertRaises(APIException) as raised:
+            asyncio.run(run())
+        self.assertIsNone(raised.exception.status_code)
+
+
+class TestAsyncPaging(TestCase):
+
+    def get_items(self, page_size, max_concurrency, start_offset=0, total=45):
+        """Returns the items of project 1 and the sorted startAt of every request, from a server that serves total
+        items, at most page_size(start_at) of them per page whatever maxResults asks for."""
+        start_indexes = []
+
+        async def items(request):
+            start_at = int(request.query['startAt'])
+            start_indexes.append(start_at)
+            limit = min(start_at + int(request.query['maxResults']), start_at + page_size(start_at), total)
+            data = [{'id': i} for i in range(start_at, limit)]
+            page_info = {'startIndex': start_at + start_offset, 'resultCount': len(data), 'totalResults': total}
+            return web.json_response({'meta': {'status': 'OK', 'pageInfo': page_info}, 'data': data})
+
+        async def run():
+            app = web.Application()
+            app.router.add_get('/rest/v1/items', items)
+            async with TestServer(app, host='127.0.0.1') as server:
+                url = 'http://{}:{}'.format(server.host, server.port)
+                async with AsyncJamaClient(url, ('username', 'password'), max_concurrency=max_concurrency) as client:
+                    return await client.get_items(1, allowed_results_per_page=20)
+
+        return asyncio.run(run()), sorted(start_indexes)
+
+    def test_short_pages(self):
+        for max_concurrency in (1, 4):
+            # A full first page, then 13 of the 20 results asked for at offset 20.
+            items, start_indexes = self.get_items(lambda start_at: 13 if start_at == 20 else 50, max_concurrency)
+            self.assertEqual([item['id'] for item in items], list(range(45)))
+            self.assertEqual(start_indexes, [0, 20, 33, 40])
+
+            items, start_indexes = self.get_items(lambda start_at: 7, max_concurrency)
+            self.assertEqual([item['id'] for item in items], list(range(45)))
+            self.assertEqual(start_indexes, [0, 7, 14, 20, 27, 34, 40])
+
+    def test_unexpected_start_index(self):
+        with self.assertRaises(APIException):
+            self.get_items(lambda start_at: 50, 1, start_offset=1)
@@ -0,0 +1,48 @@
+import asyncio
+import os
+from unittest import TestCase
+
+from py_jama_rest_client.async_client import AsyncJamaClient
+from py_jama_rest_client.client import JamaClient, ResourceNotFoundException
+
+
+class TestAsyncJamaClient(TestCase):
+    jama_url = os.environ['JAMA_API_URL']
+    jama_api_username = os.environ['JAMA_API_USERNAME']
+    jama_api_password = os.environ['JAMA_API_PASSWORD']
+    jama_client = JamaClient(jama_url, (jama_api_username, jama_api_password))
+
+    def run_with_client(self, coroutine_function, **kwargs):
+        async def run():
+            async with AsyncJamaClient(self.jama_url, (self.jama_api_username, self.jama_api_password),
+                                       **kwargs) as client:
+                return await coroutine_function(client)
+        return asyncio.run(run())
+
+    def test_get_projects(self):
+        projects = self.run_with_client(lambda client: client.get_projects())
+        self.assertEqual(len(self.jama_client.get_projects()), len(projects))
+
+    def test_get_items(self):
+        project_id = 116
+        items = self.run_with_client(lambda client: client.get_items(project_id), max_concurrency=4)
+        sync_items = self.jama_client.get_items(project_id)
+        self.assertEqual([item.get('id') for item in sync_items], [item.get('id') for item in items])
+
+    def test_iter_items(self):
+        project_id = 116
+
+        async def collect(client):
+            return [item async for item in client.iter_items(project_id)]
+
+        items = self.run_with_client(collect)
+        self.assertEqual(len(self.jama_client.get_items(project_id)), len(items))
+
+    def test_get_item(self):
+        item_id = 66977
+        item = self.run_with_client(lambda client: client.get_item(item_id))
+        self.assertEqual(item.get('id'), item_id)
+
+    def test_get_item_not_found(self):
+        with self.assertRaises(ResourceNotFoundException):
+            self.run_with_client(lambda client: client.get_item(-1))
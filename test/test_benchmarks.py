@@ -0,0 +1,119 @@
+"""Benchmarks for the paged client methods, run against the local stand-in server so that they need no network access
+or Jama instance.  Each run records the items fetched per second, the peak memory allocated by the client while
+fetching, and the number of requests the server answered.  The results are listed at the end of the pytest run.
+
+They take a while, so they only run when the JAMA_BENCHMARKS environment variable is set."""
+
+import math
+import os
+import time
+import tracemalloc
+
+import pytest
+
+from py_jama_rest_client.client import JamaClient
+from py_jama_rest_client.core import RetryPolicy
+
+from .stand_in_server import JamaStandInServer
+
+pytestmark = pytest.mark.skipif(not os.environ.get('JAMA_BENCHMARKS'), reason='set JAMA_BENCHMARKS to run benchmarks')
+
+PROJECT_ID = 1
+FILTER_ID = 7
+ITEMS = 2000
+RELATIONSHIPS = 5000
+FILTER_RESULTS = 1000
+LATENCY = 0.005
+
+PAGED_METHODS = {
+    'get_items': (lambda client, page_size: client.get_items(PROJECT_ID, allowed_results_per_page=page_size),
+                  ITEMS),
+    'get_relationships': (lambda client, page_size: client.get_relationships(PROJECT_ID,
+                                                                             allowed_results_per_page=page_size),
+                          RELATIONSHIPS),
+    'get_filter_results': (lambda client, page_size: client.get_filter_results(FILTER_ID,
+                                                                               allowed_results_per_page=page_size),
+                           FILTER_RESULTS),
+    # Consumes the generator without keeping the items, compare its peak memory with get_items.
+    'iter_items': (lambda client, page_size: sum(1 for _ in client.iter_items(PROJECT_ID,
+                                                                            allowed_results_per_page=page_size)),
+                   ITEMS),
+}
+
+
+@pytest.fixture(scope='module')
+def server():
+    with JamaStandInServer(latency=LATENCY, items_per_project=ITEMS, relationships_per_project=RELATIONSHIPS,
+                           filter_results=FILTER_RESULTS) as stand_in:
+        yield stand_in
+
+
+@pytest.fixture(scope='module')
+def throttling_server():
+    with JamaStandInServer(latency=LATENCY, throttle_every=7, items_per_project=ITEMS) as stand_in:
+        yield stand_in
+
+
+def measure(server, fetch):
+    """Calls fetch twice, once timed and once with allocation tracing, which slows it down.  Returns the result of
+    the timed call, the seconds it took, the peak memory in bytes and the number of requests the timed call made."""
+    server.reset_stats()
+    started_at = time.perf_counter()
+    result = fetch()
+    elapsed = time.perf_counter() - started_at
+    stats = server.get_stats()
+
+    tracemalloc.start()
+    try:
+        fetch()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, peak, stats
+
+
+def record(benchmark_results, name, page_size, concurrency, items, elapsed, peak, stats):
+    benchmark_results.append({
+        'name': name,
+        'page_size': page_size,
+        'concurrency': concurrency,
+        'items': items,
+        'seconds': elapsed,
+        'items_per_second': items / elapsed,
+        'peak_memory_kb': peak / 1024.0,
+        'requests': stats['requests'],
+        'response_bytes': stats['response_bytes'],
+        'requests_by_status': stats['by_status'],
+    })
+
+
+@pytest.mark.parametrize('concurrency', [1, 4])
+@pytest.mark.parametrize('page_size', [20, 50])
+@pytest.mark.parametrize('method', sorted(PAGED_METHODS))
+def test_paging(server, benchmark_results, method, page_size, concurrency):
+    fetch, expected = PAGED_METHODS[method]
+    client = JamaClient(server.url, ('username', 'password'), max_concurrency=concurrency)
+
+    result, elapsed, peak, stats = measure(server, lambda: fetch(client, page_size))
+    client.close()
+
+    items = result if isinstance(result, int) else len(result)
+    assert items == expected
+    assert stats['requests'] == math.ceil(expected / page_size)
+    record(benchmark_results, method, page_size, concurrency, items, elapsed, peak, stats)
+
+
+@pytest.mark.parametrize('concurrency', [1, 4])
+def test_paging_throttled(throttling_server, benchmark_results, concurrency):
+    retry_policy = RetryPolicy(max_attempts=5, backoff_factor=0.01)
+    client = JamaClient(throttling_server.url, ('username', 'password'), max_concurrency=concurrency,
+                        retry_policy=retry_policy)
+
+    result, elapsed, peak, stats = measure(throttling_server, lambda: client.get_items(PROJECT_ID,
+                                                                                        allowed_results_per_page=50))
+    client.close()
+
+    assert len(result) == ITEMS
+    assert stats['by_status'].get('429', 0) > 0
+    assert stats['requests'] == math.ceil(ITEMS / 50) + stats['by_status']['429']
+    record(benchmark_results, 'get_items throttled', 50, concurrency, len(result), elapsed, peak, stats)
@@ -0,0 +1,305 @@
+import json
+import threading
+import time
+from unittest import TestCase
+
+import requests
+
+from py_jama_rest_client.client import JamaClient
+from py_jama_rest_client.ratelimit import TokenBucket
+from py_jama_rest_client.transport import FakeTransport
+
+EXISTING_IDS = range(1000, 1300)
+
+
+def page(data, total):
+    return {'meta': {'status': 'OK', 'pageInfo': {'startIndex': 0, 'resultCount': len(data), 'totalResults': total}},
+            'data': data}
+
+
+def abstract_items_handler(method, url, params, body):
+    """Filters abstractitems by id, as servers that support multi-valued id parameters do."""
+    path = url.split('/rest/v1/')[1]
+    if path == 'abstractitems':
+        data = [{'id': item_id, 'type': 'items'} for item_id in params['id'] if item_id in EXISTING_IDS]
+        return 200, page(data, len(data)), None
+    if path.startswith('abstractitems/') and int(path.split('/')[1]) in EXISTING_IDS:
+        return 200, {'meta': {'status': 'OK'}, 'data': {'id': int(path.split('/')[1]), 'type': 'items'}}, None
+    return None
+
+
+def unfiltered_handler(method, url, params, body):
+    """Ignores the id parameter and answers with every item."""
+    if url.endswith('/abstractitems'):
+        return 200, page([{'id': item_id} for item_id in EXISTING_IDS[:50]], len(EXISTING_IDS)), None
+    return abstract_items_handler(method, url, params, body)
+
+
+class TestGetItemsByIds(TestCase):
+
+    def client(self, handler):
+        self.transport = FakeTransport(handler)
+        return JamaClient('http://jama.example.com', ('username', 'password'), transport=self.transport,
+                          max_concurrency=4)
+
+    def test_chunked_fetch(self):
+        jama_client = self.client(abstract_items_handler)
+        ids = list(EXISTING_IDS) + [5, 6] + list(EXISTING_IDS[:10])
+        items, missing = jama_client.get_items_by_ids(ids, max_url_length=400)
+        self.assertEqual(sorted(items), list(EXISTING_IDS))
+        self.assertEqual(missing, [5, 6])
+
+        chunks = [request['params']['id'] for request in self.transport.requests]
+        self.assertEqual(sorted(item_id for chunk in chunks for item_id in chunk), sorted(set(ids)))
+        self.assertTrue(all(len(chunk) <= 50 for chunk in chunks))
+        self.assertGreater(len(chunks), len(ids) // 50)
+
+        self.assertEqual(jama_client.get_items_by_ids([]), ({}, []))
+
+        # Later calls fetch every chunk concurrently, without probing first.
+        requests = len(self.transport.requests)
+        items, missing = jama_client.get_items_by_ids(EXISTING_IDS[:60])
+        self.assertEqual(len(items), 60)
+        self.assertEqual(len(self.transport.requests), requests + 2)
+
+    def test_falls_back_without_id_filter(self):
+        jama_client = self.client(unfiltered_handler)
+        items, missing = jama_client.get_items_by_ids([1000, 1001, 7])
+        self.assertEqual(sorted(items), [1000, 1001])
+        self.assertEqual(missing, [7])
+        self.assertEqual(len(self.transport.requests), 4)
+
+        # The client remembers that the server does not filter by id.
+        items, missing = jama_client.get_items_by_ids([1002, 8])
+        self.assertEqual((sorted(items), missing), ([1002], [8]))
+        self.assertEqual(len(self.transport.requests), 6)
+        self.assertFalse(any(request['url'].endswith('/abstractitems') for request in self.transport.requests[4:]))
+
+
+def document_key_handler(method, url, params, body):
+    if url.endswith('/abstractitems'):
+        data = [{'id': index, 'documentKey': key} for index, key in enumerate(params['documentKey'])
+                if not key.endswith('0')]
+        return 200, page(data, len(data)), None
+    return None
+
+
+class TestGetAbstractItemsByDocumentKeys(TestCase):
+
+    def test_batched_lookup(self):
+        transport = FakeTransport(document_key_handler)
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'), transport=transport,
+                                 max_concurrency=4)
+        keys = ['PRJ-REQ-{}'.format(index) for index in range(200)]
+        items_by_key = jama_client.get_abstract_items_by_document_keys(keys + keys[:5], project=[10],
+                                                                       max_url_length=600)
+        self.assertEqual(list(items_by_key), keys)
+        self.assertIsNone(items_by_key['PRJ-REQ-0'])
+        self.assertIsNone(items_by_key['PRJ-REQ-10'])
+        self.assertEqual(items_by_key['PRJ-REQ-11']['documentKey'], 'PRJ-REQ-11')
+        self.assertEqual(sum(item is None for item in items_by_key.values()), 20)
+
+        self.assertGreater(len(transport.requests), 4)
+        self.assertTrue(all(request['params']['project'] == [10] for request in transport.requests))
+        self.assertEqual(sum(len(request['params']['documentKey']) for request in transport.requests), 200)
+
+    def test_one_pool(self):
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def paged_handler(method, url, params, body):
+            """Matches every key four times, so each batch takes several pages."""
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            matches = [{'id': index, 'documentKey': key} for index, key in enumerate(params['documentKey'] * 4)]
+            data = matches[params['startAt']:params['startAt'] + params['maxResults']]
+            return 200, {'meta': {'status': 'OK', 'pageInfo': {'startIndex': params['startAt'],
+                                                                'resultCount': len(data),
+                                                                'totalResults': len(matches)}},
+                         'data': data}, None
+
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'),
+                                 transport=FakeTransport(paged_handler), max_concurrency=3)
+        keys = ['PRJ-REQ-{}'.format(index) for index in range(200)]
+        items_by_key = jama_client.get_abstract_items_by_document_keys(keys, max_url_length=1200)
+        self.assertTrue(all(items_by_key[key]['documentKey'] == key for key in keys))
+        self.assertLessEqual(in_flight[1], 3)
+
+
+def post_items_handler(method, url, params, body):
+    if method == 'POST' and url.endswith('/items/'):
+        fields = json.loads(body)['fields']
+        if fields['name'].startswith('bad'):
+            return 400, {'meta': {'status': 'Bad Request', 'message': 'Invalid field'}}, None
+        return 201, {'meta': {'status': 'Created', 'id': 5000 + int(fields['name'].split()[-1])}}, None
+    return None
+
+
+class TestPostItemsBulk(TestCase):
+
+    def test_ordered_ids_and_errors(self):
+        transport = FakeTransport(post_items_handler)
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'), transport=transport,
+                                 max_concurrency=4)
+        names = ['item {}'.format(index) for index in range(30)]
+        names[7] = 'bad item 7'
+        items = ({'project': 1, 'item_type_id': 24, 'child_item_type_id': 0, 'location': {'item': 10},
+                  'fields': {'name': name}} for name in names)
+
+        ids, errors = jama_client.post_items_bulk(items)
+        self.assertEqual(ids, [5000 + index if index != 7 else None for index in range(30)])
+        self.assertEqual(len(errors), 1)
+        self.assertEqual((errors[0]['index'], errors[0]['status_code']), (7, 400))
+        self.assertEqual(errors[0]['item']['fields']['name'], 'bad item 7')
+        self.assertEqual(len(transport.requests), 30)
+
+    def test_transport_error(self):
+        def handler(method, url, params, body):
+            if method == 'POST' and json.loads(body)['fields']['name'] == 'item 1':
+                raise requests.exceptions.ReadTimeout('Read timed out.')
+            return post_items_handler(method, url, params, body)
+
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'),
+                                 transport=FakeTransport(handler), max_concurrency=2)
+        items = [{'project': 1, 'item_type_id': 24, 'child_item_type_id': 0, 'location': {'item': 10},
+                  'fields': {'name': 'item {}'.format(index)}} for index in range(3)]
+
+        ids, errors = jama_client.post_items_bulk(items)
+        self.assertEqual(ids, [5000, None, 5002])
+        self.assertEqual(len(errors), 1)
+        self.assertEqual((errors[0]['index'], errors[0]['status_code']), (1, None))
+        self.assertIsInstance(errors[0]['exception'], requests.exceptions.ReadTimeout)
+
+
+class TreeServer:
+    """Creates items with increasing ids and remembers the parent of each."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.next_id = 100
+        self.parents = {}
+        self.names = {}
+
+    def handler(self, method, url, params, body):
+        body = json.loads(body)
+        if body['fields']['name'] == 'bad':
+            return 400, {'meta': {'status': 'Bad Request', 'message': 'Invalid field'}}, None
+        if body['fields']['name'] == 'slow':
+            raise requests.exceptions.ReadTimeout('Read timed out')
+        time.sleep(0.01)
+        with self.lock:
+            item_id = self.next_id
+            self.next_id += 1
+            self.parents[item_id] = body['location']['parent']
+            self.names[item_id] = body['fields']['name']
+        return 201, {'meta': {'status': 'Created', 'id': item_id}}, None
+
+
+def tree_node(key, children=(), name=None):
+    return {'key': key, 'item_type_id': 24, 'fields': {'name': name or key}, 'children': list(children)}
+
+
+class TestImportItemTree(TestCase):
+
+    def test_import(self):
+        server = TreeServer()
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'),
+                                 transport=FakeTransport(server.handler), max_concurrency=4)
+        nodes = [tree_node('chapter {}'.format(chapter),
+                           [tree_node('section {}.{}'.format(chapter, section),
+                                      [tree_node('req {}.{}.{}'.format(chapter, section, req)) for req in range(3)])
+                            for section in range(3)])
+                 for chapter in range(3)]
+        nodes[1]['children'][2]['fields']['name'] = 'bad'
+
+        ids, errors = jama_client.import_item_tree(1, {'item': 10}, nodes)
+        self.assertEqual(len(ids), 39 - 4)
+        self.assertEqual([error['key'] for error in errors], ['section 1.2', 'req 1.2.0', 'req 1.2.1', 'req 1.2.2'])
+        self.assertEqual(errors[0]['status_code'], 400)
+
+        for chapter in range(3):
+            self.assertEqual(server.parents[ids['chapter {}'.format(chapter)]], {'item': 10})
+            for section in range(3):
+                key = 'section {}.{}'.format(chapter, section)
+                if key in ids:
+                    self.assertEqual(server.parents[ids[key]], {'item': ids['chapter {}'.format(chapter)]})
+        # Siblings are created in order.
+        self.assertEqual(sorted(ids['chapter {}'.format(chapter)] for chapter in range(3)),
+                         [ids['chapter {}'.format(chapter)] for chapter in range(3)])
+        self.assertEqual([ids['req 2.1.{}'.format(req)] for req in range(3)],
+                         sorted(ids['req 2.1.{}'.format(req)] for req in range(3)))
+
+        with self.assertRaises(ValueError):
+            jama_client.import_item_tree(1, {'item': 10}, [tree_node('a'), tree_node('a')])
+
+    def test_transport_errors(self):
+        server = TreeServer()
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'),
+                                 transport=FakeTransport(server.handler), max_concurrency=4)
+        nodes = [tree_node('a', [tree_node('a.1', [tree_node('a.1.1')], name='slow'), tree_node('a.2')]),
+                 tree_node('b')]
+
+        ids, errors = jama_client.import_item_tree(1, {'item': 10}, nodes)
+        self.assertEqual(sorted(ids), ['a', 'a.2', 'b'])
+        self.assertEqual([error['key'] for error in errors], ['a.1', 'a.1.1'])
+        self.assertIsNone(errors[0]['status_code'])
+        self.assertIsInstance(errors[0]['exception'], requests.exceptions.Timeout)
+
+
+def delete_handler(method, url, params, body):
+    if method == 'DELETE':
+        resource_id = int(url.rsplit('/', 1)[1])
+        if resource_id % 10 == 0:
+            return 404, {'meta': {'status': 'Not Found', 'message': 'Resource not found'}}, None
+        if resource_id == 13:
+            return 500, {'meta': {'status': 'Internal Server Error', 'message': 'Failed'}}, None
+        return 204, None, None
+    return None
+
+
+class TestDeleteBulk(TestCase):
+
+    def test_outcomes(self):
+        transport = FakeTransport(delete_handler)
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'), transport=transport,
+                                 max_concurrency=4)
+        item_ids = [2, 2] + list(range(1, 25)) + [13]
+        outcomes, errors = jama_client.delete_items_bulk(item_ids)
+        self.assertEqual(len(outcomes), len(item_ids))
+        self.assertEqual(outcomes[:3], ['deleted', 'deleted', 'deleted'])
+        self.assertEqual(outcomes[item_ids.index(10)], 'already_deleted')
+        self.assertEqual(outcomes[item_ids.index(13)], 'failed')
+        self.assertEqual(outcomes[-1], 'failed')
+        # Errors refer to the positions in the ids given.
+        self.assertEqual([(error['index'], error['item'], error['status_code']) for error in errors],
+                         [(14, 13, 500), (26, 13, 500)])
+        self.assertEqual(len(transport.requests), 24)
+        self.assertTrue(all('/items/' in request['url'] for request in transport.requests))
+
+    def test_transport_error(self):
+        def handler(method, url, params, body):
+            if method == 'DELETE' and url.endswith('/items/2'):
+                raise requests.exceptions.ConnectionError('Connection reset by peer')
+            return delete_handler(method, url, params, body)
+
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'),
+                                 transport=FakeTransport(handler), max_concurrency=4)
+        outcomes, errors = jama_client.delete_items_bulk([1, 2, 3, 10])
+        self.assertEqual(outcomes, ['deleted', 'failed', 'deleted', 'already_deleted'])
+        self.assertEqual([(error['index'], error['item'], error['status_code']) for error in errors], [(1, 2, None)])
+        self.assertIsInstance(errors[0]['exception'], requests.exceptions.ConnectionError)
+
+    def test_relationships_rate_limited(self):
+        transport = FakeTransport(delete_handler)
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'), transport=transport,
+                                 max_concurrency=4)
+        started_at = time.monotonic()
+        outcomes, errors = jama_client.delete_relationships_bulk(range(1, 8), rate_limiter=TokenBucket(20, burst=1))
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.25)
+        self.assertEqual(outcomes, ['deleted'] * 7)
+        self.assertEqual(errors, [])
+        self.assertTrue(all('/relationships/' in request['url'] for request in transport.requests))
@@ -0,0 +1,55 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from py_jama_rest_client.client import JamaClient, ResourceNotFoundException
+from py_jama_rest_client.transport import FakeTransport
+
+
+def slow_item_handler(method, url, params, body):
+    time.sleep(0.2)
+    if url.endswith('/items/42'):
+        return 200, {'meta': {'status': 'OK'}, 'data': {'id': 42, 'name': 'item'}}, None
+    return None
+
+
+class TestCoalescing(TestCase):
+
+    def fan_out(self, jama_client, item_id, callers=8):
+        barrier = threading.Barrier(callers)
+
+        def call():
+            barrier.wait()
+            try:
+                return jama_client.get_item(item_id)
+            except ResourceNotFoundException as err:
+                return err
+
+        with ThreadPoolExecutor(callers) as executor:
+            return [future.result() for future in [executor.submit(call) for _ in range(callers)]]
+
+    def test_identical_gets_share_one_request(self):
+        transport = FakeTransport(slow_item_handler)
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'), transport=transport,
+                                 coalesce_gets=True)
+        items = self.fan_out(jama_client, 42)
+        self.assertEqual(len(transport.requests), 1)
+        self.assertTrue(all(item == {'id': 42, 'name': 'item'} for item in items))
+        # Every caller gets its own decoded body.
+        items[0]['name'] = 'changed'
+        self.assertEqual(items[1]['name'], 'item')
+
+        errors = self.fan_out(jama_client, 43)
+        self.assertEqual(len(transport.requests), 2)
+        self.assertTrue(all(isinstance(err, ResourceNotFoundException) for err in errors))
+
+        # Requests that are not in flight at the same time are sent again.
+        jama_client.get_item(42)
+        self.assertEqual(len(transport.requests), 3)
+
+    def test_disabled_by_default(self):
+        transport = FakeTransport(slow_item_handler)
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'), transport=transport)
+        self.fan_out(jama_client, 42, callers=3)
+        self.assertEqual(len(transport.requests), 3)
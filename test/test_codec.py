@@ -0,0 +1,77 @@
+import json
+from unittest import TestCase, skipIf
+
+from py_jama_rest_client.client import ResourceNotFoundException, _handle_response_status
+from py_jama_rest_client.codec import JsonCodec, OrjsonCodec, StreamedPage, get_codec, orjson
+from py_jama_rest_client.transport import build_response
+
+BODY = json.dumps({
+    'meta': {'status': 'OK', 'pageInfo': {'startIndex': 0, 'resultCount': 7, 'totalResults': 7}},
+    'links': {},
+    'data': [1, {}, 1.5, 2e3, -12.25e-2, {'id': 7, 'name': 'café ☃', 'values': [True, None, 3]}, 'text'],
+})
+
+
+class TestStreamedPage(TestCase):
+
+    def test_every_chunk_size(self):
+        expected = json.loads(BODY)
+        content = BODY.encode('utf-8')
+        for chunk_size in range(1, len(content) + 1):
+            response = build_response('GET', 'http://jama.example.com/rest/v1/items', 200, content,
+                                      {'Content-Type': 'application/json'})
+            page = StreamedPage(response, chunk_size=chunk_size)
+            self.assertEqual(list(page.data), expected['data'], 'chunk size {}'.format(chunk_size))
+            self.assertEqual(page.page_info, expected['meta']['pageInfo'])
+
+    def test_number_at_end_of_stream(self):
+        response = build_response('GET', 'http://jama.example.com/rest/v1/items', 200, b'{"data": [12]}')
+        self.assertEqual(list(StreamedPage(response, chunk_size=1).data), [12])
+
+    def test_invalid_document(self):
+        response = build_response('GET', 'http://jama.example.com/rest/v1/items', 200, b'{"data": [1 2]}')
+        with self.assertRaises(json.JSONDecodeError):
+            list(StreamedPage(response, chunk_size=3).data)
+
+
+class TestCodecs(TestCase):
+
+    def round_trip(self, codec):
+        document = json.loads(BODY)
+        encoded = codec.dumps(document)
+        self.assertEqual(codec.loads(encoded), document)
+        self.assertEqual(json.loads(encoded), document)
+        self.assertEqual(codec.loads(BODY.encode('utf-8')), document)
+
+        response = build_response('GET', 'http://jama.example.com/rest/v1/items', 200, encoded)
+        decoded = codec.decode(response)
+        self.assertEqual(decoded, document)
+        self.assertIs(codec.decode(response), decoded)
+
+        with self.assertRaises(json.JSONDecodeError):
+            codec.loads(b'{"data": [1 2]}')
+
+    def test_json_codec(self):
+        self.round_trip(JsonCodec())
+
+    @skipIf(orjson is None, 'orjson is not installed')
+    def test_orjson_codec(self):
+        codec = OrjsonCodec()
+        self.round_trip(codec)
+        self.assertEqual(json.loads(codec.dumps({1: 'one'})), json.loads(JsonCodec().dumps({1: 'one'})))
+
+    def test_non_json_error_body(self):
+        body = '<html><body>Page non trouvée</body></html>'.encode('latin-1')
+        for codec in [JsonCodec()] + ([OrjsonCodec()] if orjson is not None else []):
+            response = build_response('GET', 'http://jama.example.com/rest/v1/items/1', 404, body,
+                                      {'Content-Type': 'text/html; charset=ISO-8859-1'})
+            with self.assertRaises(ResourceNotFoundException):
+                _handle_response_status(response, codec.decode)
+
+    def test_get_codec(self):
+        codec = JsonCodec()
+        self.assertIs(get_codec(codec), codec)
+        self.assertEqual(get_codec('json').name, 'json')
+        self.assertEqual(get_codec('auto').name, 'json' if orjson is None else 'orjson')
+        with self.assertRaises(ValueError):
+            get_codec('yaml')
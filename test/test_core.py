@@ -0,0 +1,139 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from unittest import TestCase
+
+from py_jama_rest_client.core import Core, RetryPolicy
+from py_jama_rest_client.token_store import TokenStore
+from py_jama_rest_client.transport import FakeTransport, build_response
+
+
+class MemoryTokenStore(TokenStore):
+
+    def __init__(self):
+        self.tokens = {}
+
+    def load(self, key):
+        return self.tokens.get(key)
+
+    def save(self, key, token):
+        self.tokens[key] = token
+
+    def delete(self, key):
+        self.tokens.pop(key, None)
+
+
+class OAuthServer:
+    """Issues fresh-token from the token endpoint and counts the tokens issued."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tokens_issued = 0
+
+    def handler(self, method, url, params, body):
+        if url.endswith('/rest/oauth/token'):
+            with self.lock:
+                self.tokens_issued += 1
+            time.sleep(0.01)
+            return 200, {'access_token': 'fresh-token', 'token_type': 'bearer', 'expires_in': 3600}, None
+        return None
+
+
+class AuthCheckingTransport(FakeTransport):
+    """Answers 401 to API requests made with any token but fresh-token."""
+
+    def request(self, method, url, headers=None, **kwargs):
+        response = super(AuthCheckingTransport, self).request(method, url, headers=headers, **kwargs)
+        if not url.endswith('/rest/oauth/token') and headers['Authorization'] != 'Bearer fresh-token':
+            response.status_code = 401
+        return response
+
+
+class TestOAuth(TestCase):
+
+    def test_stored_token_discarded_under_load(self):
+        for _ in range(20):
+            server = OAuthServer()
+            transport = AuthCheckingTransport(server.handler)
+            transport.add('GET', '/rest/v1/items/1', {'meta': {'status': 'OK'}, 'data': {'id': 1}})
+            store = MemoryTokenStore()
+            store.save('http://jama.example.com/rest/oauth/token|client',
+                       {'access_token': 'revoked-token', 'expires_in': 3600, 'acquired_at': time.time()})
+            core = Core('http://jama.example.com', ('client', 'secret'), oauth=True, token_store=store,
+                        transport=transport)
+
+            # Requests sent with the revoked token before it was discarded may still see a 401, none may fail
+            # for lack of a token.
+            with ThreadPoolExecutor(8) as executor:
+                statuses = list(executor.map(lambda _: core.get('items/1').status_code, range(32)))
+            self.assertTrue(set(statuses) <= {200, 401})
+            self.assertEqual(core.get('items/1').status_code, 200)
+            self.assertEqual(server.tokens_issued, 1)
+            self.assertEqual(store.load('http://jama.example.com/rest/oauth/token|client')['access_token'],
+                             'fresh-token')
+
+
+class TestRetryPolicy(TestCase):
+
+    def retry_after(self, value, policy=None):
+        response = build_response('GET', 'http://jama.example.com/rest/v1/items', 429, headers={'Retry-After': value})
+        return (policy or RetryPolicy(jitter=False)).get_backoff(1, response)
+
+    def test_retry_after_seconds(self):
+        self.assertEqual(self.retry_after('7'), 7.0)
+        self.assertEqual(self.retry_after('-3'), 0.0)
+        self.assertEqual(self.retry_after('600'), 120)
+
+    def test_retry_after_date(self):
+        self.assertAlmostEqual(self.retry_after(formatdate(time.time() + 30, usegmt=True)), 30, delta=2)
+        self.assertEqual(self.retry_after(formatdate(time.time() - 30, usegmt=True)), 0.0)
+
+    def test_unreadable_retry_after(self):
+        policy = RetryPolicy(backoff_factor=2, jitter=False)
+        self.assertEqual(self.retry_after('soon', policy), 2)
+        policy = RetryPolicy(backoff_factor=2, jitter=False, respect_retry_after=False)
+        self.assertEqual(self.retry_after('7', policy), 2)
+
+    def test_backoff_ceiling(self):
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+        self.assertEqual([policy.get_backoff(attempt) for attempt in range(1, 7)], [0.5, 1, 2, 3, 3, 3])
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3)
+        for attempt in range(1, 20):
+            self.assertTrue(0 <= policy.get_backoff(attempt) <= 3)
+
+
+class TestRetries(TestCase):
+
+    def core(self, status_codes):
+        """Returns a Core whose server answers with the given status codes in turn, then 200."""
+        status_codes = list(status_codes)
+
+        def handler(method, url, params, body):
+            status_code = status_codes.pop(0) if status_codes else 200
+            return status_code, {'meta': {'status': 'OK'}, 'data': {'id': 1}}, None
+
+        self.transport = FakeTransport(handler)
+        return Core('http://jama.example.com', ('username', 'password'), transport=self.transport,
+                    retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0, jitter=False))
+
+    def test_idempotent_methods_retried(self):
+        core = self.core([503, 429])
+        self.assertEqual(core.get('items/1').status_code, 200)
+        self.assertEqual(len(self.transport.requests), 3)
+        self.assertEqual(core.get_retry_stats()['retries_by_status'], {503: 1, 429: 1})
+
+    def test_attempts_exhausted(self):
+        core = self.core([503, 503, 503, 503])
+        self.assertEqual(core.get('items/1').status_code, 503)
+        self.assertEqual(len(self.transport.requests), 3)
+        self.assertEqual(core.get_retry_stats()['exhausted'], 1)
+
+    def test_non_idempotent_methods_not_retried(self):
+        core = self.core([503, 503])
+        self.assertEqual(core.post('items', data='{}').status_code, 503)
+        self.assertEqual(len(self.transport.requests), 1)
+        core = self.core([503, 503])
+        self.assertEqual(core.patch('items/1', data='[]').status_code, 503)
+        self.assertEqual(len(self.transport.requests), 1)
+        self.assertEqual(core.get_retry_stats()['retries'], 0)
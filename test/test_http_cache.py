@@ -0,0 +1,119 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from py_jama_rest_client.client import JamaClient
+from py_jama_rest_client.http_cache import DiskCacheStore, HttpCache
+from py_jama_rest_client.transport import FakeTransport, build_response
+
+
+class VersionedTransport(FakeTransport):
+    """Serves every resource at the current version, with an ETag, and answers 304 when it has not changed."""
+
+    def __init__(self):
+        super(VersionedTransport, self).__init__()
+        self.version = 1
+        self.conditional_requests = 0
+
+    def request(self, method, url, headers=None, **kwargs):
+        etag = '"v{}"'.format(self.version)
+        if headers and 'If-None-Match' in headers:
+            self.conditional_requests += 1
+            if headers['If-None-Match'] == etag:
+                return build_response(method, url, 304, None, {'ETag': etag})
+        if url.endswith('/rest/v1/items'):
+            page_info = {'startIndex': 0, 'resultCount': 1, 'totalResults': 1}
+            body = '{{"meta": {{"status": "OK", "pageInfo": {}}}, "data": [{{"id": 1}}]}}'.format(json.dumps(page_info))
+        else:
+            body = '{{"meta": {{"status": "OK"}}, "data": {{"id": 1, "version": {}}}}}'.format(self.version)
+        return build_response(method, url, 200, body, {'ETag': etag, 'Content-Type': 'application/json'})
+
+
+class TestHttpCache(TestCase):
+
+    def test_revalidation(self):
+        transport = VersionedTransport()
+        http_cache = HttpCache()
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'), transport=transport,
+                                 http_cache=http_cache)
+
+        self.assertEqual(jama_client.get_item(1)['version'], 1)
+        self.assertEqual(jama_client.get_item(1)['version'], 1)
+        transport.version = 2
+        self.assertEqual(jama_client.get_item(1)['version'], 2)
+
+        self.assertEqual(transport.conditional_requests, 2)
+        stats = http_cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['entries']), (1, 2, 1))
+
+        # Other users do not get this user's responses.
+        other_client = JamaClient('http://jama.example.com', ('other', 'password'), transport=transport,
+                                  http_cache=http_cache)
+        other_client.get_item(1)
+        self.assertEqual(transport.conditional_requests, 2)
+
+    def make_cache_directory(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        return directory.name
+
+    def test_limits_and_disk_store(self):
+        cache_dir = self.make_cache_directory()
+        transport = VersionedTransport()
+        http_cache = HttpCache(max_entries=2, store=DiskCacheStore(cache_dir))
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'), transport=transport,
+                                 http_cache=http_cache)
+        for item_id in range(4):
+            jama_client.get_item(item_id)
+        self.assertEqual(http_cache.get_stats()['entries'], 2)
+        self.assertEqual(http_cache.get_stats()['evictions'], 2)
+
+        # A new cache on the same directory revalidates instead of downloading.
+        http_cache = HttpCache(store=DiskCacheStore(cache_dir))
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'), transport=transport,
+                                 http_cache=http_cache)
+        jama_client.get_item(0)
+        self.assertEqual(http_cache.get_stats()['hits'], 1)
+
+    def test_pages_not_cached(self):
+        transport = VersionedTransport()
+        http_cache = HttpCache()
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'), transport=transport,
+                                 http_cache=http_cache)
+        jama_client.get_items(1)
+        jama_client.get_items(1)
+        self.assertEqual(transport.conditional_requests, 0)
+        self.assertEqual(http_cache.get_stats()['entries'], 0)
+
+    def test_not_modified_headers_merged(self):
+        cache_dir = self.make_cache_directory()
+        http_cache = HttpCache(store=DiskCacheStore(cache_dir))
+        key = 'username|http://jama.example.com/rest/v1/items/1|null'
+        http_cache.put(key, build_response('GET', 'http://jama.example.com/rest/v1/items/1', 200, '{}',
+                                           {'ETag': '"v1"', 'Cache-Control': 'max-age=60'}))
+        not_modified = build_response('GET', 'http://jama.example.com/rest/v1/items/1', 304, None,
+                                      {'etag': '"v1-gzip"', 'Cache-Control': 'max-age=600'})
+        entry = http_cache.refresh(key, http_cache.get(key), not_modified)
+
+        self.assertEqual(entry.etag, '"v1-gzip"')
+        self.assertEqual(entry.content, b'{}')
+        for stored in (http_cache.get(key), HttpCache(store=DiskCacheStore(cache_dir)).get(key)):
+            self.assertEqual(stored.headers, {'etag': '"v1-gzip"', 'Cache-Control': 'max-age=600'})
+
+    def test_disk_store_size_limit(self):
+        cache_dir = self.make_cache_directory()
+        store = DiskCacheStore(cache_dir, max_bytes=2500)
+        http_cache = HttpCache(store=store)
+        for item_id in range(4):
+            http_cache.put('item-{}'.format(item_id), build_response('GET', 'http://jama.example.com/', 200,
+                                                                     'x' * 1000, {'ETag': '"v1"'}))
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+        self.assertIsNone(store.load('item-0'))
+        self.assertIsNotNone(store.load('item-3'))
+
+        # A new store counts the files already in the directory.
+        store = DiskCacheStore(cache_dir, max_bytes=2500)
+        store.save('item-4', http_cache.get('item-3'))
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+        self.assertIsNone(store.load('item-2'))
@@ -0,0 +1,81 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from py_jama_rest_client.client import JamaClient
+from py_jama_rest_client.immutable_cache import ImmutableCache
+from py_jama_rest_client.transport import FakeTransport
+
+
+class TestImmutableCache(TestCase):
+
+    def setUp(self):
+        self.transport = FakeTransport()
+        self.transport.add('GET', '/rest/v1/items/1/versions/2/versioneditem',
+                           {'meta': {'status': 'OK'}, 'data': {'id': 1, 'version': 2}})
+        self.transport.add('GET', '/rest/v1/baselines/7/versioneditems',
+                           {'meta': {'status': 'OK', 'pageInfo': {'startIndex': 0, 'resultCount': 1,
+                                                                  'totalResults': 1}},
+                            'data': [{'id': 1, 'version': 2}]})
+
+    def client(self, immutable_cache, user='username'):
+        return JamaClient('http://jama.example.com', (user, 'password'), transport=self.transport,
+                          immutable_cache=immutable_cache)
+
+    def make_path(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        return os.path.join(directory.name, 'versions.sqlite')
+
+    def test_persists_across_clients(self):
+        path = self.make_path()
+        immutable_cache = ImmutableCache(path)
+        self.addCleanup(immutable_cache.close)
+        self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+        jama_client = self.client(immutable_cache)
+        self.assertEqual(jama_client.get_versioned_item(1, 2), {'id': 1, 'version': 2})
+        self.assertEqual(jama_client.get_baselines_versioneditems(7), [{'id': 1, 'version': 2}])
+        immutable_cache.close()
+        self.assertEqual(len(self.transport.requests), 2)
+
+        immutable_cache = ImmutableCache(path)
+        self.addCleanup(immutable_cache.close)
+        jama_client = self.client(immutable_cache)
+        self.assertEqual(jama_client.get_versioned_item(1, 2), {'id': 1, 'version': 2})
+        self.assertEqual(jama_client.get_baselines_versioneditems(7), [{'id': 1, 'version': 2}])
+        self.assertEqual(len(self.transport.requests), 2)
+        self.assertEqual(immutable_cache.get_stats()['hits'], 2)
+        self.assertEqual(immutable_cache.get_stats()['entries'], 2)
+
+        # Other users do not get this user's results.
+        self.client(immutable_cache, user='other').get_versioned_item(1, 2)
+        self.assertEqual(len(self.transport.requests), 3)
+
+    def test_size_cap(self):
+        immutable_cache = ImmutableCache(':memory:', max_bytes=10)
+        immutable_cache.put('get_item_version', 'a', b'12345')
+        immutable_cache.put('get_item_version', 'b', b'12345')
+        immutable_cache.get('get_item_version', 'a')
+        immutable_cache.put('get_item_version', 'c', b'12345')
+        self.assertEqual(immutable_cache.get('get_item_version', 'a'), b'12345')
+        self.assertIsNone(immutable_cache.get('get_item_version', 'b'))
+        self.assertEqual(immutable_cache.get_stats()['evictions'], 1)
+        self.assertEqual(immutable_cache.get_stats()['bytes'], 10)
+
+    def test_size_tracking(self):
+        path = self.make_path()
+        immutable_cache = ImmutableCache(path, max_bytes=10)
+        immutable_cache.put('get_item_version', 'a', b'12345')
+        immutable_cache.put('get_item_version', 'a', b'123')
+        immutable_cache.put('get_item_version', 'b', b'1234567')
+        self.assertEqual(immutable_cache.get_stats()['evictions'], 0)
+        immutable_cache.invalidate('get_item_version', 'b')
+        immutable_cache.close()
+
+        # The size of what is already stored counts towards the cap of a new instance.
+        immutable_cache = ImmutableCache(path, max_bytes=10)
+        self.addCleanup(immutable_cache.close)
+        immutable_cache.put('get_item_version', 'c', b'12345678')
+        self.assertIsNone(immutable_cache.get('get_item_version', 'a'))
+        self.assertEqual(immutable_cache.get_stats()['evictions'], 1)
+        self.assertEqual(immutable_cache.get_stats()['bytes'], 8)
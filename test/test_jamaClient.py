@@ -3,7 +3,7 @@ import os
 import unittest
 from unittest import TestCase
 
-from py_jama_rest_client.client import JamaClient
+from py_jama_rest_client.client import DeadlineExceededException, JamaClient
 
 
 class TestJamaClient(TestCase):
@@ -22,6 +22,34 @@ class TestJamaClient(TestCase):
         self.assertIsNotNone(items)
         self.assertGreater(len(items), 0)
 
+    def test_get_items_concurrent(self):
+        project_id = 116
+        concurrent_client = JamaClient(self.jama_url, (self.jama_api_username, self.jama_api_password),
+                                       max_concurrency=4)
+        items = self.jama_client.get_items(project_id)
+        concurrent_items = concurrent_client.get_items(project_id)
+        self.assertEqual([item.get('id') for item in items], [item.get('id') for item in concurrent_items])
+
+    def test_iter_items(self):
+        project_id = 116
+        items = self.jama_client.get_items(project_id)
+        iterated_items = list(self.jama_client.iter_items(project_id))
+        self.assertEqual([item.get('id') for item in items], [item.get('id') for item in iterated_items])
+
+    def test_iter_items_streamed(self):
+        project_id = 116
+        streaming_client = JamaClient(self.jama_url, (self.jama_api_username, self.jama_api_password),
+                                      stream_pages=True)
+        items = self.jama_client.get_items(project_id)
+        streamed_items = list(streaming_client.iter_items(project_id))
+        self.assertEqual(items, streamed_items)
+
+    def test_get_items_deadline(self):
+        project_id = 116
+        with self.assertRaises(DeadlineExceededException) as context:
+            self.jama_client.get_items(project_id, deadline=0.001)
+        self.assertLess(context.exception.completed, len(self.jama_client.get_items(project_id)))
+
     def test_get_filter_results(self):
         filter_id = 151
         filter_id_with_cur_proj = 162
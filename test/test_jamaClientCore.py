@@ -1,6 +1,11 @@
 from unittest import TestCase
-from core import Core
+from core import Core, RetryPolicy
+from ratelimit import TokenBucket
+from token_store import FileTokenStore
 import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 
 class TestCore(TestCase):
@@ -26,6 +31,23 @@ class TestCore(TestCase):
     def test_put(self):
         self.fail()
 
+    def test_retry_stats(self):
+        retry_core = Core(TestCore.jama_url, (TestCore.jama_api_username, TestCore.jama_api_password),
+                          retry_policy=RetryPolicy(max_attempts=5))
+        response = retry_core.get('projects')
+        self.assertEqual(200, response.status_code)
+        stats = retry_core.get_retry_stats()
+        self.assertEqual(1, stats['requests'])
+        self.assertEqual(0, stats['exhausted'])
+
+    def test_rate_limiter(self):
+        limited_core = Core(TestCore.jama_url, (TestCore.jama_api_username, TestCore.jama_api_password),
+                            rate_limiter=TokenBucket(5, burst=1))
+        start = time.monotonic()
+        for _ in range(6):
+            self.assertEqual(200, limited_core.get('projects').status_code)
+        self.assertGreaterEqual(time.monotonic() - start, 1)
+
     def test_oauth(self):
         oauth_core = Core(TestCore.jama_url,
                           (os.environ['JAMA_CLIENT_ID'], os.environ['JAMA_CLIENT_SECRET']),
@@ -34,9 +56,24 @@ class TestCore(TestCase):
         self.assertEqual(200, response.status_code)
         self.assertEqual(True, len(response.json()['data']) > 0)
 
+    def test_oauth_shared_between_threads(self):
+        oauth_core = Core(TestCore.jama_url,
+                          (os.environ['JAMA_CLIENT_ID'], os.environ['JAMA_CLIENT_SECRET']),
+                          oauth=True, background_token_refresh=True)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(executor.map(lambda _: oauth_core.get('projects'), range(16)))
+        oauth_core.close()
+        self.assertEqual([200] * 16, [response.status_code for response in responses])
 
+    def test_oauth_token_store(self):
+        credentials = (os.environ['JAMA_CLIENT_ID'], os.environ['JAMA_CLIENT_SECRET'])
+        with tempfile.TemporaryDirectory() as directory:
+            token_store = FileTokenStore(os.path.join(directory, 'tokens.json'))
+            first_core = Core(TestCore.jama_url, credentials, oauth=True, token_store=token_store)
+            self.assertEqual(200, first_core.get('projects').status_code)
+            stored_token = token_store.load(TestCore.jama_url + '/rest/oauth/token|' + credentials[0])
+            self.assertIsNotNone(stored_token)
 
-
-
-
-
+            second_core = Core(TestCore.jama_url, credentials, oauth=True, token_store=token_store)
+            self.assertEqual(200, second_core.get('projects').status_code)
+            self.assertEqual(stored_token, token_store.load(TestCore.jama_url + '/rest/oauth/token|' + credentials[0]))
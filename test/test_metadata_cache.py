@@ -0,0 +1,89 @@
+import time
+from unittest import TestCase
+
+from py_jama_rest_client.client import JamaClient
+from py_jama_rest_client.metadata_cache import MetadataCache
+from py_jama_rest_client.transport import FakeTransport
+
+
+def page(data):
+    return {'meta': {'status': 'OK', 'pageInfo': {'startIndex': 0, 'resultCount': len(data),
+                                                  'totalResults': len(data)}},
+            'data': data}
+
+
+class TestMetadataCache(TestCase):
+
+    def setUp(self):
+        self.transport = FakeTransport()
+        self.transport.add('GET', '/rest/v1/itemtypes/', page([{'id': 24, 'typeKey': 'REQ'}]))
+        self.transport.add('GET', '/rest/v1/itemtypes/24', {'meta': {'status': 'OK'}, 'data': {'id': 24}})
+        self.transport.add('GET', '/rest/v1/users/', page([{'id': 18, 'username': 'user'}]))
+        self.transport.add('POST', '/rest/v1/users/', {'meta': {'status': 'Created', 'id': 19}}, status_code=201)
+
+    def client(self, metadata_cache, user='username', host='http://jama.example.com'):
+        return JamaClient(host, (user, 'password'), transport=self.transport, metadata_cache=metadata_cache)
+
+    def test_hits_and_invalidation(self):
+        metadata_cache = MetadataCache()
+        jama_client = self.client(metadata_cache)
+
+        item_types = jama_client.get_item_types()
+        item_types[0]['typeKey'] = 'changed'
+        self.assertEqual(jama_client.get_item_types(), [{'id': 24, 'typeKey': 'REQ'}])
+        self.assertEqual(jama_client.get_item_type(24), {'id': 24})
+        self.assertEqual(jama_client.get_item_type('24'), {'id': 24})
+        self.assertEqual(len(self.transport.requests), 2)
+
+        jama_client.get_users()
+        jama_client.post_user('new', 'password', 'New', 'User', 'new@example.com', 'NAMED')
+        jama_client.get_users()
+        self.assertEqual(len(self.transport.requests), 5)
+
+        metadata_cache.invalidate('get_item_type', 24)
+        jama_client.get_item_type(24)
+        self.assertEqual(len(self.transport.requests), 6)
+
+        stats = metadata_cache.get_stats()
+        self.assertEqual(stats['endpoints']['get_item_types'], {'hits': 1, 'misses': 1, 'expirations': 0,
+                                                                'evictions': 0})
+        self.assertEqual(stats['endpoints']['get_item_type']['hits'], 1)
+        self.assertEqual(stats['endpoints']['get_users']['misses'], 2)
+        self.assertEqual(stats['entries'], 3)
+
+    def test_results_not_shared(self):
+        metadata_cache = MetadataCache()
+        self.client(metadata_cache).get_item_type(24)
+        self.client(metadata_cache).get_item_type(24)
+        self.assertEqual(len(self.transport.requests), 1)
+
+        # Other users and servers get their own results.
+        self.client(metadata_cache, user='other').get_item_type(24)
+        self.client(metadata_cache, host='http://other.example.com').get_item_type(24)
+        self.assertEqual(len(self.transport.requests), 3)
+        self.assertEqual(metadata_cache.get_stats()['entries'], 3)
+
+        # Invalidating by id drops the results of every user.
+        metadata_cache.invalidate('get_item_type', 24)
+        self.assertEqual(metadata_cache.get_stats()['entries'], 0)
+
+    def test_ttl_and_limits(self):
+        metadata_cache = MetadataCache(ttls={'get_item_type': 0.05, 'get_users': 0})
+        jama_client = self.client(metadata_cache)
+        jama_client.get_item_type(24)
+        jama_client.get_users()
+        jama_client.get_users()
+        time.sleep(0.1)
+        jama_client.get_item_type(24)
+        self.assertEqual(len(self.transport.requests), 4)
+        self.assertEqual(metadata_cache.get_stats()['endpoints']['get_item_type']['expirations'], 1)
+
+        metadata_cache = MetadataCache(max_entries=2)
+        for key in ('1', '2', '3'):
+            metadata_cache.put('get_item_type', key, '{}')
+        self.assertIsNone(metadata_cache.get('get_item_type', '1'))
+        self.assertEqual(metadata_cache.get('get_item_type', '3'), '{}')
+        self.assertEqual(metadata_cache.get_stats()['endpoints']['get_item_type']['evictions'], 1)
+
+        with self.assertRaises(ValueError):
+            MetadataCache(ttls={'get_items': 60})
@@ -0,0 +1,44 @@
+from unittest import TestCase
+
+from py_jama_rest_client.client import JamaClient
+from py_jama_rest_client.core import RetryPolicy
+from py_jama_rest_client.metrics import MetricsRegistry, endpoint_template
+from py_jama_rest_client.transport import FakeTransport
+
+
+class TestMetrics(TestCase):
+
+    def test_endpoint_template(self):
+        self.assertEqual(endpoint_template('items/42/children'), 'items/{id}/children')
+        self.assertEqual(endpoint_template('abstractitems'), 'abstractitems')
+        self.assertEqual(endpoint_template(''), '/')
+
+    def test_registry(self):
+        calls = []
+
+        def handler(method, url, params, body):
+            calls.append(url)
+            # The first request for item 2 is throttled.
+            if url.endswith('/items/2') and len(calls) == 2:
+                return 429, b'', {'Retry-After': '0'}
+            return 200, {'meta': {'status': 'OK'}, 'data': {'id': 1}}, None
+
+        metrics = MetricsRegistry()
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'), metrics=metrics,
+                                 transport=FakeTransport(handler), retry_policy=RetryPolicy())
+        jama_client.get_item(1)
+        jama_client.get_item(2)
+        jama_client.put_item_lock(1, True)
+
+        snapshot = {(series['endpoint'], series['method']): series for series in metrics.snapshot()}
+        items = snapshot[('items/{id}', 'GET')]
+        self.assertEqual(items['requests'], 2)
+        self.assertEqual(items['by_status'], {200: 2})
+        self.assertEqual(items['retries'], 1)
+        self.assertGreater(items['response_bytes'], 0)
+        self.assertEqual(items['latency_buckets'][-1], (float('inf'), 2))
+        self.assertGreater(snapshot[('items/{id}/lock', 'PUT')]['request_bytes'], 0)
+
+        text = metrics.prometheus_text()
+        self.assertIn('jama_client_requests_total{endpoint="items/{id}",method="GET",status="200"} 2', text)
+        self.assertIn('jama_client_retries_total{endpoint="items/{id}",method="GET"} 1', text)
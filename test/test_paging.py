@@ -0,0 +1,62 @@
+import time
+from unittest import TestCase
+from urllib.parse import urlsplit
+
+from py_jama_rest_client.client import APIException, DeadlineExceededException, JamaClient
+from py_jama_rest_client.transport import FakeTransport
+
+
+def capped_items_handler(cap, total=45, start_offset=0):
+    """Serves total items from /rest/v1/items, never more than cap per page whatever maxResults asks for."""
+    def handler(method, url, params, body):
+        if method != 'GET' or urlsplit(url).path != '/rest/v1/items':
+            return None
+        start_at = params['startAt']
+        data = [{'id': i} for i in range(start_at, min(start_at + params['maxResults'], start_at + cap, total))]
+        page_info = {'startIndex': start_at + start_offset, 'resultCount': len(data), 'totalResults': total}
+        return 200, {'meta': {'status': 'OK', 'pageInfo': page_info}, 'data': data}, None
+    return handler
+
+
+class TestPaging(TestCase):
+
+    def client(self, handler, max_concurrency=1, stream_pages=False):
+        self.transport = FakeTransport(handler)
+        return JamaClient('http://jama.example.com', ('username', 'password'), transport=self.transport,
+                          max_concurrency=max_concurrency, stream_pages=stream_pages)
+
+    def test_short_pages(self):
+        for max_concurrency in (1, 4):
+            for stream_pages in (False, True):
+                jama_client = self.client(capped_items_handler(7), max_concurrency, stream_pages)
+                items = jama_client.get_items(1, allowed_results_per_page=20)
+                self.assertEqual([item['id'] for item in items], list(range(45)))
+                start_indexes = sorted(request['params']['startAt'] for request in self.transport.requests)
+                self.assertEqual(start_indexes, [0, 7, 14, 20, 27, 34, 40])
+
+    def test_full_pages(self):
+        jama_client = self.client(capped_items_handler(50), max_concurrency=4)
+        items = jama_client.get_items(1, allowed_results_per_page=20)
+        self.assertEqual([item['id'] for item in items], list(range(45)))
+        self.assertEqual(sorted(request['params']['startAt'] for request in self.transport.requests), [0, 20, 40])
+
+    def test_unexpected_start_index(self):
+        jama_client = self.client(capped_items_handler(50, start_offset=1))
+        with self.assertRaises(APIException):
+            jama_client.get_items(1, allowed_results_per_page=20)
+
+    def test_deadline_expires_while_paging(self):
+        serve = capped_items_handler(50)
+
+        def slow_handler(method, url, params, body):
+            time.sleep(0.1)
+            return serve(method, url, params, body)
+
+        for max_concurrency in (1, 3):
+            jama_client = self.client(slow_handler, max_concurrency)
+            with self.assertRaises(DeadlineExceededException) as raised:
+                jama_client.get_items(1, allowed_results_per_page=5, deadline=0.25)
+            self.assertEqual(raised.exception.total, 45)
+            self.assertGreater(raised.exception.completed, 0)
+            self.assertLess(raised.exception.completed, 45)
+            self.assertLess(len(self.transport.requests), 9)
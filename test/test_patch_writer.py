@@ -0,0 +1,105 @@
+import json
+import time
+from unittest import TestCase
+
+import requests
+
+from py_jama_rest_client.client import JamaClient
+from py_jama_rest_client.transport import FakeTransport
+
+
+def patch_handler(method, url, params, body):
+    if method == 'PATCH':
+        if url.endswith('/items/13'):
+            return 423, {'meta': {'status': 'Locked', 'message': 'Item is locked'}}, None
+        return 200, {'meta': {'status': 'OK'}}, None
+    return None
+
+
+def replace(field, value):
+    return {'op': 'replace', 'path': '/fields/' + field, 'value': value}
+
+
+class TestPatchWriter(TestCase):
+
+    def setUp(self):
+        self.transport = FakeTransport(patch_handler)
+        self.jama_client = JamaClient('http://jama.example.com', ('username', 'password'), transport=self.transport,
+                                      max_concurrency=4)
+
+    def patches_sent(self):
+        return {request['url'].rsplit('/', 1)[1]: json.loads(request['body']) for request in self.transport.requests}
+
+    def test_merges_operations(self):
+        with self.jama_client.patch_writer(max_delay=None) as writer:
+            writer.add(1, [replace('name', 'first')])
+            writer.add(2, [replace('name', 'other')])
+            writer.add(1, [{'op': 'add', 'path': '/fields/tags/-', 'value': 5}])
+            writer.add(1, [{'op': 'add', 'path': '/fields/tags/-', 'value': 6}, replace('name', 'second')])
+            writer.add(1, [replace('status', 292)])
+            self.assertEqual(self.transport.requests, [])
+
+        self.assertEqual(self.patches_sent(), {
+            '1': [{'op': 'add', 'path': '/fields/tags/-', 'value': 5},
+                  {'op': 'add', 'path': '/fields/tags/-', 'value': 6},
+                  replace('name', 'second'), replace('status', 292)],
+            '2': [replace('name', 'other')],
+        })
+        stats = writer.get_stats()
+        self.assertEqual((stats['operations'], stats['superseded'], stats['requests'], stats['pending']), (6, 1, 2, 0))
+        with self.assertRaises(ValueError):
+            writer.add(1, [replace('name', 'late')])
+
+        with self.jama_client.patch_writer(max_delay=None) as writer:
+            writer.add(3, [replace('name', 'a'), {'op': 'copy', 'from': '/fields/name', 'path': '/fields/title'},
+                           replace('name', 'b'), replace('name', 'c')])
+        self.assertEqual([operation.get('value') for operation in self.patches_sent()['3']], ['a', None, 'c'])
+
+    def test_keeps_array_element_operations(self):
+        remove_first = {'op': 'remove', 'path': '/fields/tags/0'}
+        insert_first = {'op': 'add', 'path': '/fields/tags/0', 'value': 5}
+        replace_first = {'op': 'replace', 'path': '/fields/tags/0', 'value': 6}
+        with self.jama_client.patch_writer(max_delay=None) as writer:
+            writer.add(1, [remove_first, remove_first])
+            writer.add(2, [insert_first, replace_first])
+            writer.add(3, [insert_first, remove_first])
+        self.assertEqual(self.patches_sent(), {'1': [remove_first, remove_first], '2': [insert_first, replace_first],
+                                               '3': [insert_first, remove_first]})
+        self.assertEqual(writer.get_stats()['superseded'], 0)
+
+    def test_flush_triggers_and_errors(self):
+        writer = self.jama_client.patch_writer(max_pending=3, max_delay=0.1)
+        writer.add(11, [replace('name', 'a')])
+        writer.add(12, [replace('name', 'b')])
+        writer.add(13, [replace('name', 'c')])
+        self.assertEqual(len(self.transport.requests), 3)
+        self.assertEqual(len(writer.get_errors()), 1)
+        self.assertEqual(writer.get_errors()[0]['item'][0], 13)
+
+        writer.add(14, [replace('name', 'd')])
+        deadline = time.monotonic() + 5
+        while len(self.transport.requests) < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(self.transport.requests), 4)
+        writer.close()
+        self.assertEqual(writer.get_stats()['flushes'], 2)
+
+    def test_transport_error(self):
+        def handler(method, url, params, body):
+            if method == 'PATCH' and url.endswith('/items/2'):
+                raise requests.exceptions.ConnectionError('Connection reset by peer')
+            return patch_handler(method, url, params, body)
+
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'),
+                                 transport=FakeTransport(handler), max_concurrency=4)
+        with jama_client.patch_writer(max_delay=None) as writer:
+            writer.add(1, [replace('name', 'a')])
+            writer.add(2, [replace('name', 'b')])
+            writer.add(3, [replace('name', 'c')])
+            errors = writer.flush()
+
+        self.assertEqual(writer.get_errors(), errors)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual((errors[0]['item'], errors[0]['status_code']), ((2, [replace('name', 'b')]), None))
+        self.assertIsInstance(errors[0]['exception'], requests.exceptions.ConnectionError)
+        self.assertEqual(writer.get_stats()['requests'], 3)
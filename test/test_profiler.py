@@ -0,0 +1,58 @@
+import json
+import threading
+from unittest import TestCase
+
+from py_jama_rest_client.client import JamaClient
+from py_jama_rest_client.transport import FakeTransport
+
+from .test_transport import items_handler
+
+
+class TestProfiler(TestCase):
+
+    def client(self):
+        fake = FakeTransport(items_handler)
+        fake.add('GET', '/rest/v1/items/7', {'meta': {'status': 'OK'}, 'data': {'id': 7}})
+        return JamaClient('http://jama.example.com', ('username', 'password'), transport=fake, max_concurrency=2)
+
+    def test_profile(self):
+        jama_client = self.client()
+
+        with jama_client.profile() as profiler:
+            jama_client.get_items(1)
+            items = list(jama_client.iter_items(1))
+            jama_client.get_item(7)
+
+        profile = profiler.to_dict()
+        self.assertEqual(len(items), 45)
+        self.assertEqual([child['name'] for child in profile['children']], ['get_items', 'iter_items', 'get_item'])
+        self.assertEqual([child['requests'] for child in profile['children']], [3, 3, 1])
+        self.assertEqual(profile['children'][0]['children'][0]['name'], 'GET items')
+        self.assertGreater(profile['bytes_received'], 0)
+        json.loads(profiler.to_json())
+        self.assertIn('profile;get_item;GET_items/{id} ', profiler.to_folded())
+
+        # Nothing is recorded once the block is left.
+        jama_client.get_item(7)
+        self.assertEqual(profiler.to_dict()['requests'], 7)
+
+    def test_other_threads_not_profiled(self):
+        jama_client = self.client()
+        with jama_client.profile() as profiler:
+            other = threading.Thread(target=jama_client.get_items, args=(1,))
+            other.start()
+            other.join()
+            jama_client.get_item(7)
+        self.assertEqual([child['name'] for child in profiler.to_dict()['children']], ['get_item'])
+        self.assertEqual(profiler.to_dict()['requests'], 1)
+
+    def test_nested_profiles(self):
+        jama_client = self.client()
+        with jama_client.profile() as outer:
+            jama_client.get_item(7)
+            with jama_client.profile() as inner:
+                jama_client.get_items(1)
+            jama_client.get_item(7)
+        self.assertEqual([child['name'] for child in outer.to_dict()['children']], ['get_item', 'get_item'])
+        self.assertEqual([child['name'] for child in inner.to_dict()['children']], ['get_items'])
+        self.assertEqual(inner.to_dict()['requests'], 3)
@@ -0,0 +1,68 @@
+import os
+import tempfile
+import threading
+import time
+from unittest import TestCase
+
+from py_jama_rest_client.ratelimit import FileTokenBucket, TokenBucket
+
+
+class TestTokenBucket(TestCase):
+
+    def acquire_all(self, bucket, count, threads=1):
+        """Takes count tokens from the bucket, spread over the given number of threads.  Returns the seconds taken."""
+        def take(n):
+            for _ in range(n):
+                bucket.acquire()
+
+        started = time.monotonic()
+        workers = [threading.Thread(target=take, args=(count // threads,)) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return time.monotonic() - started
+
+    def test_burst(self):
+        bucket = TokenBucket(rate=1, burst=5)
+        self.assertLess(self.acquire_all(bucket, 5), 0.5)
+
+    def test_pacing(self):
+        # The first 2 tokens are the burst, the other 10 come at 50 per second.
+        bucket = TokenBucket(rate=50, burst=2)
+        self.assertGreaterEqual(self.acquire_all(bucket, 12, threads=4), 0.18)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=1, burst=0.5)
+
+
+class TestFileTokenBucket(TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'bucket')
+
+    def test_pacing_shared_between_instances(self):
+        # Two instances on the same file share the one bucket, as two processes would.
+        buckets = [FileTokenBucket(self.path, rate=50, burst=2), FileTokenBucket(self.path, rate=50, burst=2)]
+        started = time.monotonic()
+        for index in range(12):
+            buckets[index % 2].acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 0.18)
+
+    def test_file_mode(self):
+        FileTokenBucket(self.path, rate=10).acquire()
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+
+    def test_unreadable_state_starts_full(self):
+        with open(self.path, 'w') as bucket_file:
+            bucket_file.write('garbage')
+        started = time.monotonic()
+        bucket = FileTokenBucket(self.path, rate=1, burst=3)
+        for _ in range(3):
+            bucket.acquire()
+        self.assertLess(time.monotonic() - started, 0.5)
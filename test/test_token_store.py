@@ -0,0 +1,41 @@
+import json
+import os
+import tempfile
+import time
+from unittest import TestCase
+
+from py_jama_rest_client.token_store import FileTokenStore
+
+
+class TestFileTokenStore(TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'tokens', 'tokens.json')
+        self.token = {'access_token': 'token', 'expires_in': 3600, 'acquired_at': int(time.time())}
+
+    def test_round_trip(self):
+        store = FileTokenStore(self.path)
+        self.assertIsNone(store.load('key'))
+        store.save('key', self.token)
+        store.save('other', dict(self.token, access_token='other-token'))
+        self.assertEqual(FileTokenStore(self.path).load('key'), self.token)
+        store.delete('key')
+        self.assertIsNone(store.load('key'))
+        self.assertEqual(store.load('other')['access_token'], 'other-token')
+
+    def test_file_modes(self):
+        FileTokenStore(self.path).save('key', self.token)
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+        self.assertEqual(os.stat(os.path.dirname(self.path)).st_mode & 0o777, 0o700)
+
+    def test_unreadable_file(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as token_file:
+            token_file.write('{not json')
+        store = FileTokenStore(self.path)
+        self.assertIsNone(store.load('key'))
+        store.save('key', self.token)
+        with open(self.path, 'r') as token_file:
+            self.assertEqual(json.load(token_file), {'key': self.token})
@@ -0,0 +1,83 @@
+import os
+import stat
+import tempfile
+from unittest import TestCase
+from urllib.parse import urlsplit
+
+from py_jama_rest_client.client import JamaClient, ResourceNotFoundException
+from py_jama_rest_client.transport import FakeTransport, RecordReplayTransport, RecordingNotFoundException, \
+    RequestsTransport
+
+
+def items_handler(method, url, params, body):
+    """Serves 45 items from /rest/v1/items, page by page."""
+    if method != 'GET' or urlsplit(url).path != '/rest/v1/items':
+        return None
+    start_at = params['startAt']
+    data = [{'id': i} for i in range(start_at, min(start_at + params['maxResults'], 45))]
+    page_info = {'startIndex': start_at, 'resultCount': len(data), 'totalResults': 45}
+    return 200, {'meta': {'status': 'OK', 'pageInfo': page_info}, 'data': data}, None
+
+
+class TestTransport(TestCase):
+
+    def test_fake_transport(self):
+        fake = FakeTransport(items_handler)
+        fake.add('GET', '/rest/v1/items/7', {'meta': {'status': 'OK'}, 'data': {'id': 7}})
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'), transport=fake)
+
+        items = jama_client.get_items(1)
+        self.assertEqual([item['id'] for item in items], list(range(45)))
+        self.assertEqual(len(fake.requests), 3)
+        self.assertEqual(jama_client.get_item(7)['id'], 7)
+        with self.assertRaises(ResourceNotFoundException):
+            jama_client.get_item(8)
+
+    def make_recordings_directory(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        return directory.name
+
+    def test_record_replay_transport(self):
+        recordings = self.make_recordings_directory()
+        recorder = RecordReplayTransport(recordings, mode='record', transport=FakeTransport(items_handler))
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'), transport=recorder)
+        items = jama_client.get_items(1)
+
+        replayer = RecordReplayTransport(recordings)
+        jama_client = JamaClient('http://jama.example.com', ('username', 'password'), transport=replayer,
+                                 max_concurrency=2)
+        self.assertEqual(jama_client.get_items(1), items)
+        with self.assertRaises(RecordingNotFoundException):
+            jama_client.get_items(2)
+
+    def test_recordings_hide_tokens(self):
+        recordings = self.make_recordings_directory()
+        fake = FakeTransport(items_handler)
+        fake.add('POST', '/rest/oauth/token', {'access_token': 'secret-token', 'expires_in': 3600})
+        recorder = RecordReplayTransport(recordings, mode='record', transport=fake)
+        jama_client = JamaClient('http://jama.example.com', ('client', 'secret'), oauth=True, transport=recorder)
+        items = jama_client.get_items(1)
+
+        for name in os.listdir(recordings):
+            file_path = os.path.join(recordings, name)
+            self.assertEqual(stat.S_IMODE(os.stat(file_path).st_mode), 0o600)
+            with open(file_path, 'r') as recording_file:
+                self.assertNotIn('secret-token', recording_file.read())
+
+        replayer = RecordReplayTransport(recordings)
+        jama_client = JamaClient('http://jama.example.com', ('client', 'secret'), oauth=True, transport=replayer)
+        self.assertEqual(jama_client.get_items(1), items)
+
+    def test_requests_transport_pool(self):
+        transport = RequestsTransport(pool_connections=3, pool_maxsize=25, pool_block=True, keep_alive=False)
+        self.addCleanup(transport.close)
+        for prefix in ('http://', 'https://'):
+            pool_manager = transport.session.get_adapter(prefix + 'jama.example.com').poolmanager
+            self.assertEqual(pool_manager.pools._maxsize, 3)
+            self.assertEqual(pool_manager.connection_pool_kw['maxsize'], 25)
+            self.assertTrue(pool_manager.connection_pool_kw['block'])
+        self.assertEqual(transport.session.headers['Connection'], 'close')
+        transport = RequestsTransport()
+        self.addCleanup(transport.close)
+        self.assertEqual(transport.session.headers['Connection'], 'keep-alive')